@@ -0,0 +1,434 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for SC Signature Scanner.
+
+Usage:
+    python benchmark.py results                 # Memory/allocations per retained scan result
+    python benchmark.py concurrency <folder>    # Concurrent scans must match sequential ones
+    python benchmark.py caches [--regolith f]   # Cold load time/memory: JSON vs compact caches
+    python benchmark.py overlay                 # Overlay show latency (needs a display)
+    python benchmark.py live [--xdisplay :99]   # Live grab change detection (e.g. under Xvfb)
+
+Author: Mallachi
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import paths
+
+
+# Signatures covering every match kind (asteroids, surface, ground, salvage)
+SAMPLE_SIGNATURES = [1700, 3400, 1900, 5700, 1820, 3640, 620, 1240, 360, 8000, 7400, 9500]
+
+
+def print_header(text: str):
+    """Print a formatted header."""
+    print()
+    print("=" * 60)
+    print(f"  {text}")
+    print("=" * 60)
+
+
+def measure_retained(build: Callable[[], object], count: int) -> Tuple[int, int, float]:
+    """Build and retain `count` objects, measuring memory and allocations.
+
+    Returns:
+        Tuple of (bytes_retained, blocks_retained, seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+
+    start = time.perf_counter()
+    retained: List[object] = [build() for _ in range(count)]
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, 'filename')
+    size = sum(s.size_diff for s in stats)
+    blocks = sum(s.count_diff for s in stats)
+    del retained
+    return size, blocks, elapsed
+
+
+def bench_results(count: int):
+    """Compare slotted scan results against the legacy nested-dict layout."""
+    from scanner import SignatureScanner
+    from results import ScanResult
+
+    scanner = SignatureScanner(paths.get_data_path() / "combat_analyst_db.json")
+
+    def make_result(sig: int) -> ScanResult:
+        return ScanResult(
+            signature=sig,
+            all_signatures=(sig,),
+            matches=tuple(scanner.match_signature(sig)),
+            method='fixed',
+            ocr_confidence=0.99,
+        )
+
+    print_header(f"Scan results ({count} retained per signature)")
+    print(f"  {'signature':>9}  {'layout':<8} {'bytes/result':>13} {'allocs/result':>14} {'us/result':>10}")
+
+    totals = {'slotted': [0, 0], 'dict': [0, 0]}
+    for sig in SAMPLE_SIGNATURES:
+        for layout, build in (
+            ('slotted', lambda: make_result(sig)),
+            ('dict', lambda: make_result(sig).as_dict()),
+        ):
+            size, blocks, elapsed = measure_retained(build, count)
+            totals[layout][0] += size
+            totals[layout][1] += blocks
+            print(f"  {sig:>9}  {layout:<8} {size / count:>13.0f} {blocks / count:>14.1f} "
+                  f"{elapsed / count * 1e6:>10.1f}")
+
+    n = count * len(SAMPLE_SIGNATURES)
+    print()
+    for layout, (size, blocks) in totals.items():
+        print(f"  {layout:<8} avg {size / n:>8.0f} bytes  {blocks / n:>6.1f} allocs per result")
+
+
+def bench_concurrency(folder: Path, threads: int, rounds: int) -> bool:
+    """Scan the same screenshots sequentially and from a thread pool.
+
+    One SignatureScanner instance serves every thread. Returns True if all
+    concurrent results are identical to the sequential baseline.
+    """
+    from scanner import SignatureScanner
+
+    images = sorted(p for p in folder.iterdir() if p.suffix.lower() in ('.png', '.jpg', '.jpeg'))
+    if not images:
+        print(f"No screenshots found in {folder}")
+        return False
+
+    scanner = SignatureScanner(paths.get_data_path() / "combat_analyst_db.json")
+
+    def scan(path: Path) -> dict:
+        result = scanner.scan_image(path).as_dict()
+        result.pop('debug', None)
+        return result
+
+    print_header(f"Concurrency ({len(images)} images, {threads} threads, {rounds} rounds)")
+
+    # Warm up (reader initialization) before timing
+    scan(images[0])
+
+    start = time.perf_counter()
+    baseline = [scan(p) for p in images]
+    sequential = time.perf_counter() - start
+    print(f"  Sequential: {sequential:.2f}s ({sequential / len(images) * 1000:.0f} ms/image)")
+
+    work = images * rounds
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        start = time.perf_counter()
+        results = list(pool.map(scan, work))
+        concurrent = time.perf_counter() - start
+    print(f"  Concurrent: {concurrent:.2f}s ({concurrent / len(work) * 1000:.0f} ms/image)")
+
+    mismatches = 0
+    for i, result in enumerate(results):
+        expected = baseline[i % len(images)]
+        if result != expected:
+            mismatches += 1
+            print(f"  MISMATCH {work[i].name}: {result} != {expected}")
+
+    print(f"  {len(results) - mismatches}/{len(results)} results identical")
+    return mismatches == 0
+
+
+def _synthetic_regolith_cache() -> Dict[str, Any]:
+    """Regolith cache shaped like the real one (3 systems, full lookups, bonus map)."""
+    rng = random.Random(42)
+    ores = [f"ORE{i:02d}" for i in range(24)]
+    stat = lambda: {k: round(rng.random(), 4) for k in ('min', 'max', 'med', 'avg', 'stdDev')}
+    rocks = {
+        system: {
+            f"ROCK{r:02d}": {
+                'mass': stat(), 'inst': stat(), 'res': stat(),
+                'scans': rng.randint(10, 5000), 'users': rng.randint(1, 300),
+                'ores': {ore: {'prob': rng.random(), 'medPct': rng.random(), **stat()}
+                         for ore in rng.sample(ores, 12)},
+            }
+            for r in range(16)
+        }
+        for system in ('STANTON', 'PYRO', 'NYX')
+    }
+    locations = [f"LOC{i:03d}" for i in range(400)]
+    return {
+        'last_updated': '2026-01-01T00:00:00Z',
+        'epoch': '4.4',
+        'lookups': {
+            'CIG': {
+                'densitiesLookups': {ore: rng.random() * 700 for ore in ores},
+                'methodsBonusLookup': {f"METHOD{m}": {ore: rng.random() for ore in ores} for m in range(12)},
+                'oreProcessingLookup': {ore: [rng.random() for _ in range(8)] for ore in ores},
+            },
+            'UEX': {
+                'maxPrices': {ore: rng.random() * 30000 for ore in ores},
+                'refineryBonuses': {loc: {ore: rng.random() for ore in ores} for loc in locations[:40]},
+            },
+        },
+        'rock_compositions': rocks,
+        'location_bonuses': {loc: {ore: rng.random() for ore in ores} for loc in locations},
+        'datasets': {},
+    }
+
+
+def _synthetic_uex_cache() -> Dict[str, Any]:
+    """Legacy uex_prices.json content: ore prices plus every commodity record."""
+    rng = random.Random(7)
+    commodities = {
+        str(i): {
+            'id': i, 'name': f"Commodity {i}", 'code': f"C{i}", 'kind': 'Metal',
+            'price_buy': rng.random() * 1000, 'price_sell': rng.random() * 1000,
+            **{f"field_{k}": rng.random() for k in range(30)},
+        }
+        for i in range(220)
+    }
+    return {
+        'timestamp': time.time(),
+        'ore_prices': {f"ORE{i:02d}": rng.random() * 30000 for i in range(40)},
+        'commodities': commodities,
+        'refinery_yield': 0.5293,
+    }
+
+
+def _measure_load(load: Callable[[], object], repeat: int = 5) -> Tuple[float, int]:
+    """Returns (best load time in ms, bytes retained by the loaded object)."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = load()
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(s.size_diff for s in after.compare_to(before, 'filename'))
+    del kept
+    return min(times) * 1000, size
+
+
+def bench_caches(regolith_source: Optional[Path]):
+    """Compare legacy JSON caches against the compact projected format."""
+    import cache_format
+    import regolith_api
+
+    if regolith_source:
+        with open(regolith_source, 'r', encoding='utf-8') as f:
+            regolith = json.load(f)
+    else:
+        regolith = _synthetic_regolith_cache()
+    uex = _synthetic_uex_cache()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        # --- Regolith cache ---
+        legacy = tmp / "regolith_cache.json"
+        with open(legacy, 'w', encoding='utf-8') as f:
+            json.dump(regolith, f, indent=2)
+        compact = tmp / "regolith_cache.bin"
+        header = {k: regolith[k] for k in regolith_api.HEADER_KEYS if k in regolith}
+        cache_format.write(compact, header,
+                           {k: v for k, v in regolith.items() if k not in regolith_api.HEADER_KEYS})
+
+        def legacy_load():
+            with open(legacy, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        print_header("Regolith cache" + (f" ({regolith_source.name})" if regolith_source else " (synthetic)"))
+        print(f"  {'format':<26} {'size KB':>9} {'load ms':>9} {'memory KB':>10} {'freshness ms':>13}")
+        rows = [
+            ("JSON (full parse)", legacy, legacy_load, legacy_load),
+            ("compact (projection)", compact,
+             lambda: cache_format.read(compact, regolith_api.PROJECTED_SECTIONS),
+             lambda: cache_format.read_header(compact)),
+        ]
+        for name, path, load, fresh in rows:
+            load_ms, memory = _measure_load(load)
+            fresh_ms, _ = _measure_load(fresh)
+            print(f"  {name:<26} {path.stat().st_size / 1024:>9.1f} {load_ms:>9.2f} "
+                  f"{memory / 1024:>10.1f} {fresh_ms:>13.3f}")
+
+        # --- UEX price cache ---
+        legacy = tmp / "uex_prices.json"
+        with open(legacy, 'w', encoding='utf-8') as f:
+            json.dump(uex, f, indent=2)
+        compact = tmp / "uex_prices.bin"
+        cache_format.write(compact, {'timestamp': uex['timestamp'], 'refinery_yield': uex['refinery_yield']},
+                           {'ore_prices': uex['ore_prices']})
+
+        def legacy_uex():
+            with open(legacy, 'r', encoding='utf-8') as f:
+                return json.load(f)
+
+        print_header("UEX price cache (synthetic)")
+        print(f"  {'format':<26} {'size KB':>9} {'load ms':>9} {'memory KB':>10}")
+        for name, path, load in (
+            ("JSON (with commodities)", legacy, legacy_uex),
+            ("compact (ore prices)", compact, lambda: cache_format.read(compact, ['ore_prices'])),
+        ):
+            load_ms, memory = _measure_load(load)
+            print(f"  {name:<26} {path.stat().st_size / 1024:>9.1f} {load_ms:>9.2f} {memory / 1024:>10.1f}")
+
+
+def bench_overlay(rounds: int):
+    """Time OverlayPopup.show() for real match results (first vs repeated shows)."""
+    import statistics
+    import tkinter as tk
+    from overlay import OverlayPopup
+    from scanner import SignatureScanner
+
+    scanner = SignatureScanner(paths.get_data_path() / "combat_analyst_db.json")
+    results = [(sig, scanner.match_signature(sig)) for sig in SAMPLE_SIGNATURES]
+
+    root = tk.Tk()
+    root.withdraw()
+    overlay = OverlayPopup(root, duration=1)
+
+    print_header(f"Overlay show latency ({len(results)} results x {rounds} rounds)")
+    first = [overlay.show(sig, matches) for sig, matches in results]
+    times = []
+    for _ in range(rounds):
+        for sig, matches in results:
+            times.append(overlay.show(sig, matches))
+            root.update()
+    overlay.destroy()
+    root.destroy()
+
+    times.sort()
+    print(f"  First show:  {first[0]:.2f} ms (builds the window's row pool)")
+    print(f"  Median:      {statistics.median(times):.2f} ms")
+    print(f"  p95:         {times[int(len(times) * 0.95) - 1]:.2f} ms")
+    print(f"  Max:         {times[-1]:.2f} ms")
+
+
+def bench_live(xdisplay: Optional[str], seconds: float) -> bool:
+    """Check live scanning against real screen grabs (e.g. Xvfb :99).
+
+    A solid window covers the grabbed region. While it stays the same only
+    the first frame may be scanned; after its colour changes exactly one
+    more scan must follow.
+    """
+    import tkinter as tk
+    from frame_sources import ChangeDetector, LiveScanner, ScreenRegionSource
+    from results import ScanResult
+
+    class CountingScanner:
+        """Stands in for SignatureScanner - only the scan decisions are checked."""
+
+        def __init__(self):
+            self.scans = 0
+
+        def scan_buffer(self, image, pre_cropped=False):
+            self.scans += 1
+            return ScanResult(signature=self.scans)  # New "signature" per scan
+
+    region = (0, 0, 240, 80)
+    root = tk.Tk(screenName=xdisplay)
+    root.overrideredirect(True)
+    root.geometry(f"{region[2]}x{region[3]}+{region[0]}+{region[1]}")
+    root.configure(bg="#0d1117")
+
+    def pump(duration: float):
+        end = time.monotonic() + duration
+        while time.monotonic() < end:
+            root.update()
+            time.sleep(0.01)
+
+    pump(0.5)  # Let the window map before grabbing
+
+    scanner = CountingScanner()
+    errors: List[str] = []
+    source = ScreenRegionSource(region=region, fps=10, xdisplay=xdisplay)
+    live = LiveScanner(
+        scanner, source,
+        on_result=lambda label, result: None,
+        on_error=lambda message, stopped: errors.append(message),
+        detector=ChangeDetector(max_skip=3600)  # No forced rescans during the check
+    )
+
+    print_header(f"Live scanning on {xdisplay or 'the default display'} ({seconds:g}s per phase)")
+    live.start()
+    try:
+        pump(seconds)
+        steady = scanner.scans
+        root.configure(bg="#f0883e")
+        pump(seconds)
+        changed = scanner.scans
+    finally:
+        live.stop()
+        root.destroy()
+
+    print(f"  Steady region:  {steady} scan(s) (expected 1)")
+    print(f"  After change:   {changed - steady} more scan(s) (expected 1)")
+    print(f"  {live.format_stats()}")
+    for message in errors:
+        print(f"  Error: {message}")
+
+    ok = steady == 1 and changed == 2 and live.frames > changed and not errors
+    print(f"  {'PASS' if ok else 'FAIL'}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SC Signature Scanner benchmarks")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p_results = sub.add_parser('results', help='memory per retained scan result')
+    p_results.add_argument('--count', type=int, default=200)
+
+    p_conc = sub.add_parser('concurrency', help='stress-test concurrent scans')
+    p_conc.add_argument('folder', type=Path, help='folder of test screenshots')
+    p_conc.add_argument('--threads', type=int, default=4)
+    p_conc.add_argument('--rounds', type=int, default=3)
+
+    p_caches = sub.add_parser('caches', help='cold load time/memory of cache formats')
+    p_caches.add_argument('--regolith', type=Path, default=None,
+                          help='existing regolith_cache.json to use instead of synthetic data')
+
+    p_overlay = sub.add_parser('overlay', help='overlay show latency')
+    p_overlay.add_argument('--rounds', type=int, default=20)
+
+    p_live = sub.add_parser('live', help='live grab change detection (needs a display, e.g. Xvfb)')
+    p_live.add_argument('--xdisplay', default=None, help='X display to grab from, e.g. :99')
+    p_live.add_argument('--seconds', type=float, default=1.5, help='duration of each phase')
+
+    args = parser.parse_args()
+
+    if args.command == 'results':
+        bench_results(args.count)
+    elif args.command == 'caches':
+        bench_caches(args.regolith)
+    elif args.command == 'overlay':
+        bench_overlay(args.rounds)
+    elif args.command == 'live':
+        if not bench_live(args.xdisplay, args.seconds):
+            return 1
+    elif args.command == 'concurrency':
+        if not bench_concurrency(args.folder, args.threads, args.rounds):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -76,14 +76,30 @@ def main():
         "scanner.py",
         "overlay.py",
         "splash.py",
+        "startup.py",
+        "tasks.py",
+        "ui_bus.py",
         "monitor.py",
+        "cache_format.py",
         "config.py",
+        "debug_writer.py",
+        "http_client.py",
         "theme.py",
         "paths.py",
+        "pipeline.py",
         "pricing.py",
         "version_checker.py",
         "region_selector.py",
+        "hud_locator.py",
+        "region_tuner.py",
+        "frame_scan.py",
+        "ingest_server.py",
+        "frame_sources.py",
+        "video_analysis.py",
+        "png_stream.py",
+        "settings.py",
         "regolith_api.py",
+        "results.py",
         "requirements.txt",
         "SC_Signature_Scanner.spec",
     ]
@@ -203,8 +219,11 @@ def main():
     print()
     print("Runtime files (created on first use):")
     print("  - config.json              (user settings + API key)")
-    print("  - scan_region.json         (scan region config)")
-    print("  - regolith_cache.json      (Regolith.rocks cache)")
+    print("  - scan_region.json         (scan region profiles)")
+    print("  - hud_anchor.png           (optional HUD anchor template)")
+    print("  - regolith_cache.bin       (Regolith.rocks cache)")
+    print("  - regolith_budget.json     (Regolith daily request budget)")
+    print("  - logs/                    (rotating application log)")
     print("  - SignatureScannerBugreport/  (debug output)")
     print()
     print("Distribution:")
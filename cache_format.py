@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Compact cache file format for SC Signature Scanner.
+
+Layout:
+    magic "SCSC" | format version (1 byte) | header length (4 bytes, big-endian)
+    header: compact JSON (freshness fields + section index)
+    body:   one zlib-compressed JSON blob per section
+
+Freshness checks read only the header. Loading decompresses only the
+sections asked for, so callers keep just the projection they use in memory.
+Writes go to a temporary file and are swapped in atomically.
+"""
+
+import json
+import os
+import struct
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+
+MAGIC = b"SCSC"
+FORMAT_VERSION = 1
+COMPRESS_LEVEL = 6
+
+_PREFIX = struct.Struct(">4sBI")  # magic, format version, header length
+_SECTIONS_KEY = "_sections"  # Header key holding {name: [offset, length]}
+
+
+class CacheFormatError(Exception):
+    """Raised for files that are not valid compact caches."""
+    pass
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def write(path: Path, header: Dict[str, Any], sections: Dict[str, Any]):
+    """Write a cache file.
+
+    Args:
+        path: Destination file
+        header: Small JSON-serializable dict (freshness metadata)
+        sections: Section name -> JSON-serializable value
+    """
+    path = Path(path)
+    index: Dict[str, list] = {}
+    blobs = []
+    offset = 0
+    for name, value in sections.items():
+        blob = zlib.compress(_dumps(value), COMPRESS_LEVEL)
+        index[name] = [offset, len(blob)]
+        blobs.append(blob)
+        offset += len(blob)
+
+    head = _dumps({**header, _SECTIONS_KEY: index})
+
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(head)))
+        f.write(head)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+
+
+def _read_head(f) -> Tuple[Dict[str, Any], int]:
+    """Read the header from an open file. Returns (header, body offset)."""
+    prefix = f.read(_PREFIX.size)
+    if len(prefix) != _PREFIX.size:
+        raise CacheFormatError("Truncated cache file")
+    magic, version, length = _PREFIX.unpack(prefix)
+    if magic != MAGIC or version != FORMAT_VERSION:
+        raise CacheFormatError("Not a compact cache file")
+    try:
+        header = json.loads(f.read(length))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise CacheFormatError(f"Invalid cache header: {e}")
+    return header, _PREFIX.size + length
+
+
+def read_header(path: Path) -> Dict[str, Any]:
+    """Read only the header of a cache file.
+
+    Raises:
+        CacheFormatError: File is not a valid cache
+        OSError: File could not be read
+    """
+    with open(path, 'rb') as f:
+        header, _ = _read_head(f)
+    header.pop(_SECTIONS_KEY, None)
+    return header
+
+
+def read(path: Path, sections: Optional[Iterable[str]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Read the header and selected sections of a cache file.
+
+    Args:
+        path: Cache file
+        sections: Section names to load (None = all). Missing names are skipped.
+
+    Returns:
+        Tuple of (header, {section name: value})
+
+    Raises:
+        CacheFormatError: File is not a valid cache
+        OSError: File could not be read
+    """
+    with open(path, 'rb') as f:
+        header, body_start = _read_head(f)
+        index = header.pop(_SECTIONS_KEY, {})
+        names = index.keys() if sections is None else [n for n in sections if n in index]
+
+        loaded: Dict[str, Any] = {}
+        for name in names:
+            offset, length = index[name]
+            f.seek(body_start + offset)
+            try:
+                loaded[name] = json.loads(zlib.decompress(f.read(length)))
+            except (zlib.error, json.JSONDecodeError, UnicodeDecodeError) as e:
+                raise CacheFormatError(f"Corrupt cache section '{name}': {e}")
+    return header, loaded
@@ -18,10 +18,11 @@ def clean(include_ocr_models: bool = False):
     Cleans:
     - __pycache__ directories and .pyc/.pyo files
     - Debug output folders (SignatureScannerBugreport, debug_output)
+    - Application logs (logs/)
     - scan_region.json (user-defined scan region)
     - config.json (settings + Regolith API key)
-    - regolith_cache.json (cached Regolith.rocks data)
-    - Data cache files (rock_types.json, uex_prices.json)
+    - regolith_cache.bin (cached Regolith.rocks data)
+    - Data cache files (rock_types.json, uex_prices.bin)
     - Deprecated config files (hud_config.json, identifier_config.json)
     - Deprecated source files (hud_calibration.py, identifier_window.py, etc.)
     - EasyOCR model cache (optional, ~115MB)
@@ -96,6 +97,14 @@ def clean(include_ocr_models: bool = False):
                 print(f"  Cleared: {custom_path} ({file_count} items)")
                 removed += 1
     
+    # Remove application logs
+    log_dir = root / "logs"
+    if log_dir.exists():
+        file_count = sum(1 for _ in log_dir.iterdir())
+        shutil.rmtree(log_dir)
+        print(f"  Removed: logs/ ({file_count} files)")
+        removed += 1
+    
     # ===== Build Artifacts =====
     print("\n[Build Artifacts]")
 
@@ -112,8 +121,11 @@ def clean(include_ocr_models: bool = False):
 
     config_files = [
         ("scan_region.json", "Scan region config"),
+        ("hud_anchor.png", "HUD anchor template"),
         ("config.json", "Settings + API key"),
-        ("regolith_cache.json", "Regolith.rocks cache"),
+        ("regolith_cache.json", "Regolith.rocks cache (old format)"),
+        ("regolith_cache.bin", "Regolith.rocks cache"),
+        ("regolith_budget.json", "Regolith daily request budget"),
     ]
     
     for filename, description in config_files:
@@ -129,7 +141,8 @@ def clean(include_ocr_models: bool = False):
     data_dir = root / "data"
     cache_files = [
         ("rock_types.json", "Regolith rock composition cache"),
-        ("uex_prices.json", "UEX pricing cache"),
+        ("uex_prices.json", "UEX pricing cache (old format)"),
+        ("uex_prices.bin", "UEX pricing cache"),
     ]
     
     for filename, description in cache_files:
@@ -226,7 +239,7 @@ def main():
         print("  - Debug output folders")
         print("  - Build artifacts (build/ folder)")
         print("  - User config files (scan_region.json, config.json)")
-        print("  - Data cache files (rock_types.json, uex_prices.json)")
+        print("  - Data cache files (rock_types.json, uex_prices.bin)")
         print("  - Deprecated source and config files")
         print("  - EasyOCR models (optional, with --ocr flag)")
         return
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """
 Configuration management for SC Signature Scanner.
+
+Settings are held in memory (see settings.py): reads do not touch the
+file, and saves are written behind, debounced and atomic.
 """
 
-import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from settings import SettingsFile
+
 
 class Config:
     """Handles loading and saving configuration."""
@@ -15,36 +19,29 @@ class Config:
         if config_path is None:
             config_path = Path(__file__).parent / "config.json"
         self.config_path = config_path
+        self._file = SettingsFile(config_path)
     
     def load(self) -> Optional[Dict[str, Any]]:
-        """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading config: {e}")
-        return None
+        """Load configuration (a copy - change it and pass it to save())."""
+        return self._file.load()
     
     def save(self, config: Dict[str, Any]) -> bool:
-        """Save configuration to file."""
+        """Save configuration (written to disk shortly after)."""
+        self._file.save(config)
+        return True
+    
+    def flush(self):
+        """Write pending changes to disk now."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
-            return True
-        except Exception as e:
+            self._file.flush()
+        except OSError as e:
             print(f"Error saving config: {e}")
-            return False
     
     def get(self, key: str, default: Any = None) -> Any:
         """Get a single config value."""
-        cfg = self.load()
-        if cfg:
-            return cfg.get(key, default)
-        return default
+        return self._file.get(key, default)
     
     def set(self, key: str, value: Any) -> bool:
         """Set a single config value."""
-        cfg = self.load() or {}
-        cfg[key] = value
-        return self.save(cfg)
+        self._file.set(key, value)
+        return True
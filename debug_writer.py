@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Background debug artifact writer for SC Signature Scanner.
+
+Debug mode used to encode PNGs synchronously inside the scan, which made
+the scan itself slower than it is with debug off. Artifacts are now handed
+to a writer thread through a bounded queue:
+
+- Each scan writes into its own folder (millisecond timestamp + sequence
+  number, so rapid screenshots never collide)
+- The original screenshot is hard-linked (or copied) instead of re-encoded
+- PNGs use fast compression
+- Oldest scan folders are evicted once the debug folder exceeds its quota
+- If the queue is full, artifacts are dropped rather than stalling a scan
+"""
+
+import itertools
+import os
+import queue
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from PIL import Image, ImageDraw
+import numpy as np
+
+
+# Defaults
+MAX_QUEUE_SIZE = 64
+DEFAULT_QUOTA_BYTES = 250 * 1024 * 1024  # 250 MB
+PNG_COMPRESS_LEVEL = 1  # Fastest zlib level - debug images are throwaway
+SCAN_DIR_PREFIX = "scan_"
+
+
+class DebugArtifactWriter:
+    """Writes debug artifacts off the scan thread, capped by a disk quota."""
+
+    def __init__(self, quota_bytes: int = DEFAULT_QUOTA_BYTES, max_queue: int = MAX_QUEUE_SIZE):
+        """
+        Args:
+            quota_bytes: Maximum total size of scan folders in a debug dir
+            max_queue: Maximum pending artifacts before new ones are dropped
+        """
+        self.quota_bytes = quota_bytes
+        self.dropped = 0
+
+        self._queue: "queue.Queue[Optional[Tuple[Callable[[], Path], Path]]]" = queue.Queue(maxsize=max_queue)
+        self._seq = itertools.count()
+        self._usage: Dict[Path, Dict[Path, int]] = {}  # debug_dir -> {scan_dir: bytes}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    # === Producer side (scan thread) ===
+
+    def new_scan_dir(self, debug_dir: Path) -> Path:
+        """Reserve a unique folder for one scan's artifacts.
+
+        The folder is created lazily by the writer thread.
+        """
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:-3]
+        return Path(debug_dir) / f"{SCAN_DIR_PREFIX}{stamp}_{next(self._seq):04d}"
+
+    def link_original(self, scan_dir: Path, source: Path, name: str = "00_original") -> Optional[str]:
+        """Queue a hard link (or copy) of the source screenshot."""
+        dest = scan_dir / f"{name}{Path(source).suffix.lower()}"
+
+        def write() -> Path:
+            try:
+                os.link(source, dest)
+            except OSError:
+                # Different volume or filesystem without hard links
+                shutil.copyfile(source, dest)
+            return dest
+
+        return self._submit(write, dest)
+
+    def save_image(self, scan_dir: Path, filename: str, image) -> Optional[str]:
+        """Queue a PNG write. Accepts a PIL image or a numpy array.
+
+        The caller must not modify the image afterwards.
+        """
+        dest = scan_dir / filename
+
+        def write() -> Path:
+            img = Image.fromarray(image) if isinstance(image, np.ndarray) else image
+            img.save(dest, compress_level=PNG_COMPRESS_LEVEL)
+            return dest
+
+        return self._submit(write, dest)
+
+    def save_annotated(self, scan_dir: Path, filename: str, image: Image.Image,
+                       box: Tuple[int, int, int, int], color: str = '#00FF00') -> Optional[str]:
+        """Queue a copy of the image with a rectangle drawn on it."""
+        dest = scan_dir / filename
+
+        def write() -> Path:
+            annotated = image.copy()
+            ImageDraw.Draw(annotated).rectangle(list(box), outline=color, width=3)
+            annotated.save(dest, compress_level=PNG_COMPRESS_LEVEL)
+            return dest
+
+        return self._submit(write, dest)
+
+    def save_text(self, scan_dir: Path, filename: str, text: str) -> Optional[str]:
+        """Queue a text file write."""
+        dest = scan_dir / filename
+
+        def write() -> Path:
+            dest.write_text(text, encoding='utf-8')
+            return dest
+
+        return self._submit(write, dest)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until all queued artifacts are written.
+
+        Returns:
+            True if the queue drained, False on timeout
+        """
+        if timeout is None:
+            self._queue.join()
+            return True
+
+        done = threading.Event()
+
+        def wait():
+            self._queue.join()
+            done.set()
+
+        threading.Thread(target=wait, daemon=True).start()
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 2.0):
+        """Write pending artifacts and stop the writer thread."""
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._queue.put(None)
+        thread.join(timeout)
+
+    def _submit(self, write: Callable[[], Path], dest: Path) -> Optional[str]:
+        """Queue a write job. Returns the artifact's relative name, or None if dropped."""
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((write, dest))
+        except queue.Full:
+            with self._lock:  # Several scan threads may drop at once
+                self.dropped += 1
+            return None
+        return f"{dest.parent.name}/{dest.name}"
+
+    # === Consumer side (writer thread) ===
+
+    def _ensure_thread(self):
+        """Start the writer thread on first use."""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="DebugArtifactWriter", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        """Writer loop."""
+        while True:
+            job = self._queue.get()
+            try:
+                if job is None:
+                    return
+                write, dest = job
+                try:
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    # Measure leftovers before writing, so the new file is only counted once
+                    self._usage_for(dest.parent.parent)
+                    written = write()
+                    self._account(written)
+                except Exception as e:
+                    print(f"[DEBUG] Failed to write {dest.name}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _account(self, written: Path):
+        """Track disk usage of the written artifact and enforce the quota."""
+        scan_dir = written.parent
+        usage = self._usage_for(scan_dir.parent)
+
+        try:
+            size = written.stat().st_size
+        except OSError:
+            size = 0
+        usage[scan_dir] = usage.get(scan_dir, 0) + size
+
+        self._evict(usage, keep=scan_dir)
+
+    def _usage_for(self, debug_dir: Path) -> Dict[Path, int]:
+        """Usage per scan folder, measured from disk on first use."""
+        usage = self._usage.get(debug_dir)
+        if usage is None:
+            usage = self._usage[debug_dir] = self._scan_existing(debug_dir)
+        return usage
+
+    def _scan_existing(self, debug_dir: Path) -> Dict[Path, int]:
+        """Measure scan folders left over from previous sessions."""
+        usage: Dict[Path, int] = {}
+        try:
+            for entry in debug_dir.iterdir():
+                if entry.is_dir() and entry.name.startswith(SCAN_DIR_PREFIX):
+                    usage[entry] = sum(
+                        f.stat().st_size for f in entry.iterdir() if f.is_file()
+                    )
+        except OSError:
+            pass
+        return usage
+
+    def _evict(self, usage: Dict[Path, int], keep: Path):
+        """Delete oldest scan folders until usage is under quota."""
+        total = sum(usage.values())
+        if total <= self.quota_bytes:
+            return
+
+        # Folder names start with a sortable timestamp
+        for scan_dir in sorted(usage, key=lambda p: p.name):
+            if total <= self.quota_bytes:
+                break
+            if scan_dir == keep:
+                continue
+            shutil.rmtree(scan_dir, ignore_errors=True)
+            total -= usage.pop(scan_dir)
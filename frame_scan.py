@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Full-frame multi-target scanning for SC Signature Scanner.
+
+The normal scan reads one configured region and keeps the largest
+signature. A radar screen in a crowded belt shows many signature labels
+at once; full-frame mode finds all of them:
+
+1. Text detection runs once over a downscaled copy of the screenshot.
+2. Candidate boxes are filtered by aspect ratio and HUD text colour.
+3. All candidates are recognized in one batched call on the full
+   resolution image, and every label becomes a target with its position.
+
+Detection dominates the cost. DetectionGrid remembers the previous frame's
+boxes per grid cell and only runs detection again over the cells that
+changed, so consecutive screenshots of a mostly static HUD stay fast.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+
+Box = Tuple[int, int, int, int]  # (x1, y1, x2, y2)
+
+
+DETECT_WIDTH = 1280  # Screenshots are downscaled to this width for detection
+
+# Detection grid
+GRID_ROWS = 6
+GRID_COLS = 8
+CELL_SAMPLES = 8  # Fingerprint samples per cell side (each averages a small patch)
+CELL_CHANGE_THRESHOLD = 12  # Largest sample change (0-255) that still counts as unchanged
+FULL_DETECT_FRACTION = 0.5  # Re-detect the whole frame if this many cells changed
+
+# Candidate filter (box sizes in detection pixels)
+MIN_ASPECT = 1.2  # Signature labels are a row of 3-6 digits
+MAX_ASPECT = 12.0
+MIN_BOX_HEIGHT = 6
+MAX_BOX_HEIGHT_FRACTION = 0.06  # Of the frame height - larger text is not a label
+HUD_HUE_RANGE = (75, 105)  # OpenCV hue (0-180) of the cyan/teal HUD text
+HUD_MAX_WHITE_SATURATION = 60  # Near-white text also counts as HUD
+MIN_HUD_FRACTION = 0.5  # Share of bright pixels that must have the HUD colour
+
+LABEL_PADDING = 3  # Pixels added around each box before recognition
+
+
+class DetectionGrid:
+    """Caches text detection boxes per grid cell between frames."""
+
+    def __init__(self, rows: int = GRID_ROWS, cols: int = GRID_COLS):
+        self.rows = rows
+        self.cols = cols
+        self._fingerprint: Optional[np.ndarray] = None
+        self._size: Optional[Tuple[int, int]] = None
+        self._boxes: List[Box] = []
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {'full': 0, 'partial': 0, 'cached': 0}
+
+    def detect(self, image: np.ndarray,
+               detector: Callable[[np.ndarray], List[Box]]) -> List[Box]:
+        """Get the text boxes of a frame, re-detecting only changed cells.
+
+        Args:
+            image: Downscaled RGB frame
+            detector: Finds text boxes in an RGB image
+
+        Returns:
+            Boxes (x1, y1, x2, y2) in the frame's pixels
+        """
+        height, width = image.shape[:2]
+        fingerprint = self._fingerprint_of(image)
+
+        with self._lock:
+            if self._fingerprint is None or self._size != (width, height):
+                changed = None  # Everything
+            else:
+                changed = self._changed_cells(fingerprint)
+
+            if changed is not None and not changed.any():
+                self.stats['cached'] += 1
+                self._fingerprint = fingerprint
+                return list(self._boxes)
+
+            if changed is None or changed.mean() >= FULL_DETECT_FRACTION:
+                boxes = detector(image)
+                self.stats['full'] += 1
+            else:
+                # Re-detect the changed area, padded by one cell so labels
+                # crossing a cell border are found whole
+                rows, cols = np.nonzero(changed)
+                cell_w = width / self.cols
+                cell_h = height / self.rows
+                dx1 = int(max(0, cols.min() - 1) * cell_w)
+                dy1 = int(max(0, rows.min() - 1) * cell_h)
+                dx2 = int(min(self.cols, cols.max() + 2) * cell_w)
+                dy2 = int(min(self.rows, rows.max() + 2) * cell_h)
+
+                kept = [b for b in self._boxes
+                        if b[2] <= dx1 or b[0] >= dx2 or b[3] <= dy1 or b[1] >= dy2]
+                found = detector(np.ascontiguousarray(image[dy1:dy2, dx1:dx2]))
+                boxes = kept + [(x1 + dx1, y1 + dy1, x2 + dx1, y2 + dy1) for x1, y1, x2, y2 in found]
+                self.stats['partial'] += 1
+
+            self._fingerprint = fingerprint
+            self._size = (width, height)
+            self._boxes = boxes
+            return list(boxes)
+
+    def _fingerprint_of(self, image: np.ndarray) -> np.ndarray:
+        gray = cv2.cvtColor(image, cv2.COLOR_RGB2GRAY)
+        size = (self.cols * CELL_SAMPLES, self.rows * CELL_SAMPLES)
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA).astype(np.int16)
+
+    def _changed_cells(self, fingerprint: np.ndarray) -> np.ndarray:
+        diff = np.abs(fingerprint - self._fingerprint)
+        # Max, not mean - a new label only changes a few samples of its cell
+        per_cell = diff.reshape(self.rows, CELL_SAMPLES, self.cols, CELL_SAMPLES).max(axis=(1, 3))
+        return per_cell > CELL_CHANGE_THRESHOLD
+
+
+def downscale(image: np.ndarray, width: int = DETECT_WIDTH) -> Tuple[np.ndarray, float]:
+    """Downscale an RGB frame for detection.
+
+    Returns:
+        Tuple of (image, scale) where scale = detection pixels / frame pixels
+    """
+    height, frame_width = image.shape[:2]
+    if frame_width <= width:
+        return image, 1.0
+    scale = width / frame_width
+    size = (width, max(1, round(height * scale)))
+    return cv2.resize(image, size, interpolation=cv2.INTER_AREA), scale
+
+
+def detect_text(reader: Any, image: np.ndarray) -> List[Box]:
+    """Run EasyOCR's text detector on an RGB image.
+
+    Returns:
+        Axis-aligned boxes (x1, y1, x2, y2)
+    """
+    horizontal, free = reader.detect(image, canvas_size=max(image.shape[:2]))
+    boxes = [(int(x1), int(y1), int(x2), int(y2)) for x1, x2, y1, y2 in horizontal[0]]
+    for points in free[0]:
+        # Rotated boxes - keep their bounding rectangle
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        boxes.append((int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))))
+    return boxes
+
+
+def filter_candidates(image: np.ndarray, boxes: List[Box]) -> List[Box]:
+    """Keep boxes shaped and coloured like HUD signature labels.
+
+    Args:
+        image: RGB frame the boxes refer to
+        boxes: Detected text boxes
+    """
+    height, width = image.shape[:2]
+    max_height = max(MIN_BOX_HEIGHT, height * MAX_BOX_HEIGHT_FRACTION)
+    hsv = cv2.cvtColor(image, cv2.COLOR_RGB2HSV)
+
+    candidates = []
+    for x1, y1, x2, y2 in boxes:
+        x1, y1 = max(0, x1), max(0, y1)
+        x2, y2 = min(width, x2), min(height, y2)
+        box_w, box_h = x2 - x1, y2 - y1
+        if box_h < MIN_BOX_HEIGHT or box_h > max_height:
+            continue
+        if not MIN_ASPECT <= box_w / box_h <= MAX_ASPECT:
+            continue
+        if _hud_fraction(hsv[y1:y2, x1:x2]) < MIN_HUD_FRACTION:
+            continue
+        candidates.append((x1, y1, x2, y2))
+    return candidates
+
+
+def _hud_fraction(hsv: np.ndarray) -> float:
+    """Share of the box's bright (text) pixels that have the HUD colour."""
+    value = hsv[..., 2]
+    text = value >= max(120, np.percentile(value, 75))
+    if not text.any():
+        return 0.0
+    hue = hsv[..., 0][text]
+    saturation = hsv[..., 1][text]
+    hud = ((hue >= HUD_HUE_RANGE[0]) & (hue <= HUD_HUE_RANGE[1])) | (saturation <= HUD_MAX_WHITE_SATURATION)
+    return float(hud.mean())
+
+
+def recognize_labels(reader: Any, gray: np.ndarray, boxes: List[Box],
+                     allowlist: str) -> List[Tuple[Box, str, float]]:
+    """Recognize all label boxes in one batched call.
+
+    Args:
+        reader: EasyOCR reader
+        gray: Full resolution grayscale frame
+        boxes: Label boxes in frame pixels
+        allowlist: Characters the recognizer may output
+
+    Returns:
+        List of (box, text, confidence), one per box
+    """
+    if not boxes:
+        return []
+
+    height, width = gray.shape[:2]
+    horizontal = [
+        [max(0, x1 - LABEL_PADDING), min(width, x2 + LABEL_PADDING),
+         max(0, y1 - LABEL_PADDING), min(height, y2 + LABEL_PADDING)]
+        for x1, y1, x2, y2 in boxes
+    ]
+    results = reader.recognize(
+        gray,
+        horizontal_list=horizontal,
+        free_list=[],
+        allowlist=allowlist,
+        detail=1,
+        paragraph=False,
+        batch_size=len(horizontal),
+    )
+
+    labels = []
+    for points, text, confidence in (r[:3] for r in results):
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        labels.append(((int(min(xs)), int(min(ys)), int(max(xs)), int(max(ys))), text, float(confidence)))
+    return labels
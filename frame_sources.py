@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Live frame sources for SC Signature Scanner.
+
+Besides screenshot files, the scanner can be fed frames continuously:
+
+- ScreenRegionSource grabs just the scan region from the screen at a fixed
+  rate (PIL ImageGrab; on Linux from an X display, so it also works under
+  Xvfb).
+- PngSequenceSource replays a folder of PNG frames, e.g. to reproduce a
+  recorded session or to test without the game.
+
+LiveScanner pulls frames from a source and passes them through a cheap
+ChangeDetector first. A downscaled grayscale thumbnail of the region is
+compared with the last frame that was scanned; OCR only runs when enough
+pixels changed, so a steady HUD costs a grab and a resize per frame
+instead of a recognition.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+import region_selector
+from results import ScanResult
+
+Rect = Tuple[int, int, int, int]
+
+
+DEFAULT_FPS = 4.0
+THUMB_WIDTH = 96  # Change detection works on a thumbnail this wide
+PIXEL_DELTA = 24  # Gray level change (0-255) that counts a thumbnail pixel as changed
+MIN_CHANGED_FRACTION = 0.01  # Share of changed pixels that triggers a scan
+MAX_SKIP_SECONDS = 5.0  # Rescan at least this often even without changes
+
+
+class FrameSource:
+    """Produces frames for LiveScanner.
+
+    Subclasses implement frames(). pre_cropped tells the scanner whether
+    frames are already the signature region or full screenshots.
+    """
+
+    pre_cropped = False
+
+    def frames(self, stop: threading.Event) -> Iterator[Tuple[str, Image.Image]]:
+        """Yield (label, frame) until exhausted or stop is set."""
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        return type(self).__name__
+
+
+def _pace(stop: threading.Event, next_at: float, interval: float) -> float:
+    """Sleep until next_at (or stop), returning the following deadline."""
+    delay = next_at - time.monotonic()
+    if delay > 0:
+        stop.wait(delay)
+    # Do not try to catch up after a slow frame - just keep the rate
+    return max(next_at + interval, time.monotonic())
+
+
+class ScreenRegionSource(FrameSource):
+    """Grabs the scan region from the screen at a fixed rate."""
+
+    pre_cropped = True
+
+    def __init__(self, region: Optional[Rect] = None, fps: float = DEFAULT_FPS,
+                 xdisplay: Optional[str] = None):
+        """
+        Args:
+            region: Screen rectangle to grab (default: the scan region for
+                the current screen size)
+            fps: Frames per second
+            xdisplay: X display to grab from (Linux, e.g. ":99"; None =
+                default display / native grab on Windows and macOS)
+        """
+        self.region = region
+        self.interval = 1.0 / max(0.1, fps)
+        self.xdisplay = xdisplay
+
+    def resolve_region(self) -> Optional[Rect]:
+        """Scan region for the current screen size."""
+        if self.region is None:
+            screen = self._grab(None)
+            self.region = region_selector.region_for_image(*screen.size)
+        return self.region
+
+    def frames(self, stop: threading.Event) -> Iterator[Tuple[str, Image.Image]]:
+        region = self.resolve_region()
+        if region is None:
+            raise RuntimeError("Scan region not configured for this screen size")
+
+        count = 0
+        next_at = time.monotonic()
+        while not stop.is_set():
+            count += 1
+            yield f"screen-{count:06d}", self._grab(region)
+            next_at = _pace(stop, next_at, self.interval)
+
+    def _grab(self, bbox: Optional[Rect]) -> Image.Image:
+        from PIL import ImageGrab  # Needs a display - imported on first use
+        if self.xdisplay is not None:
+            return ImageGrab.grab(bbox=bbox, xdisplay=self.xdisplay)
+        return ImageGrab.grab(bbox=bbox)
+
+    def describe(self) -> str:
+        display = f" on {self.xdisplay}" if self.xdisplay else ""
+        return f"screen region {self.region}{display} at {1 / self.interval:g} fps"
+
+
+class PngSequenceSource(FrameSource):
+    """Replays PNG frames from a folder in name order."""
+
+    def __init__(self, folder: Path, fps: Optional[float] = None,
+                 loop: bool = False, pre_cropped: bool = False):
+        """
+        Args:
+            folder: Folder with the frames (*.png)
+            fps: Replay rate (None = as fast as they can be processed)
+            loop: Start over after the last frame
+            pre_cropped: Frames are the signature region, not screenshots
+        """
+        self.folder = Path(folder)
+        self.interval = 1.0 / fps if fps else 0.0
+        self.loop = loop
+        self.pre_cropped = pre_cropped
+
+    def frames(self, stop: threading.Event) -> Iterator[Tuple[str, Image.Image]]:
+        paths: List[Path] = sorted(self.folder.glob("*.png"))
+        if not paths:
+            raise RuntimeError(f"No PNG frames in {self.folder}")
+
+        next_at = time.monotonic()
+        while not stop.is_set():
+            for path in paths:
+                if stop.is_set():
+                    return
+                img = Image.open(path)
+                img.load()  # Reads the data and closes the file
+                yield path.name, img
+                if self.interval:
+                    next_at = _pace(stop, next_at, self.interval)
+            if not self.loop:
+                return
+
+    def describe(self) -> str:
+        return f"PNG sequence {self.folder}"
+
+
+class ChangeDetector:
+    """Decides whether a frame differs enough from the last scanned one."""
+
+    def __init__(self, pixel_delta: int = PIXEL_DELTA,
+                 min_fraction: float = MIN_CHANGED_FRACTION,
+                 max_skip: float = MAX_SKIP_SECONDS):
+        self.pixel_delta = pixel_delta
+        self.min_fraction = min_fraction
+        self.max_skip = max_skip
+        self._last: Optional[np.ndarray] = None
+        self._last_at = 0.0
+
+    def changed(self, region: Image.Image) -> bool:
+        """True if the region should be scanned (and remember it if so)."""
+        thumb = self._thumbnail(region)
+        now = time.monotonic()
+        if (self._last is not None and self._last.shape == thumb.shape
+                and now - self._last_at < self.max_skip):
+            diff = np.abs(thumb - self._last)
+            if np.count_nonzero(diff > self.pixel_delta) < self.min_fraction * diff.size:
+                return False
+        self._last = thumb
+        self._last_at = now
+        return True
+
+    def reset(self):
+        self._last = None
+
+    @staticmethod
+    def _thumbnail(region: Image.Image) -> np.ndarray:
+        width, height = region.size
+        size = (min(width, THUMB_WIDTH), max(1, round(height * min(width, THUMB_WIDTH) / width)))
+        thumb = region.convert('L').resize(size, Image.Resampling.BILINEAR)
+        return np.asarray(thumb, dtype=np.int16)
+
+
+class LiveScanner:
+    """Scans frames from a source whenever the signature region changes."""
+
+    def __init__(self, scanner, source: FrameSource,
+                 on_result: Callable[[Path, ScanResult], None],
+                 on_error: Callable[[str, bool], None],
+                 detector: Optional[ChangeDetector] = None):
+        """
+        Args:
+            scanner: SignatureScanner
+            source: Where frames come from
+            on_result: Called with (label, result) when the detected
+                signature changes (on the live thread)
+            on_error: Called with (message, stopped) when the source fails
+                (stopped=True, scanning ended) or on_result raised
+                (stopped=False, scanning goes on)
+            detector: Change detector (default: ChangeDetector())
+        """
+        self.scanner = scanner
+        self.source = source
+        self.on_result = on_result
+        self.on_error = on_error
+        self.detector = detector or ChangeDetector()
+        self.frames = 0
+        self.scans = 0
+        self._last_signature: Optional[int] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="LiveScanner", daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def format_stats(self) -> str:
+        skipped = self.frames - self.scans
+        share = skipped / self.frames if self.frames else 0.0
+        return f"{self.frames} frames, {self.scans} scanned, {skipped} unchanged ({share:.0%} skipped)"
+
+    def _run(self):
+        try:
+            for label, frame in self.source.frames(self._stop):
+                self.frames += 1
+                if not self.detector.changed(self._region_of(frame)):
+                    continue
+                self.scans += 1
+                result = self.scanner.scan_buffer(frame, pre_cropped=self.source.pre_cropped)
+                self._report(label, result)
+        except Exception as e:
+            self.on_error(str(e), True)
+
+    def _region_of(self, frame: Image.Image) -> Image.Image:
+        """The part of the frame the change detector watches."""
+        if self.source.pre_cropped:
+            return frame
+        region = region_selector.region_for_image(*frame.size)
+        return frame.crop(region) if region else frame
+
+    def _report(self, label: str, result: ScanResult):
+        # Only changes are reported - an unchanged signature is not news
+        signature = result.signature
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        try:
+            self.on_result(Path(label), result)
+        except Exception as e:
+            self.on_error(f"Result handler failed: {e}", False)
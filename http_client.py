@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for SC Signature Scanner.
+
+All network access (Regolith.rocks, UEX prices, GitHub update check) goes
+through one client so that:
+- Connections are kept alive and reused (one pooled requests.Session)
+- Transient failures are retried with jittered exponential backoff
+- A host that is unreachable fails fast for a while (circuit breaker)
+  instead of every caller waiting out its own timeout
+- Requests against a quota (Regolith: 3,600/day) are counted by a token
+  bucket that survives restarts
+
+Errors are raised as requests exceptions, so callers keep their existing
+requests error handling.
+"""
+
+import json
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+import settings
+
+
+# Defaults
+CONNECT_TIMEOUT = 5  # Seconds - fail fast when offline, reads may take longer
+DEFAULT_RETRIES = 2
+BACKOFF_BASE = 0.5  # Seconds, doubled per attempt
+BACKOFF_MAX = 8.0
+RETRY_STATUSES = {502, 503, 504}
+FAILURE_THRESHOLD = 3  # Consecutive failures before a host's circuit opens
+RESET_TIMEOUT = 60  # Seconds before a trial request is let through
+POOL_SIZE = 4
+USER_AGENT = "SC-Signature-Scanner"
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit is open."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} unreachable - not retrying for {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class BudgetExceededError(requests.exceptions.RequestException):
+    """Raised when a host's request budget is used up."""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"Request budget for {host} used up - next request in {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Per-host breaker: closed -> open after repeated failures -> half-open trial."""
+
+    def __init__(self, failure_threshold: int = FAILURE_THRESHOLD, reset_timeout: float = RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> float:
+        """Check whether a request may be sent.
+
+        Returns:
+            0 if allowed, otherwise seconds until the next trial request
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return 0.0
+            remaining = self.opened_at + self.reset_timeout - time.monotonic()
+            if remaining > 0 or self._trial_in_flight:
+                return max(remaining, 1.0)
+            # Half-open: let one request through to test the host
+            self._trial_in_flight = True
+            return 0.0
+
+    def cancel_trial(self):
+        """Give back a trial slot from allow() that was not used for a request."""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class TokenBucket:
+    """Request budget refilled continuously over a period.
+
+    With a state file, the remaining budget is persisted so restarts do not
+    reset a daily quota. Writes are debounced (write-behind, flushed on exit).
+    """
+
+    def __init__(self, capacity: int, period: float, state_file: Optional[Path] = None):
+        """
+        Args:
+            capacity: Requests allowed per period
+            period: Period length in seconds
+            state_file: Optional JSON file to persist the bucket
+        """
+        self.capacity = capacity
+        self.rate = capacity / period  # Tokens per second
+        self.state_file = Path(state_file) if state_file else None
+        self._lock = threading.Lock()
+
+        self.tokens = float(capacity)
+        self.updated = time.time()
+        self._load()
+
+    @property
+    def remaining(self) -> int:
+        with self._lock:
+            self._refill()
+            return int(self.tokens)
+
+    def try_acquire(self, cost: float = 1.0) -> float:
+        """Take tokens from the bucket.
+
+        Returns:
+            0 if acquired, otherwise seconds until enough tokens are available
+        """
+        with self._lock:
+            self._refill()
+            if self.tokens < cost:
+                return (cost - self.tokens) / self.rate
+            self.tokens -= cost
+        if self.state_file:
+            settings.schedule_write(str(self.state_file), self._save)
+        return 0.0
+
+    def _refill(self):
+        now = time.time()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def _load(self):
+        if not self.state_file or not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            self.tokens = min(float(state['tokens']), self.capacity)
+            self.updated = min(float(state['updated']), time.time())
+        except (json.JSONDecodeError, IOError, KeyError, TypeError, ValueError):
+            pass
+
+    def _save(self):
+        with self._lock:
+            state = {'tokens': self.tokens, 'updated': self.updated}
+        try:
+            settings.write_json_atomic(self.state_file, state)
+        except IOError as e:
+            print(f"Warning: Could not save request budget: {e}")
+
+
+class HTTPClient:
+    """Pooled session with retries, per-host circuit breakers and budgets."""
+
+    def __init__(self, retries: int = DEFAULT_RETRIES, user_agent: str = USER_AGENT):
+        self.retries = retries
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers['User-Agent'] = user_agent
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._budgets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, host: str) -> CircuitBreaker:
+        """Get the circuit breaker for a host."""
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker()
+            return breaker
+
+    def ensure_budget(self, host: str, capacity: int, period: float,
+                      state_file: Optional[Path] = None) -> TokenBucket:
+        """Attach a request budget to a host (once) and return it."""
+        with self._lock:
+            bucket = self._budgets.get(host)
+            if bucket is None:
+                bucket = self._budgets[host] = TokenBucket(capacity, period, state_file)
+            return bucket
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, timeout: float = 30,
+                retries: Optional[int] = None, **kwargs) -> requests.Response:
+        """Send a request with retries, circuit breaking and budget checks.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            timeout: Read timeout in seconds (connect timeout is CONNECT_TIMEOUT)
+            retries: Retries after the first attempt (default: client setting)
+            **kwargs: Passed to requests.Session.request
+
+        Returns:
+            The response (status not checked - call raise_for_status)
+
+        Raises:
+            CircuitOpenError: Host is known to be unreachable
+            BudgetExceededError: Host's request budget is used up
+            requests.exceptions.RequestException: Network failure after retries
+        """
+        host = urlsplit(url).hostname or url
+        breaker = self.breaker(host)
+        budget = self._budgets.get(host)
+        retries = self.retries if retries is None else retries
+
+        attempt = 0
+        while True:
+            retry_in = breaker.allow()
+            if retry_in:
+                raise CircuitOpenError(host, retry_in)
+            if budget is not None:
+                wait = budget.try_acquire()
+                if wait:
+                    # No request is sent - do not hold a half-open trial
+                    breaker.cancel_trial()
+                    raise BudgetExceededError(host, wait)
+
+            try:
+                response = self.session.request(
+                    method, url, timeout=(CONNECT_TIMEOUT, timeout), **kwargs
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                breaker.record_failure()
+                if attempt >= retries or breaker.is_open:
+                    raise
+            except requests.exceptions.RequestException:
+                # Not worth retrying, but still ends a half-open trial
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt >= retries or breaker.is_open:
+                    return response
+
+            attempt += 1
+            time.sleep(self._backoff(attempt))
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Full-jitter exponential backoff."""
+        return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+# === Module-level convenience functions ===
+
+_client: Optional[HTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> HTTPClient:
+    """Get or create the shared HTTP client."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HTTPClient()
+        return _client
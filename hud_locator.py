@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+HUD anchor locator for SC Signature Scanner.
+
+Optional alternative to a fixed scan region: the user marks a stable HUD
+element (the anchor) next to the signature readout once. On each scan the
+anchor is found with a template match inside a small search window around
+where it is expected, and the signature box is derived from its position,
+so the region follows the HUD when the resolution or window changes.
+
+HUD elements scale with the screenshot height, so the template and the
+signature offset are scaled by height / reference height.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+import region_selector
+
+
+ANCHOR_FILE = "hud_anchor.png"  # Template, next to scan_region.json
+MATCH_THRESHOLD = 0.7  # Normalized correlation needed to trust a match
+SEARCH_MARGIN = 0.08  # Search window margin, as a fraction of image size
+
+Rect = Tuple[int, int, int, int]
+
+
+class HudLocator:
+    """Finds the anchor template and derives the signature box from it."""
+
+    def __init__(self, template: np.ndarray, ref_size: Tuple[int, int],
+                 anchor_box: Rect, signature_box: Rect):
+        """
+        Args:
+            template: Grayscale anchor image (from the reference screenshot)
+            ref_size: (width, height) of the reference screenshot
+            anchor_box: Anchor (x1, y1, x2, y2) in reference pixels
+            signature_box: Signature region (x1, y1, x2, y2) in reference pixels
+        """
+        self.template = template
+        self.ref_size = ref_size
+        self.anchor_box = anchor_box
+        self.signature_box = signature_box
+        self._scaled: Dict[int, np.ndarray] = {}  # Template per image height
+        self._lock = threading.Lock()
+
+    def _template_for(self, height: int) -> np.ndarray:
+        with self._lock:
+            template = self._scaled.get(height)
+            if template is None:
+                scale = height / self.ref_size[1]
+                if scale == 1.0:
+                    template = self.template
+                else:
+                    th, tw = self.template.shape
+                    template = cv2.resize(
+                        self.template,
+                        (max(1, round(tw * scale)), max(1, round(th * scale))),
+                        interpolation=cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+                    )
+                self._scaled[height] = template
+            return template
+
+    def locate(self, image: Image.Image) -> Optional[Tuple[Rect, float]]:
+        """Find the signature box in a screenshot.
+
+        Args:
+            image: Full screenshot
+
+        Returns:
+            Tuple of ((x1, y1, x2, y2), match score), or None if the anchor
+            was not found with enough confidence
+        """
+        width, height = image.size
+        ref_w, ref_h = self.ref_size
+        scale = height / ref_h
+        template = self._template_for(height)
+        th, tw = template.shape
+
+        # Search window around the expected (normalized) anchor position
+        ax1, ay1 = self.anchor_box[0], self.anchor_box[1]
+        expected_x = round(ax1 / ref_w * width)
+        expected_y = round(ay1 / ref_h * height)
+        margin_x = round(width * SEARCH_MARGIN)
+        margin_y = round(height * SEARCH_MARGIN)
+        wx1 = max(0, expected_x - margin_x)
+        wy1 = max(0, expected_y - margin_y)
+        wx2 = min(width, expected_x + tw + margin_x)
+        wy2 = min(height, expected_y + th + margin_y)
+        if wx2 - wx1 < tw or wy2 - wy1 < th:
+            return None
+
+        window = np.asarray(image.crop((wx1, wy1, wx2, wy2)).convert('L'))
+        scores = cv2.matchTemplate(window, template, cv2.TM_CCOEFF_NORMED)
+        _, score, _, (mx, my) = cv2.minMaxLoc(scores)
+        if score < MATCH_THRESHOLD:
+            return None
+
+        # Signature box keeps its offset from the anchor (scaled)
+        found_x, found_y = wx1 + mx, wy1 + my
+        sx1, sy1, sx2, sy2 = self.signature_box
+        region = (
+            max(0, found_x + round((sx1 - ax1) * scale)),
+            max(0, found_y + round((sy1 - ay1) * scale)),
+            min(width, found_x + round((sx2 - ax1) * scale)),
+            min(height, found_y + round((sy2 - ay1) * scale))
+        )
+        if region[2] <= region[0] or region[3] <= region[1]:
+            return None
+        return region, float(score)
+
+
+# === Module-level convenience functions ===
+
+_locator: Optional[HudLocator] = None
+_locator_key: Optional[tuple] = None
+_locator_lock = threading.Lock()
+
+
+def _template_path() -> Path:
+    return region_selector.CONFIG_FILE.parent / ANCHOR_FILE
+
+
+def get_locator() -> Optional[HudLocator]:
+    """Get the locator for the saved anchor (None if no anchor is set)."""
+    global _locator, _locator_key
+    anchor = region_selector.load_anchor()
+    if not anchor:
+        return None
+
+    key = (tuple(anchor['ref_size']), tuple(anchor['box']), tuple(anchor['signature']),
+           anchor.get('saved_at'))
+    with _locator_lock:
+        if key != _locator_key:
+            try:
+                template = np.asarray(Image.open(_template_path()).convert('L'))
+            except OSError as e:
+                print(f"Warning: Could not load HUD anchor template: {e}")
+                _locator, _locator_key = None, key
+                return None
+            _locator = HudLocator(template, *key[:3])
+            _locator_key = key
+        return _locator
+
+
+def save_anchor(image: Image.Image, anchor_box: Rect, signature_box: Rect):
+    """Save an anchor marked on a reference screenshot.
+
+    Args:
+        image: Reference screenshot
+        anchor_box: Anchor (x1, y1, x2, y2) in screenshot pixels
+        signature_box: Signature region (x1, y1, x2, y2) in screenshot pixels
+    """
+    image.crop(anchor_box).convert('L').save(_template_path())
+    anchor: Dict[str, Any] = {
+        'ref_size': list(image.size),
+        'box': list(anchor_box),
+        'signature': list(signature_box),
+        'template': ANCHOR_FILE,
+        'saved_at': time.time(),
+    }
+    region_selector.save_anchor(anchor)
+
+
+def clear_anchor():
+    """Remove the saved anchor."""
+    region_selector.save_anchor(None)
+    path = _template_path()
+    if path.exists():
+        path.unlink()
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Local ingestion API for SC Signature Scanner.
+
+Capture tools and test harnesses can send screenshots straight from
+memory instead of writing a PNG for the folder monitor to pick up. The
+server listens on the loopback interface only and scans each request on
+its own thread with the shared SignatureScanner.
+
+Endpoints:
+    GET  /health   {"ok": true, "ocr": <bool>}
+    POST /scan     Body: image bytes, returns the scan result as JSON
+
+Errors are returned as {"error": "..."} with a 4xx status, or 500 if the
+scan itself failed.
+
+/scan accepts an encoded image (PNG, JPEG, BMP - anything Pillow reads)
+or raw pixels when the query names the layout:
+    ?width=1920&height=1080&mode=RGB   (RGB, RGBA, BGR, BGRA or L)
+Add ?cropped=1 if the image is already the signature region.
+
+Usage:
+    python ingest_server.py [--port 8765]
+"""
+
+import io
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+from PIL import Image
+
+from results import ScanResult
+
+
+HOST = "127.0.0.1"  # Never exposed beyond this machine
+DEFAULT_PORT = 8765
+MAX_BODY_BYTES = 64 * 1024 * 1024  # Larger than an uncompressed 4K RGBA frame
+
+# Raw pixel layouts: query mode -> (PIL mode, raw decoder mode, bytes per pixel)
+RAW_MODES = {
+    'RGB': ('RGB', 'RGB', 3),
+    'RGBA': ('RGBA', 'RGBA', 4),
+    'BGR': ('RGB', 'BGR', 3),
+    'BGRA': ('RGBA', 'BGRA', 4),
+    'L': ('L', 'L', 1),
+}
+
+
+class IngestError(Exception):
+    """Request could not be turned into an image (HTTP status attached)."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+def decode_image(body: bytes, query: Dict[str, str]) -> Image.Image:
+    """Build an image from a request body.
+
+    Args:
+        body: Encoded image, or raw pixels if query has width/height
+        query: Request query parameters
+
+    Raises:
+        IngestError: If the body does not match the declared layout or is
+            not a readable image
+    """
+    if 'width' in query or 'height' in query:
+        try:
+            width = int(query['width'])
+            height = int(query['height'])
+        except (KeyError, ValueError):
+            raise IngestError(400, "Raw pixels need integer width and height")
+        mode = query.get('mode', 'RGB').upper()
+        if mode not in RAW_MODES:
+            raise IngestError(400, f"Unsupported pixel mode: {mode}")
+        image_mode, raw_mode, channels = RAW_MODES[mode]
+        if width <= 0 or height <= 0 or len(body) != width * height * channels:
+            raise IngestError(400, f"Expected {width}x{height}x{channels} bytes, got {len(body)}")
+        return Image.frombuffer(image_mode, (width, height), body, 'raw', raw_mode, 0, 1)
+
+    try:
+        image = Image.open(io.BytesIO(body))
+        image.load()
+    except (OSError, ValueError, SyntaxError, Image.DecompressionBombError) as e:
+        raise IngestError(415, f"Unreadable image: {e}")
+    return image
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "SCSignatureScanner"
+    protocol_version = "HTTP/1.1"  # Keep-alive for clients sending many frames
+
+    server: "IngestServer"
+
+    def do_GET(self):
+        if urlparse(self.path).path != '/health':
+            self._send_json(404, {'error': 'Not found'})
+            return
+        available, _ = self.server.scanner.is_ocr_available()
+        self._send_json(200, {'ok': True, 'ocr': available})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path != '/scan':
+            self._send_json(404, {'error': 'Not found'})
+            return
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        length = self.headers.get('Content-Length')
+        if length is None:
+            self._send_json(411, {'error': 'Content-Length required'})
+            return
+        try:
+            length = int(length)
+        except ValueError:
+            self._send_json(400, {'error': 'Invalid Content-Length'})
+            return
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {'error': f'Body must be 1-{MAX_BODY_BYTES} bytes'})
+            return
+        body = self.rfile.read(length)
+
+        try:
+            image = decode_image(body, query)
+        except IngestError as e:
+            self._send_json(e.status, {'error': str(e)})
+            return
+
+        start = time.perf_counter()
+        try:
+            result = self.server.scan(image, query.get('cropped') in ('1', 'true'))
+        except Exception as e:
+            self._send_json(500, {'error': f'Scan failed: {e}'})
+            return
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        payload = result.as_dict()
+        payload.pop('debug', None)
+        payload['scan_ms'] = round(elapsed_ms, 1)
+        self._send_json(200, payload)
+
+    def _send_json(self, status: int, payload: Dict[str, Any]):
+        data = json.dumps(payload, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Requests are reported through on_result, not stderr
+
+
+class IngestServer(ThreadingHTTPServer):
+    """Loopback HTTP server that scans posted screenshots."""
+
+    daemon_threads = True
+
+    def __init__(self, scanner, port: int = DEFAULT_PORT,
+                 on_result: Optional[Callable[[Path, ScanResult], None]] = None):
+        """
+        Args:
+            scanner: SignatureScanner (shared - scans are thread-safe)
+            port: Loopback port (0 picks a free one)
+            on_result: Called with (label path, result) after each scan, on
+                the request thread (e.g. to show the overlay)
+        """
+        super().__init__((HOST, port), _Handler)
+        self.scanner = scanner
+        self.on_result = on_result
+        self._thread: Optional[threading.Thread] = None
+        self._count = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def start(self):
+        """Serve on a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.serve_forever, name="IngestServer", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self.server_close()
+
+    def scan(self, image: Image.Image, pre_cropped: bool = False) -> ScanResult:
+        """Scan one posted image and report it."""
+        with self._count_lock:
+            self._count += 1
+            label = Path(f"ingest-{self._count:05d}")
+
+        result = self.scanner.scan_buffer(image, pre_cropped=pre_cropped)
+        if self.on_result:
+            try:
+                self.on_result(label, result)
+            except Exception as e:
+                print(f"Ingest result handler failed: {e}")
+        return result
+
+
+def main():
+    import argparse
+
+    import paths
+    from scanner import SignatureScanner
+
+    parser = argparse.ArgumentParser(description="SC Signature Scanner ingestion API")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="Loopback port")
+    args = parser.parse_args()
+
+    scanner = SignatureScanner(paths.get_data_path() / 'combat_analyst_db.json')
+    server = IngestServer(scanner, port=args.port)
+    print(f"Listening on http://{HOST}:{server.port} (POST /scan, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -26,7 +26,6 @@ import time
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, List, Dict, Any, Tuple
 
 # Path utilities (must be first for frozen exe support)
@@ -64,6 +63,15 @@ _splash.set_status("Loading UI components...")
 from overlay import OverlayPopup, PositionAdjuster
 _splash.pump(5)
 from monitor import ScreenshotMonitor
+from pipeline import ScanPipeline
+from ingest_server import IngestServer
+from frame_sources import LiveScanner, ScreenRegionSource
+import video_analysis
+from startup import StartupGraph, StartupReport
+from tasks import TaskExecutor, TaskHandle
+import settings
+import ui_bus
+from ui_bus import LogView, UIBus
 _splash.pump(5)
 from config import Config
 from theme import RegolithTheme, WarningBanner, UpdateBanner, StatusIndicator
@@ -82,6 +90,7 @@ class SCSignatureScannerApp:
     """Main application class."""
     
     VERSION = version_checker.CURRENT_VERSION
+    SUBMIT_TIMEOUT = 0.25  # Seconds to wait for room in the scan pipeline
     
     def __init__(self):
         self.root = tk.Tk()
@@ -103,10 +112,20 @@ class SCSignatureScannerApp:
         # Configuration
         self.config = Config()
         
+        # Worker threads post UI updates here; the Tk thread applies them
+        self.bus = UIBus(self.root)
+        self._log_listener = ui_bus.setup_file_logging(paths.get_log_path())
+        
         # Components
         self.scanner: Optional[SignatureScanner] = None
         self.monitor: Optional[ScreenshotMonitor] = None
+        self.pipeline: Optional[ScanPipeline] = None
         self.overlay: Optional[OverlayPopup] = None
+        self.ingest_server: Optional[IngestServer] = None
+        self.live_scanner: Optional[LiveScanner] = None
+        
+        # Network actions triggered from the UI run here, off the Tk thread
+        self.tasks = TaskExecutor(self.root)
         
         # State
         self.is_monitoring = False
@@ -115,11 +134,13 @@ class SCSignatureScannerApp:
         self.screenshot_count = 0
         self.regolith_user: Optional[str] = None
         
+        # Startup timings (set once startup finishes)
+        self.startup_report: Optional[StartupReport] = None
+        
         # Build UI (must be first - needed for dialogs)
         self._create_ui()
-        
-        # Check for updates (background, non-blocking)
-        self._check_for_updates()
+        self.bus.set_log_sink(LogView(self.log_text).append)
+        self.bus.start()
     
     def _create_ui(self):
         """Create the main UI."""
@@ -279,6 +300,20 @@ class SCSignatureScannerApp:
         )
         self.start_btn.pack(side=tk.LEFT, padx=(0, 8))
         
+        self.live_btn = tk.Button(
+            btn_frame,
+            text="📺  Live",
+            bg=colors['bg_light'],
+            fg=colors['text_primary'],
+            font=fonts['body'],
+            relief='flat',
+            padx=12,
+            pady=8,
+            cursor='hand2',
+            command=self._toggle_live_scan
+        )
+        self.live_btn.pack(side=tk.LEFT, padx=(0, 8))
+        
         test_btn = tk.Button(
             btn_frame,
             text="🧪  Test",
@@ -419,6 +454,21 @@ class SCSignatureScannerApp:
         )
         clear_region_btn.pack(side=tk.LEFT)
         
+        self.full_frame_var = tk.BooleanVar(value=False)
+        full_frame_check = tk.Checkbutton(
+            region_btn_frame,
+            text="Full frame",
+            variable=self.full_frame_var,
+            bg=colors['bg_light'],
+            fg=colors['text_primary'],
+            font=fonts['body'],
+            selectcolor=colors['bg_dark'],
+            activebackground=colors['bg_light'],
+            activeforeground=colors['text_primary'],
+            command=self._toggle_full_frame
+        )
+        full_frame_check.pack(side=tk.LEFT, padx=(8, 0))
+        
         # Right: Popup Position
         pos_frame = tk.Frame(row1, bg=colors['bg_main'])
         pos_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
@@ -752,7 +802,7 @@ class SCSignatureScannerApp:
         data_row3 = tk.Frame(data_inner, bg=colors['bg_light'])
         data_row3.pack(fill=tk.X)
         
-        change_key_btn = tk.Button(
+        self.change_key_btn = tk.Button(
             data_row3,
             text="🔑 Key",
             bg=colors['bg_hover'],
@@ -764,9 +814,9 @@ class SCSignatureScannerApp:
             cursor='hand2',
             command=self._change_api_key
         )
-        change_key_btn.pack(side=tk.LEFT, padx=(0, 5))
+        self.change_key_btn.pack(side=tk.LEFT, padx=(0, 5))
         
-        refresh_all_btn = tk.Button(
+        self.refresh_all_btn = tk.Button(
             data_row3,
             text="🔄 Refresh",
             bg=colors['cyan'],
@@ -778,7 +828,7 @@ class SCSignatureScannerApp:
             cursor='hand2',
             command=self._refresh_all_data
         )
-        refresh_all_btn.pack(side=tk.LEFT)
+        self.refresh_all_btn.pack(side=tk.LEFT)
         
         # === Row 5: Debug Output Folder (full width) ===
         row5 = tk.Frame(settings_content, bg=colors['bg_main'])
@@ -942,6 +992,20 @@ class SCSignatureScannerApp:
         )
         test_popup_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.video_btn = tk.Button(
+            action_row,
+            text="🎞  Analyze Video",
+            bg=colors['bg_hover'],
+            fg=colors['text_primary'],
+            font=fonts['body'],
+            relief='flat',
+            padx=12,
+            pady=4,
+            cursor='hand2',
+            command=self._analyze_video
+        )
+        self.video_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         save_btn = tk.Button(
             action_row,
             text="💾  Save Settings",
@@ -1221,8 +1285,8 @@ class SCSignatureScannerApp:
             messagebox.showerror("Error", "Please select a valid screenshot folder")
             return
         
-        # Check if scan region is configured
-        if not region_selector.is_configured():
+        # Check if scan region is configured (full-frame mode needs none)
+        if not self.full_frame_var.get() and not region_selector.is_configured():
             result = messagebox.askyesno(
                 "No Scan Region",
                 "No scan region is configured.\n\n"
@@ -1239,21 +1303,22 @@ class SCSignatureScannerApp:
         self.processed_files.update(Path(folder).glob("*.jpeg"))
         self.screenshot_count = 0
         
+        # Start scan pipeline (decode/preprocess/OCR/valuation overlap across screenshots)
+        if self.scanner:
+            self.pipeline = ScanPipeline(self.scanner, on_result=self._on_scan_result)
+            self.pipeline.start()
+        
         # Start monitor
+        # PNGs are handed over while still being written when the scanner
+        # can follow them (see png_stream.py)
         self.monitor = ScreenshotMonitor(
             folder=folder,
             callback=self._on_new_screenshot,
-            ignore_existing=self.processed_files
+            ignore_existing=self.processed_files,
+            stream_png=bool(self.scanner and self.scanner.stream_png)
         )
         self.monitor.start()
         
-        # Create overlay
-        self.overlay = OverlayPopup(
-            position=self.overlay_position,
-            duration=self.duration_var.get(),
-            scale=self.scale_var.get()
-        )
-        
         self.is_monitoring = True
         self.status_indicator.set_active()
         self.start_btn.configure(
@@ -1263,15 +1328,62 @@ class SCSignatureScannerApp:
         self._log(f"▶ Started monitoring")
         self._log(f"  Ignoring {len(self.processed_files)} existing files")
     
+    def _toggle_live_scan(self):
+        """Start or stop scanning the screen region continuously."""
+        if self.live_scanner:
+            self._stop_live_scan()
+            return
+        
+        if not self.scanner:
+            messagebox.showerror("Error", "Scanner not initialized")
+            return
+        if not region_selector.is_configured():
+            messagebox.showerror("No Scan Region", "Define a scan region before live scanning.")
+            return
+        
+        fps = self.config.get('live_fps', 4.0)
+        source = ScreenRegionSource(fps=fps)
+        self.live_scanner = LiveScanner(
+            self.scanner, source,
+            on_result=self._on_scan_result,
+            on_error=lambda message, stopped: self.bus.post(self._on_live_error, message, stopped)
+        )
+        self.live_scanner.start()
+        self.live_btn.configure(text="⏹  Live", bg=RegolithTheme.COLORS['warning'])
+        self._log(f"📺 Live scanning the screen region at {fps:g} fps")
+    
+    def _stop_live_scan(self):
+        """Stop live scanning and report how many frames OCR was skipped for."""
+        if not self.live_scanner:
+            return
+        self.live_scanner.stop()
+        self._log(f"📺 Live scanning stopped: {self.live_scanner.format_stats()}")
+        self.live_scanner = None
+        self.live_btn.configure(text="📺  Live", bg=RegolithTheme.COLORS['bg_light'])
+    
+    def _on_live_error(self, message: str, stopped: bool):
+        """Live scanning reported a problem (Tk thread)."""
+        if not stopped:
+            self._log(f"⚠ Live scanning: {message}")
+            return
+        self._log(f"⚠ Live scanning failed: {message}")
+        self._stop_live_scan()
+    
     def _stop_monitoring(self):
         """Stop monitoring."""
         if self.monitor:
             self.monitor.stop()
             self.monitor = None
         
+        if self.pipeline:
+            # Short join: don't hold up the UI for a scan in progress
+            self.pipeline.stop(timeout=0.5)
+            if self.pipeline.metrics and any(m.processed for m in self.pipeline.metrics.values()):
+                self._log(f"  Pipeline: {self.pipeline.format_metrics()}")
+            self.pipeline = None
+        
         if self.overlay:
-            self.overlay.destroy()
-            self.overlay = None
+            self.overlay.hide()
         
         self.is_monitoring = False
         self.status_indicator.set_inactive()
@@ -1286,14 +1398,38 @@ class SCSignatureScannerApp:
         self._log(f"📸 New: {filepath.name}")
         
         # Scan for signature
+        if self.pipeline and self.pipeline.is_running:
+            # Result arrives via _on_scan_result on the pipeline thread. Don't
+            # wait long for room - this may be the Tk thread (Test Screenshot)
+            if not self.pipeline.submit(filepath, timeout=self.SUBMIT_TIMEOUT):
+                self._log(f"⚠ Scan queue full - scanning {filepath.name} separately")
+                threading.Thread(target=self._scan_directly, args=(filepath,),
+                                 name="DirectScan", daemon=True).start()
+            # Use the OCR time: value the likely rock types and ready the overlay
+            self._prepare_for_result()
+        elif self.scanner:
+            # Scanned on this thread - prepare alongside it
+            threading.Thread(target=self._prepare_for_result, name="PrepareResult", daemon=True).start()
+            self._on_scan_result(filepath, self.scanner.scan_image(filepath))
+        else:
+            self.bus.post(self._count_screenshot)
+    
+    def _scan_directly(self, filepath: Path):
+        """Scan outside the pipeline (any thread)."""
+        self._on_scan_result(filepath, self.scanner.scan_image(filepath))
+    
+    def _prepare_for_result(self):
+        """Prewarm valuations and the overlay while a screenshot is scanned (any thread)."""
+        rows = self.scanner.prewarm_valuation() if self.scanner else 0
+        self.bus.post(self._prepare_overlay, rows)
+    
+    def _on_scan_result(self, filepath: Path, result):
+        """Handle a finished scan (any thread - UI work goes through the bus)."""
         if self.scanner:
-            result = self.scanner.scan_image(filepath)
-            
             # Check for errors
             if result and result.get('error'):
                 self._log(f"   ⚠ Error: {result['error']}")
-                self.screenshot_count += 1
-                self.stats_label.configure(text=f"{self.screenshot_count} screenshots processed")
+                self.bus.post(self._count_screenshot)
                 return
             
             if result and result.get('signature'):
@@ -1302,43 +1438,80 @@ class SCSignatureScannerApp:
                 all_sigs = result.get('all_signatures', [])
                 
                 self._log(f"   Signature: {sig:,}")
-                if len(all_sigs) > 1:
-                    self._log(f"   All found: {all_sigs}")
+                targets = result.get('targets', [])
+                if targets:
+                    self._log(f"   Targets: {len(targets)}")
+                    for target in targets:
+                        x1, y1, x2, y2 = target.box
+                        best = target.matches[0].name if target.matches else "no match"
+                        self._log(f"   • {target.signature:,} at ({(x1 + x2) // 2}, {(y1 + y2) // 2}) → {best}")
+                elif len(all_sigs) > 1:
+                    self._log(f"   All found: {list(all_sigs)}")
                 self._log(f"   Matches: {len(matches)}")
                 
+                # Extra HUD readouts (if their regions are configured)
+                readouts = []
+                if result.get('mass'):
+                    readouts.append(f"mass {result['mass']:,.0f} kg (used for value)")
+                if result.get('instability') is not None:
+                    readouts.append(f"instability {result['instability']:g}")
+                if result.get('resistance') is not None:
+                    readouts.append(f"resistance {result['resistance']:g}%")
+                if readouts:
+                    self._log(f"   Readouts: {', '.join(readouts)}")
+                
                 # Show debug info
-                if self.debug_var.get() and result.get('debug'):
+                if self.scanner.debug_mode and result.get('debug'):
                     debug = result['debug']
                     self._log(f"   [DEBUG] Regions: {debug.get('regions_checked', 0)}")
                     for ocr in debug.get('raw_ocr_text', []):
                         text_preview = ocr['text'][:50] + '...' if len(ocr['text']) > 50 else ocr['text']
                         self._log(f"   [DEBUG] OCR ({ocr['region']}): {text_preview}")
                 
-                # Show overlay (must schedule on main thread - watchdog runs in background thread)
+                # Show overlay (on the Tk thread - scans finish on background threads)
                 if matches:
-                    self.root.after(0, lambda s=sig, m=matches: self._show_overlay(s, m))
+                    self.bus.post(self._show_overlay, sig, matches, result.get('prices_as_of'))
             else:
                 self._log("   No signature detected")
                 
                 # Show debug info even on failure
-                if self.debug_var.get() and self.scanner.last_debug_info:
+                if self.scanner.debug_mode and self.scanner.last_debug_info:
                     debug = self.scanner.last_debug_info
                     self._log(f"   [DEBUG] Regions checked: {debug.get('regions_checked', 0)}")
                     self._log(f"   [DEBUG] Check debug_output/ for images")
         
         # Update stats
+        self.bus.post(self._count_screenshot)
+    
+    def _count_screenshot(self):
+        """Count a processed screenshot and update the stats label (Tk thread)."""
         self.screenshot_count += 1
         self.stats_label.configure(text=f"{self.screenshot_count} screenshots processed")
     
-    def _show_overlay(self, sig: int, matches: list):
-        """Show the overlay popup (must be called from main thread)."""
+    def _get_overlay(self) -> OverlayPopup:
+        """Get the overlay (created once), updated with the current settings."""
         if not self.overlay:
             self.overlay = OverlayPopup(
+                self.root,
                 position=self.overlay_position,
                 duration=self.duration_var.get(),
                 scale=self.scale_var.get()
             )
-        self.overlay.show(sig, matches)
+        else:
+            self.overlay.position = self.overlay_position
+            self.overlay.duration = self.duration_var.get()
+            self.overlay.set_scale(self.scale_var.get())
+        return self.overlay
+    
+    def _prepare_overlay(self, rows: int):
+        """Create/update the overlay ahead of the result (must be called from main thread)."""
+        self._get_overlay().prepare(rows)
+    
+    def _show_overlay(self, sig: int, matches: list, prices_as_of: Optional[float] = None):
+        """Show the overlay popup (must be called from main thread)."""
+        show_ms = self._get_overlay().show(sig, matches, prices_as_of)
+        if self.scanner and self.scanner.debug_mode:
+            self._log(f"   [DEBUG] Overlay shown in {show_ms:.1f} ms")
     
     def _test_screenshot(self):
         """Test with a manually selected screenshot."""
@@ -1397,15 +1570,6 @@ class SCSignatureScannerApp:
     
     def _test_popup(self):
         """Show a test popup at current position."""
-        if hasattr(self, '_test_overlay') and self._test_overlay:
-            self._test_overlay.destroy()
-        
-        self._test_overlay = OverlayPopup(
-            position=self.overlay_position,
-            duration=self.duration_var.get(),
-            scale=self.scale_var.get()
-        )
-        
         # Test data for E-type asteroid with live UEX prices
         test_signature = 1900
 
@@ -1450,19 +1614,34 @@ class SCSignatureScannerApp:
             'composition': composition
         }]
         
-        self._test_overlay.show(test_signature, test_matches)
-        self._log(f"🔔 Test popup displayed")
+        show_ms = self._get_overlay().show(test_signature, test_matches)
+        self._log(f"🔔 Test popup displayed ({show_ms:.1f} ms)")
     
-    def _init_scanner(self):
-        """Initialize the signature scanner with database."""
+    def _load_database(self) -> Optional[SignatureScanner]:
+        """Create the scanner from the signature database (no UI - safe off the Tk thread)."""
         db_path = paths.get_data_path() / "combat_analyst_db.json"
-        
         if db_path.exists():
-            self.scanner = SignatureScanner(db_path)
+            return SignatureScanner(db_path)
+        return None
+    
+    def _init_scanner(self, scanner: Optional[SignatureScanner] = None):
+        """Initialize the signature scanner with database.
+        
+        Args:
+            scanner: Scanner already loaded in the background (loaded here if None)
+        """
+        if scanner is None:
+            scanner = self._load_database()
+        
+        if scanner:
+            self.scanner = scanner
+            # Learned crop tightening can be switched off in config.json
+            scanner.region_tuner.enabled = self.config.get('auto_tighten_region', True)
+            scanner.stream_png = self.config.get('stream_png_decode', True)
             self._log(f"✓ Signature database loaded")
         else:
             self._log("⚠ Signature database not found!")
-            self._log(f"  Expected: {db_path}")
+            self._log(f"  Expected: {paths.get_data_path() / 'combat_analyst_db.json'}")
     
     def _toggle_debug(self):
         """Toggle debug mode on/off."""
@@ -1481,6 +1660,17 @@ class SCSignatureScannerApp:
                 self._log("🔧 Debug mode disabled")
         self._save_config(show_message=False)
     
+    def _toggle_full_frame(self):
+        """Switch between the scan region and full-frame (radar) scanning."""
+        enabled = self.full_frame_var.get()
+        if self.scanner:
+            self.scanner.full_frame = enabled
+        if enabled:
+            self._log("🛰 Full-frame mode: every signature label on screen is read")
+        else:
+            self._log("🛰 Full-frame mode off: reading the scan region")
+        self._save_config(show_message=False)
+    
     def _open_debug_folder(self):
         """Open the debug output folder in file explorer."""
         if self.scanner:
@@ -1518,11 +1708,18 @@ class SCSignatureScannerApp:
         self._log(f"📁 Debug folder reset to default")
         self._save_config(show_message=False)
     
-    def _init_pricing(self):
-        """Initialize pricing system on startup."""
-        self._log("Loading pricing data...")
+    def _init_pricing(self, loaded: Optional[Tuple[bool, Optional[str]]] = None):
+        """Initialize pricing system on startup.
+        
+        Args:
+            loaded: Result of pricing.initialize_pricing() already run in the
+                background (run here if None)
+        """
+        if loaded is None:
+            self._log("Loading pricing data...")
+            loaded = pricing.initialize_pricing()
         
-        success, error = pricing.initialize_pricing()
+        success, error = loaded
         
         if success:
             manager = pricing.get_pricing_manager()
@@ -1531,12 +1728,31 @@ class SCSignatureScannerApp:
             self._log(f"  Systems: {', '.join(status['systems'])}")
             self._update_pricing_status()
             
+            if manager.is_stale():
+                self._log("  Prices are stale - refreshing in background")
+            
             # Set yield from selected refinery method
             yield_value = self._get_current_yield()
             pricing.set_refinery_yield(yield_value)
         else:
             self._log(f"⚠ Pricing failed: {error}")
             self._update_pricing_status()
+        
+        # Keep UEX prices and Regolith data fresh without blocking the UI
+        pricing.start_background_refresh(
+            on_update=lambda *args: self.bus.post(self._on_background_refresh, *args)
+        )
+    
+    def _on_background_refresh(self, source: str, success: bool, message: str):
+        """Handle a background data refresh (main thread)."""
+        name = "UEX pricing" if source == 'uex' else "Regolith data"
+        if success:
+            self._log(f"↻ {name} updated: {message}")
+        else:
+            self._log(f"⚠ Background {name} refresh failed: {message}")
+        self._update_pricing_status()
+        if source == 'regolith':
+            self._update_api_status()
     
     def _on_method_changed(self, event=None):
         """Handle refinery method selection change."""
@@ -1551,31 +1767,15 @@ class SCSignatureScannerApp:
         method = self.method_var.get()
         return self.refinery_methods.get(method, 0.5293)
     
-    def _check_for_updates(self):
-        """Check for updates in background thread."""
-        self._update_check_result = None
-        self._update_check_done = False
-
-        def check():
-            try:
-                self._update_check_result = version_checker.check_for_updates()
-            except Exception as e:
-                self._update_check_result = (False, None, None, str(e))
-            self._update_check_done = True
-
-        threading.Thread(target=check, daemon=True).start()
-
-        # Poll for result from main thread
-        self.root.after(500, self._poll_update_result)
-
-    def _poll_update_result(self):
-        """Poll for update check result from main thread."""
-        if not self._update_check_done:
-            # Keep polling
-            self.root.after(200, self._poll_update_result)
-            return
+    def _fetch_update_info(self) -> tuple:
+        """Check GitHub for updates (background thread, no UI)."""
+        try:
+            return version_checker.check_for_updates()
+        except Exception as e:
+            return (False, None, None, str(e))
 
-        result = self._update_check_result
+    def _handle_update_result(self, result: Optional[tuple]):
+        """Report the update check result (main thread)."""
         if result is None:
             self._log("⚠ Version check: no result")
             return
@@ -1655,6 +1855,7 @@ class SCSignatureScannerApp:
             import os
             webbrowser.open(download_url)
             dialog.destroy()
+            settings.flush_pending()  # os._exit skips atexit handlers
             try:
                 self.root.destroy()
             except:
@@ -1706,87 +1907,218 @@ class SCSignatureScannerApp:
             self.update_banner.pack(fill=tk.X, padx=15, pady=(0, 10), after=self.warning_banner)
     
     def _refresh_pricing(self):
-        """Refresh pricing data from UEX API."""
-        self._log("Refreshing pricing data...")
-        
-        success, error = pricing.refresh_pricing()
+        """Refresh pricing data from UEX API (in the background)."""
+        def work(handle: TaskHandle):
+            return pricing.refresh_pricing()
         
-        if success:
-            manager = pricing.get_pricing_manager()
-            status = manager.get_status()
-            self._log(f"✓ Pricing refreshed: {status['ore_count']} ores")
+        def done(result):
+            success, error = result
             self._update_pricing_status()
-            messagebox.showinfo("Pricing", f"Successfully loaded {status['ore_count']} ore prices")
+            if success:
+                status = pricing.get_pricing_manager().get_status()
+                self._log(f"✓ Pricing refreshed: {status['ore_count']} ores")
+                messagebox.showinfo("Pricing", f"Successfully loaded {status['ore_count']} ore prices")
+            else:
+                self._log(f"⚠ Refresh failed: {error}")
+                messagebox.showerror("Pricing Error", f"Failed to refresh pricing data:\n{error}")
+        
+        if self.tasks.submit('refresh_pricing', work, on_done=done, on_error=self._on_task_error):
+            self._log("Refreshing pricing data...")
         else:
-            self._log(f"⚠ Refresh failed: {error}")
-            self._update_pricing_status()
-            messagebox.showerror("Pricing Error", f"Failed to refresh pricing data:\n{error}")
+            self._log("Pricing refresh already in progress")
     
     def _change_api_key(self):
         """Allow user to change their API key."""
+        if self.tasks.is_running('change_api_key'):
+            self._log("API key validation already in progress")
+            return
+        
         cfg = self.config.load() or {}
         current_key = cfg.get('regolith_api_key', '')
         
         new_key = self._show_api_key_dialog(current_key)
         
-        if new_key and new_key != current_key:
-            # Validate the new key
-            api = regolith_api.get_api(new_key)
-            valid, message = api.validate_key()
-            
+        if not new_key or new_key == current_key:
+            return
+        
+        def work(handle: TaskHandle):
+            # Validate with a throwaway client so the active key stays in use
+            # until the new one is confirmed
+            return regolith_api.RegolithAPI(new_key).validate_key()
+        
+        def done(result):
+            self.change_key_btn.configure(state=tk.NORMAL)
+            valid, message = result
             if valid:
+                cfg = self.config.load() or {}
                 cfg['regolith_api_key'] = new_key
                 self.config.save(cfg)
+                regolith_api.get_api(new_key)
                 self.regolith_user = message
                 self._log(f"✓ API key updated: {message}")
                 self._update_api_status()
                 messagebox.showinfo("API Key", f"API key validated successfully!\n\nLogged in as: {message}")
+            elif valid is None:
+                self._log(f"⚠ Could not validate API key: {message}")
+                messagebox.showwarning("API Key", f"Could not validate the key right now:\n{message}")
             else:
                 self._log(f"⚠ API key invalid: {message}")
                 messagebox.showerror("Invalid Key", f"API key validation failed:\n{message}")
+        
+        def failed(error: Exception):
+            self.change_key_btn.configure(state=tk.NORMAL)
+            self._on_task_error(error)
+        
+        if self.tasks.submit('change_api_key', work, on_done=done, on_error=failed):
+            self.change_key_btn.configure(state=tk.DISABLED)
+            self._log("Validating new API key...")
     
     def _refresh_all_data(self):
-        """Refresh both UEX pricing and Regolith survey data."""
-        self._log("Refreshing all data...")
+        """Refresh both UEX pricing and Regolith survey data (in the background).
         
-        errors = []
+        Clicking Refresh again while a refresh is running cancels it
+        (after the request in flight completes).
+        """
+        if self.tasks.cancel('refresh_all'):
+            self._log("Cancelling refresh...")
+            self.refresh_all_btn.configure(state=tk.DISABLED)
+            return
         
-        # Refresh Regolith data
         cfg = self.config.load() or {}
         api_key = cfg.get('regolith_api_key', '')
         
-        if api_key:
-            api = regolith_api.get_api(api_key)
-            success, message = api.refresh_cache()
+        def work(handle: TaskHandle) -> list:
+            errors = []
+            
+            # Refresh Regolith data
+            if api_key:
+                handle.progress("Refreshing Regolith data...")
+                api = regolith_api.get_api(api_key)
+                success, message = api.refresh_cache()
+                if success:
+                    handle.progress(f"✓ Regolith data refreshed")
+                else:
+                    handle.progress(f"⚠ Regolith refresh failed: {message}")
+                    errors.append(f"Regolith: {message}")
+            else:
+                errors.append("Regolith: No API key configured")
+            
+            handle.check_cancelled()
+            
+            # Refresh UEX pricing
+            handle.progress("Refreshing UEX pricing...")
+            success, error = pricing.refresh_pricing()
             if success:
-                self._log(f"✓ Regolith data refreshed")
+                status = pricing.get_pricing_manager().get_status()
+                handle.progress(f"✓ UEX pricing refreshed: {status['ore_count']} ores")
             else:
-                self._log(f"⚠ Regolith refresh failed: {message}")
-                errors.append(f"Regolith: {message}")
-        else:
-            errors.append("Regolith: No API key configured")
+                handle.progress(f"⚠ UEX refresh failed: {error}")
+                errors.append(f"UEX: {error}")
+            
+            return errors
         
-        # Refresh UEX pricing
-        success, error = pricing.refresh_pricing()
-        if success:
-            manager = pricing.get_pricing_manager()
-            status = manager.get_status()
-            self._log(f"✓ UEX pricing refreshed: {status['ore_count']} ores")
-        else:
-            self._log(f"⚠ UEX refresh failed: {error}")
-            errors.append(f"UEX: {error}")
+        def finished():
+            self.refresh_all_btn.configure(text="🔄 Refresh", state=tk.NORMAL)
+            self._update_pricing_status()
+            self._update_api_status()
+        
+        def done(errors: list):
+            finished()
+            if errors:
+                messagebox.showwarning(
+                    "Partial Refresh",
+                    f"Some data sources failed to refresh:\n\n" + "\n".join(errors)
+                )
+            else:
+                messagebox.showinfo("Data Refreshed", "All data sources refreshed successfully!")
         
-        # Update UI
-        self._update_pricing_status()
-        self._update_api_status()
+        def cancelled():
+            finished()
+            self._log("Refresh cancelled")
+        
+        def failed(error: Exception):
+            finished()
+            self._on_task_error(error)
+        
+        handle = self.tasks.submit(
+            'refresh_all', work,
+            on_done=done, on_error=failed, on_progress=self._log, on_cancelled=cancelled
+        )
+        if handle:
+            self._log("Refreshing all data...")
+            self.refresh_all_btn.configure(text="✖ Cancel")
+    
+    def _analyze_video(self):
+        """List every signature in a recorded session (in the background).
+        
+        Clicking again while an analysis is running cancels it.
+        """
+        if self.tasks.cancel('video_analysis'):
+            self._log("Cancelling video analysis...")
+            return
         
-        if errors:
-            messagebox.showwarning(
-                "Partial Refresh",
-                f"Some data sources failed to refresh:\n\n" + "\n".join(errors)
+        if not self.scanner:
+            messagebox.showerror("Error", "Scanner not initialized")
+            return
+        available, error = self.scanner.is_ocr_available()
+        if not available:
+            messagebox.showerror("OCR Not Available", f"OCR engine not available:\n{error}")
+            return
+        
+        video_path = filedialog.askopenfilename(
+            title="Select Recorded Session",
+            filetypes=[
+                ("Video files", "*.mp4 *.mkv *.avi *.mov *.webm"),
+                ("All files", "*.*"),
+            ]
+        )
+        if not video_path:
+            return
+        video_path = Path(video_path)
+        sample_fps = self.config.get('video_sample_fps', video_analysis.DEFAULT_SAMPLE_FPS)
+        
+        def work(handle):
+            last_reported = [0.0]
+            
+            def progress(fraction: float):
+                # Report every 10% of the video
+                if fraction - last_reported[0] >= 0.1:
+                    last_reported[0] = fraction
+                    handle.progress(f"   {fraction:.0%} of {video_path.name}")
+            
+            return video_analysis.analyze_video(
+                video_path, self.scanner, sample_fps,
+                on_progress=progress, should_stop=lambda: handle.cancelled
             )
-        else:
-            messagebox.showinfo("Data Refreshed", "All data sources refreshed successfully!")
+        
+        def finished():
+            self.video_btn.configure(text="🎞  Analyze Video")
+        
+        def done(report):
+            finished()
+            for line in video_analysis.format_report(report):
+                self._log(line)
+        
+        def cancelled():
+            finished()
+            self._log("Video analysis cancelled")
+        
+        def failed(error):
+            finished()
+            self._on_task_error(error)
+        
+        handle = self.tasks.submit(
+            'video_analysis', work,
+            on_done=done, on_error=failed, on_progress=self._log, on_cancelled=cancelled
+        )
+        if handle:
+            self._log(f"🎞 Analyzing {video_path.name} at {sample_fps:g} samples/s...")
+            self.video_btn.configure(text="✖ Cancel Analysis")
+    
+    def _on_task_error(self, error: Exception):
+        """Report an unexpected error from a background task."""
+        self._log(f"⚠ Error: {error}")
+        messagebox.showerror("Error", f"Operation failed:\n{error}")
     
     def _update_api_status(self):
         """Update the API status labels."""
@@ -1858,7 +2190,7 @@ class SCSignatureScannerApp:
     
     def _clear_scan_region(self):
         """Clear the saved scan region."""
-        if region_selector.is_configured():
+        if region_selector.is_configured() or region_selector.load_anchor():
             region_selector.clear_region()
             self._update_region_label()
             self._log("📐 Scan region cleared")
@@ -1873,8 +2205,16 @@ class SCSignatureScannerApp:
             x1, y1, x2, y2 = region
             w = x2 - x1
             h = y2 - y1
+            text = f"({x1},{y1})→({x2},{y2}) [{w}×{h}]"
+            
+            # Other screenshot sizes / HUD anchor configured
+            extra = len(region_selector.list_profiles()) - 1
+            if extra > 0:
+                text += f" +{extra} size{'s' if extra > 1 else ''}"
+            if region_selector.load_anchor():
+                text += " ⚓"
             self.region_label.configure(
-                text=f"({x1},{y1})→({x2},{y2}) [{w}×{h}]",
+                text=text,
                 fg=RegolithTheme.COLORS['success']
             )
         else:
@@ -1884,12 +2224,9 @@ class SCSignatureScannerApp:
             )
     
     def _log(self, message: str):
-        """Add message to log display."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.configure(state=tk.NORMAL)
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.configure(state=tk.DISABLED)
+        """Add message to log display and log file (safe from any thread)."""
+        self.bus.log(message)
+        ui_bus.logger.info(message)
     
     def _load_config(self):
         """Load saved configuration."""
@@ -1904,6 +2241,9 @@ class SCSignatureScannerApp:
             self.duration_var.set(cfg.get('popup_duration', 10))
             self.scale_var.set(cfg.get('popup_scale', 1.0))
             self.debug_var.set(cfg.get('debug_mode', False))
+            self.full_frame_var.set(cfg.get('full_frame_mode', False))
+            if self.scanner:
+                self.scanner.full_frame = self.full_frame_var.get()
             
             # Load refinery method
             saved_method = cfg.get('refinery_method', 'Dinyx Solventation (Yield 52.93% - Speed: Slowest - Price: Low$)')
@@ -1943,6 +2283,7 @@ class SCSignatureScannerApp:
             'popup_scale': self.scale_var.get(),
             'refinery_method': self.method_var.get(),
             'debug_mode': self.debug_var.get(),
+            'full_frame_mode': self.full_frame_var.get(),
             'debug_folder': self.debug_folder_var.get(),
         })
         
@@ -1966,21 +2307,99 @@ class SCSignatureScannerApp:
         """Run the application."""
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # Step 1: Validate API key first (required for Regolith data)
-        if not self._validate_api_key_startup():
+        # Offline-first: with a key and a valid Regolith cache, start from the
+        # cache and validate the key in the background. Otherwise the key must
+        # be validated (and Regolith data fetched) before anything else.
+        validate_in_background = self._can_start_from_cache()
+        if not validate_in_background and not self._validate_api_key_startup():
             self.root.destroy()
             return
         
-        # Step 2: Initialize scanner with signature database
-        self._init_scanner()
+        self._start_startup_tasks(validate_in_background)
         
-        # Step 3: Load user config (after scanner exists so debug mode can be applied)
-        self._load_config()
+        self.root.mainloop()
+    
+    def _can_start_from_cache(self) -> bool:
+        """True if an API key is saved and the Regolith cache is still valid."""
+        cfg = self.config.load() or {}
+        api_key = cfg.get('regolith_api_key', '')
+        if not api_key:
+            return False
+        return regolith_api.get_api(api_key).is_cache_valid()
+    
+    def _start_startup_tasks(self, validate_in_background: bool):
+        """Run the remaining startup steps as a task graph.
+        
+        Background steps (*) overlap; UI steps run on the Tk thread once
+        their inputs are ready. The app is ready (can scan with cached data)
+        once scanner, settings and pricing are in place.
+        """
+        graph = StartupGraph(self.root)
+        
+        # Signature database* -> scanner -> settings (debug mode needs the scanner)
+        graph.add('database', self._load_database)
+        graph.add('scanner', lambda: self._init_scanner(graph.result('database')),
+                  deps=('database',), main_thread=True)
+        graph.add('settings', self._load_config, deps=('scanner',), main_thread=True)
+        
+        # Cached pricing data* -> pricing (yield comes from settings)
+        graph.add('pricing_cache', pricing.initialize_pricing)
+        graph.add('pricing', lambda: self._init_pricing(graph.result('pricing_cache')),
+                  deps=('pricing_cache', 'settings'), main_thread=True)
+        
+        # Not needed to scan
+        graph.add('ingest', self._start_ingest_server, deps=('settings',),
+                  main_thread=True, critical=False)
+        graph.add('update_check', self._fetch_update_info, critical=False)
+        graph.add('update_notice', lambda: self._handle_update_result(graph.result('update_check')),
+                  deps=('update_check',), main_thread=True, critical=False)
+        
+        if validate_in_background:
+            self._log("Validating Regolith.rocks API key in background...")
+            graph.add('key_check', lambda: regolith_api.get_api().validate_key(), critical=False)
+            graph.add('key_status', lambda: self._on_key_validated(graph.result('key_check')),
+                      deps=('key_check',), main_thread=True, critical=False)
+        
+        def on_ready(report: StartupReport):
+            self._log(f"⏱ Ready in {report.time_to_ready_ms:.0f} ms")
+        
+        def on_complete(report: StartupReport):
+            self.startup_report = report
+            self._log(f"⏱ Startup: {report.format()}")
+        
+        graph.start(on_ready=on_ready, on_complete=on_complete)
+    
+    def _start_ingest_server(self):
+        """Start the local ingestion API if enabled ("ingest_port" in config.json)."""
+        port = self.config.get('ingest_port', 0)
+        if not port or not self.scanner:
+            return
+        try:
+            self.ingest_server = IngestServer(self.scanner, port=port, on_result=self._on_scan_result)
+        except OSError as e:
+            self._log(f"⚠ Ingest API could not listen on port {port}: {e}")
+            return
+        self.ingest_server.start()
+        self._log(f"📡 Ingest API on http://127.0.0.1:{self.ingest_server.port}/scan")
+    
+    def _on_key_validated(self, result: Optional[Tuple[Optional[bool], str]]):
+        """Handle background API key validation (main thread)."""
+        valid, message = result or (None, "Validation did not complete")
+        
+        if valid:
+            self._log(f"✓ API key valid: {message}")
+            self.regolith_user = message
+            self._update_api_status()
+            return
         
-        # Step 4: Initialize pricing system (UEX)
-        self._init_pricing()
+        # Offline, quota or server trouble - keep working from the cache
+        if valid is None:
+            self._log(f"⚠ Could not validate API key ({message}) - using cached data")
+            return
         
-        self.root.mainloop()
+        self._log(f"⚠ API key invalid: {message}")
+        if not self._validate_api_key_startup():
+            self._log("⚠ No valid API key - Regolith data will not refresh")
     
     def _validate_api_key_startup(self) -> bool:
         """Validate API key on startup. Returns True if valid, False to exit."""
@@ -2004,6 +2423,9 @@ class SCSignatureScannerApp:
                     # Update UI status
                     self._update_api_status()
                     return True
+                elif valid is None:
+                    self._log(f"⚠ Could not validate API key: {message}")
+                    error_message = message
                 else:
                     self._log(f"⚠ API key invalid: {message}")
                     error_message = message
@@ -2022,10 +2444,11 @@ class SCSignatureScannerApp:
             self.config.save(cfg)
     
     def _validate_key_with_retry(self, api_key: str) -> tuple:
-        """Validate API key with one retry after 3 seconds on failure.
+        """Validate API key with one retry after 3 seconds if the API could not be reached.
         
         Returns:
-            Tuple of (is_valid, message)
+            Tuple of (is_valid, message) - is_valid is None if the API
+            stayed unreachable
         """
         self._log("Validating Regolith.rocks API key...")
         api = regolith_api.get_api(api_key)
@@ -2036,12 +2459,9 @@ class SCSignatureScannerApp:
         if valid:
             return True, message
         
-        # Check if it's a server/connection error (worth retrying)
-        retry_errors = ["server error", "timed out", "connect", "connection"]
-        should_retry = any(err in message.lower() for err in retry_errors)
-        
-        if not should_retry:
-            # Don't retry for auth errors like "Invalid API key"
+        # Only retry if the API could not be reached - not for auth errors
+        # like "Invalid API key"
+        if valid is not None:
             return False, message
         
         # Wait and retry
@@ -2056,7 +2476,7 @@ class SCSignatureScannerApp:
             self._log("Retry successful")
             return True, message
         else:
-            return False, f"{message} (after retry)"
+            return valid, f"{message} (after retry)"
     
     def _check_regolith_cache(self, api: regolith_api.RegolithAPI):
         """Check Regolith cache and refresh if needed."""
@@ -2267,7 +2687,18 @@ class SCSignatureScannerApp:
     def _on_close(self):
         """Handle window close."""
         self._stop_monitoring()
+        self._stop_live_scan()
+        if self.ingest_server:
+            self.ingest_server.stop()
         self._save_config(show_message=False)
+        settings.flush_pending()
+        self.tasks.shutdown()
+        pricing.stop_background_refresh()
+        if self.overlay:
+            self.overlay.destroy()
+        self.bus.stop()
+        if self._log_listener:
+            self._log_listener.stop()
         self.root.destroy()
 
 
@@ -17,10 +17,19 @@ class ScreenshotHandler(FileSystemEventHandler):
     
     VALID_EXTENSIONS = {'.png', '.jpg', '.jpeg', '.webp', '.bmp'}
     
-    def __init__(self, callback: Callable[[Path], None], ignore_files: Set[Path] = None):
+    def __init__(self, callback: Callable[[Path], None], ignore_files: Set[Path] = None,
+                 stream_png: bool = False):
+        """
+        Args:
+            callback: Called with each new screenshot
+            ignore_files: Files to skip
+            stream_png: Report PNGs as soon as they appear (the scanner
+                follows them while they are written, see png_stream.py)
+        """
         super().__init__()
         self.callback = callback
         self.ignore_files = ignore_files or set()
+        self.stream_png = stream_png
         self._processing = set()  # Prevent duplicate processing
     
     def on_created(self, event: FileCreatedEvent):
@@ -44,7 +53,8 @@ class ScreenshotHandler(FileSystemEventHandler):
         self._processing.add(filepath)
         
         # Wait for file to be fully written
-        self._wait_for_file(filepath)
+        if not (self.stream_png and filepath.suffix.lower() == '.png'):
+            self._wait_for_file(filepath)
         
         # Process
         try:
@@ -73,10 +83,12 @@ class ScreenshotHandler(FileSystemEventHandler):
 class ScreenshotMonitor:
     """Monitors a folder for new screenshots."""
     
-    def __init__(self, folder: str, callback: Callable[[Path], None], ignore_existing: Set[Path] = None):
+    def __init__(self, folder: str, callback: Callable[[Path], None], ignore_existing: Set[Path] = None,
+                 stream_png: bool = False):
         self.folder = Path(folder)
         self.callback = callback
         self.ignore_existing = ignore_existing or set()
+        self.stream_png = stream_png
         
         self.observer: Optional[Observer] = None
         self._running = False
@@ -88,7 +100,8 @@ class ScreenshotMonitor:
         
         handler = ScreenshotHandler(
             callback=self.callback,
-            ignore_files=self.ignore_existing
+            ignore_files=self.ignore_existing,
+            stream_png=self.stream_png
         )
         
         self.observer = Observer()
@@ -2,12 +2,40 @@
 """
 Overlay popup for SC Signature Scanner.
 Shows signature identification results on top of the game.
+
+The overlay window is built once under the main Tk root and reused:
+each result only updates label text/colors and shows or hides sections.
+Composition rows come from a pool that grows to the largest table seen,
+and fonts are cached Font objects that are resized in place when the
+scale changes.
 """
 
+import time
 import tkinter as tk
+import tkinter.font as tkfont
+from datetime import datetime
 from typing import List, Dict, Any, Optional, Tuple, Callable
 
 
+class _CompositionRow:
+    """Pooled widgets for one mineral row of the composition table."""
+    
+    def __init__(self, parent: tk.Frame, font: tkfont.Font):
+        self.frame = tk.Frame(parent)
+        self.name = tk.Label(self.frame, font=font, width=14, anchor=tk.W)
+        self.name.pack(side=tk.LEFT, padx=(5, 0))
+        self.prob = tk.Label(self.frame, font=font, width=6, anchor=tk.E)
+        self.prob.pack(side=tk.LEFT)
+        self.med_pct = tk.Label(self.frame, font=font, width=6, anchor=tk.E)
+        self.med_pct.pack(side=tk.LEFT)
+        self.value = tk.Label(self.frame, font=font, width=8, anchor=tk.E)
+        self.value.pack(side=tk.LEFT, padx=(0, 5))
+    
+    def set_background(self, bg: str):
+        for widget in (self.frame, self.name, self.prob, self.med_pct, self.value):
+            widget.configure(bg=bg)
+
+
 class OverlayPopup:
     """Always-on-top overlay popup for showing signature results."""
     
@@ -22,73 +50,131 @@ class OverlayPopup:
     MINING_COLOR = "#f0883e"  # Orange for mining
     SALVAGE_COLOR = "#a371f7" # Purple for salvage
     MUTED_COLOR = "#8b949e"   # Muted text
+    MONEY_COLOR = "#3fb950"   # Green for money
     
-    def __init__(self, position: Tuple[int, int] = None, duration: int = 10, scale: float = 1.0):
+    def __init__(self, parent: tk.Misc, position: Tuple[int, int] = None,
+                 duration: int = 10, scale: float = 1.0):
         """
         Initialize overlay.
         
         Args:
+            parent: Main Tk root (the overlay is a Toplevel under it)
             position: (x, y) tuple for top-left corner, or None for center
             duration: seconds to display
             scale: font/size scale factor (0.5 to 2.0)
         """
+        self.parent = parent
         self.position = position  # (x, y) tuple
         self.duration = duration
-        self.scale = max(0.5, min(2.0, scale))  # Clamp to valid range
-        self.window: Optional[tk.Toplevel] = None
+        self.scale = self._clamp_scale(scale)
         self._after_id = None
+        self._fonts: Dict[Tuple[str, int, str], tkfont.Font] = {}
+        self._rows: List[_CompositionRow] = []
+        self.last_show_ms: Optional[float] = None  # Time taken by the last show()
         
-        # Create hidden root if needed
-        self._root = tk.Tk()
-        self._root.withdraw()
+        self.window = tk.Toplevel(parent)
+        self.window.withdraw()
+        self.window.overrideredirect(True)  # No window decorations
+        self.window.attributes('-topmost', True)  # Always on top
+        self.window.attributes('-alpha', 0.95)  # Slight transparency
+        self.window.configure(bg=self.BG_COLOR)
+        
+        self._build()
+    
+    @staticmethod
+    def _clamp_scale(scale: float) -> float:
+        return max(0.5, min(2.0, scale))  # Clamp to valid range
     
     def set_position(self, x: int, y: int):
         """Set the overlay position."""
         self.position = (x, y)
     
-    def show(self, signature: int, matches: List[Dict[str, Any]]):
-        """Show the overlay with signature results."""
-        # Cancel any pending hide
-        if self._after_id and self.window:
-            try:
-                self.window.after_cancel(self._after_id)
-            except:
-                pass
+    def set_scale(self, scale: float):
+        """Change the scale factor (rebuilds the layout if it changed)."""
+        scale = self._clamp_scale(scale)
+        if scale == self.scale:
+            return
+        self.scale = scale
+        for (family, base_size, weight), font in self._fonts.items():
+            font.configure(size=int(base_size * scale))
+        
+        # Paddings are scaled too - rebuild the (cheap, static) layout once
+        for child in self.window.winfo_children():
+            child.destroy()
+        self._rows = []
+        self._build()
+    
+    @property
+    def is_visible(self) -> bool:
+        return self.window.winfo_viewable() == 1
+    
+    def prepare(self, rows: int = 0):
+        """Get ready for the next show() while the screenshot is scanned.
         
-        # Destroy existing window
-        if self.window:
-            self.window.destroy()
+        Grows the composition row pool and lets Tk settle the layout now,
+        so show() only has to fill in text.
         
-        # Create new overlay window
-        self.window = tk.Toplevel(self._root)
-        self.window.overrideredirect(True)  # No window decorations
-        self.window.attributes('-topmost', True)  # Always on top
-        self.window.attributes('-alpha', 0.95)  # Slight transparency
-        self.window.configure(bg=self.BG_COLOR)
+        Args:
+            rows: Composition rows the next result will probably need
+        """
+        self._ensure_rows(rows)
+        self.window.update_idletasks()
+    
+    def show(self, signature: int, matches: List[Dict[str, Any]],
+             prices_as_of: Optional[float] = None) -> float:
+        """Show the overlay with signature results.
         
-        # Build content
-        self._build_content(signature, matches)
+        Args:
+            signature: Detected signature value
+            matches: Match results
+            prices_as_of: Epoch seconds of the prices used for values
+            
+        Returns:
+            Time taken to update and display the overlay, in milliseconds
+        """
+        start = time.perf_counter()
         
-        # Position window
+        # Cancel any pending hide
+        if self._after_id:
+            self.window.after_cancel(self._after_id)
+            self._after_id = None
+        
+        self._update_content(signature, matches, prices_as_of)
+        
+        # Position window (requested size is known without mapping it)
         self.window.update_idletasks()
         self._position_window()
+        self.window.deiconify()
+        self.window.lift()
+        self.window.update_idletasks()
         
         # Schedule hide using Tkinter's after() - thread safe
-        self._after_id = self.window.after(self.duration * 1000, self._hide)
+        self._after_id = self.window.after(self.duration * 1000, self.hide)
+        
+        self.last_show_ms = (time.perf_counter() - start) * 1000
+        return self.last_show_ms
     
-    def _scaled_font(self, family: str, base_size: int, weight: str = "") -> tuple:
-        """Return a font tuple scaled by the scale factor."""
-        scaled_size = int(base_size * self.scale)
-        if weight:
-            return (family, scaled_size, weight)
-        return (family, scaled_size)
+    def _font(self, family: str, base_size: int, weight: str = "") -> tkfont.Font:
+        """Return a cached font scaled by the scale factor."""
+        key = (family, base_size, weight)
+        font = self._fonts.get(key)
+        if font is None:
+            font = tkfont.Font(
+                root=self.parent,
+                family=family,
+                size=int(base_size * self.scale),
+                weight=weight or "normal"
+            )
+            self._fonts[key] = font
+        return font
     
-    def _build_content(self, signature: int, matches: List[Dict[str, Any]]):
-        """Build the popup content."""
+    def _build(self):
+        """Create every widget once. Sections are shown/hidden per result."""
+        s = self.scale
         # Scaled padding (increased horizontal for wider popup)
-        pad_x = int(20 * self.scale)  # 10% wider
-        pad_y = int(12 * self.scale)
-        pad_small = int(8 * self.scale)
+        pad_x = int(20 * s)  # 10% wider
+        pad_y = int(12 * s)
+        pad_small = int(8 * s)
         
         # Outer border frame
         border = tk.Frame(self.window, bg=self.BORDER_COLOR, padx=1, pady=1)
@@ -96,45 +182,149 @@ class OverlayPopup:
         
         frame = tk.Frame(border, bg=self.BG_COLOR, padx=pad_x, pady=pad_y)
         frame.pack(fill=tk.BOTH, expand=True)
+        frame.columnconfigure(0, weight=1)
         
         # Header with signature value
-        header = tk.Label(
+        self.header_label = tk.Label(
             frame,
-            text=f"SIGNATURE: {signature:,}",
-            font=self._scaled_font("Consolas", 14, "bold"),
+            font=self._font("Consolas", 14, "bold"),
             fg=self.HEADER_COLOR,
             bg=self.BG_COLOR
         )
-        header.pack(anchor=tk.W, pady=(0, pad_small))
+        self.header_label.grid(row=0, column=0, sticky=tk.W, pady=(0, pad_small))
         
         # Separator
-        sep = tk.Frame(frame, height=int(2 * self.scale), bg=self.ACCENT_COLOR)
-        sep.pack(fill=tk.X, pady=(0, int(10 * self.scale)))
+        sep = tk.Frame(frame, height=int(2 * s), bg=self.ACCENT_COLOR)
+        sep.grid(row=1, column=0, sticky=tk.EW, pady=(0, int(10 * s)))
         
-        # Results
-        if not matches:
-            no_match = tk.Label(
-                frame,
-                text="No matches found",
-                font=self._scaled_font("Segoe UI", 10),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_COLOR
-            )
-            no_match.pack(anchor=tk.W)
-        else:
-            # Show first match with composition
-            match = matches[0]
-            self._add_match_with_composition(frame, match)
+        # Results: "no matches" or the first match with composition
+        self.no_match_label = tk.Label(
+            frame,
+            text="No matches found",
+            font=self._font("Segoe UI", 10),
+            fg=self.MUTED_COLOR,
+            bg=self.BG_COLOR
+        )
+        self.no_match_label.grid(row=2, column=0, sticky=tk.W)
         
-        # Close hint
-        hint = tk.Label(
+        self.match_frame = tk.Frame(frame, bg=self.BG_COLOR)
+        self.match_frame.grid(row=3, column=0, sticky=tk.EW, pady=int(3 * s))
+        self._build_match(self.match_frame)
+        
+        # Close hint (with price freshness)
+        self.hint_label = tk.Label(
             frame,
-            text=f"Auto-hide in {self.duration}s",
-            font=self._scaled_font("Segoe UI", 8),
+            font=self._font("Segoe UI", 8),
             fg=self.MUTED_COLOR,
             bg=self.BG_COLOR
         )
-        hint.pack(anchor=tk.E, pady=(int(10 * self.scale), 0))
+        self.hint_label.grid(row=4, column=0, sticky=tk.E, pady=(int(10 * s), 0))
+    
+    def _build_match(self, container: tk.Frame):
+        """Create the widgets for a match with mineral composition breakdown."""
+        s = self.scale
+        container.columnconfigure(0, weight=1)
+        
+        # Header row: Icon + Name + Value
+        header_row = tk.Frame(container, bg=self.BG_COLOR)
+        header_row.grid(row=0, column=0, sticky=tk.EW, pady=(0, int(3 * s)))
+        
+        self.name_label = tk.Label(
+            header_row,
+            font=self._font("Segoe UI", 12, "bold"),
+            bg=self.BG_COLOR,
+            anchor=tk.W
+        )
+        self.name_label.pack(side=tk.LEFT)
+        
+        # Estimated value
+        self.value_label = tk.Label(
+            header_row,
+            font=self._font("Consolas", 11, "bold"),
+            fg=self.MONEY_COLOR,
+            bg=self.BG_COLOR
+        )
+        
+        # Mining method indicator
+        self.method_label = tk.Label(
+            container,
+            font=self._font("Segoe UI", 9),
+            bg=self.BG_COLOR,
+            anchor=tk.W
+        )
+        self.method_label.grid(row=1, column=0, sticky=tk.W, pady=(0, int(5 * s)))
+        
+        # Single mineral deposit - possible minerals
+        self.info_frame = tk.Frame(container, bg=self.BG_LIGHT)
+        self.info_frame.grid(row=2, column=0, sticky=tk.EW, pady=(int(5 * s), 0))
+        
+        self.info_title_label = tk.Label(
+            self.info_frame,
+            text="100% purity - one of:",
+            font=self._font("Consolas", 9),
+            fg=self.MUTED_COLOR,
+            bg=self.BG_LIGHT,
+            padx=10
+        )
+        self.info_minerals_label = tk.Label(
+            self.info_frame,
+            font=self._font("Consolas", 10),
+            fg=self.MONEY_COLOR,
+            bg=self.BG_LIGHT,
+            padx=10
+        )
+        self.info_single_label = tk.Label(
+            self.info_frame,
+            text="100% single mineral purity",
+            font=self._font("Consolas", 10),
+            fg=self.MONEY_COLOR,
+            bg=self.BG_LIGHT,
+            padx=10,
+            pady=5
+        )
+        
+        # Composition table header
+        self.table_header = tk.Frame(container, bg=self.BG_LIGHT)
+        self.table_header.grid(row=3, column=0, sticky=tk.EW, pady=(int(5 * s), 0))
+        
+        header_font = self._font("Consolas", 9, "bold")
+        for text, width, anchor, padx in (
+            ("Mineral", 14, tk.W, (5, 0)),
+            ("Prob", 6, tk.E, 0),
+            ("Med%", 6, tk.E, 0),
+            ("Value", 8, tk.E, (0, 5)),
+        ):
+            tk.Label(
+                self.table_header,
+                text=text,
+                font=header_font,
+                fg=self.MUTED_COLOR,
+                bg=self.BG_LIGHT,
+                width=width,
+                anchor=anchor
+            ).pack(side=tk.LEFT, padx=padx)
+        
+        # Table rows (pooled)
+        self.table = tk.Frame(container, bg=self.BG_COLOR)
+        self.table.grid(row=4, column=0, sticky=tk.EW)
+        self.table.columnconfigure(0, weight=1)
+        
+        # Helper text
+        self.helper_frame = tk.Frame(container, bg=self.BG_COLOR)
+        self.helper_frame.grid(row=5, column=0, sticky=tk.W, pady=(int(5 * s), 0))
+        
+        for text in (
+            "Prob = Probability that mineral will spawn",
+            "Med% = Median amount of mineral if spawned",
+            "Value = Average value of mineral if spawned",
+        ):
+            tk.Label(
+                self.helper_frame,
+                text=text,
+                font=self._font("Segoe UI", 8),
+                fg=self.MUTED_COLOR,
+                bg=self.BG_COLOR
+            ).pack(anchor=tk.W)
     
     def _format_value(self, value: int) -> str:
         """Format aUEC value with K/M suffix."""
@@ -144,413 +334,189 @@ class OverlayPopup:
             return f"{value / 1_000:.0f}K"
         return str(value)
     
-    def _add_match_with_composition(self, parent: tk.Frame, match: Dict[str, Any]):
-        """Add a match row with mineral composition breakdown."""
-        # Main container
-        container = tk.Frame(parent, bg=self.BG_COLOR)
-        container.pack(fill=tk.X, pady=int(3 * self.scale))
+    def _match_style(self, match: Dict[str, Any]) -> Tuple[str, str, Optional[str], str]:
+        """Pick display style for a match.
         
-        # Rock type name and icon
+        Returns:
+            Tuple of (color, icon, mining method text or None, method color)
+        """
         match_type = match.get('type', 'unknown')
         category = match.get('category', '')
         
         # Match categories from scanner.py
         if category == 'space_deposit' or match_type == 'space_deposits':
-            color = self.MINING_COLOR
-            icon = "🪨"  # Asteroid
+            return self.MINING_COLOR, "🪨", "🚀 Ship Mining (mixed composition)", self.SHIP_COLOR  # Asteroid
         elif category == 'surface_deposit' or match_type == 'surface_deposits':
-            color = self.MINING_COLOR
-            icon = "⛏️"  # Surface deposit
+            return self.MINING_COLOR, "⛏️", "🚀 Ship Mining (mixed composition)", self.SHIP_COLOR
         elif match_type == 'ground_deposit' or category == 'ground_deposits':
-            variant = match.get('variant', '')
-            if variant == 'small':
-                color = "#a371f7"  # Purple for hand mining
-                icon = "💎"
-            else:
-                color = "#a371f7"  # Purple for vehicle mining  
-                icon = "🚗"
+            # Purple for hand / vehicle mining
+            if match.get('variant', '') == 'small':
+                return "#a371f7", "💎", "💎 Hand Mining (100% single mineral)", "#a371f7"
+            return "#a371f7", "🚗", "🚗 ROC Mining (100% single mineral)", "#a371f7"
         elif match_type == 'salvage':
-            color = self.SALVAGE_COLOR
-            icon = "🔧"
+            return self.SALVAGE_COLOR, "🔧", "🔧 Hull Scraping", self.SALVAGE_COLOR
         elif match_type == 'known':
-            color = self.MINING_COLOR
-            icon = "📡"
+            return self.MINING_COLOR, "📡", None, self.MUTED_COLOR
+        return self.FG_COLOR, "❓", None, self.MUTED_COLOR
+    
+    def _update_content(self, signature: int, matches: List[Dict[str, Any]],
+                        prices_as_of: Optional[float] = None):
+        """Fill the existing widgets with a result."""
+        self.header_label.configure(text=f"SIGNATURE: {signature:,}")
+        
+        if not matches:
+            self.no_match_label.grid()
+            self.match_frame.grid_remove()
         else:
-            color = self.FG_COLOR
-            icon = "❓"
+            self.no_match_label.grid_remove()
+            self.match_frame.grid()
+            # Show first match with composition
+            self._update_match(matches[0])
         
-        # Header row: Icon + Name + Value
-        header_row = tk.Frame(container, bg=self.BG_COLOR)
-        header_row.pack(fill=tk.X, pady=(0, int(3 * self.scale)))
+        hint_text = f"Auto-hide in {self.duration}s"
+        if prices_as_of:
+            stamp = datetime.fromtimestamp(prices_as_of).strftime("%H:%M")
+            hint_text = f"Prices as of {stamp}  ·  {hint_text}"
+        self.hint_label.configure(text=hint_text)
+    
+    def _update_match(self, match: Dict[str, Any]):
+        """Fill the match section (name, value, method, composition)."""
+        color, icon, mining_method, method_color = self._match_style(match)
         
         name = match.get('name', 'Unknown')
-        name_label = tk.Label(
-            header_row,
-            text=f"{icon} {name}",
-            font=self._scaled_font("Segoe UI", 12, "bold"),
-            fg=color,
-            bg=self.BG_COLOR,
-            anchor=tk.W
-        )
-        name_label.pack(side=tk.LEFT)
+        self.name_label.configure(text=f"{icon} {name}", fg=color)
         
-        # Estimated value
         est_value = match.get('est_value')
         if est_value:
-            value_label = tk.Label(
-                header_row,
-                text=f"~{self._format_value(est_value)} aUEC",
-                font=self._scaled_font("Consolas", 11, "bold"),
-                fg="#3fb950",  # Green for money
-                bg=self.BG_COLOR
-            )
-            value_label.pack(side=tk.RIGHT)
-        
-        # Mining method indicator
-        if category == 'space_deposit' or match_type == 'space_deposits':
-            mining_method = "🚀 Ship Mining (mixed composition)"
-            method_color = self.SHIP_COLOR
-        elif category == 'surface_deposit' or match_type == 'surface_deposits':
-            mining_method = "🚀 Ship Mining (mixed composition)"
-            method_color = self.SHIP_COLOR
-        elif match_type == 'ground_deposit' or category == 'ground_deposits':
-            variant = match.get('variant', '')
-            if variant == 'small':
-                mining_method = "💎 Hand Mining (100% single mineral)"
-                method_color = "#a371f7"  # Purple
-            else:
-                mining_method = "🚗 ROC Mining (100% single mineral)"
-                method_color = "#a371f7"  # Purple
-        elif match_type == 'salvage':
-            mining_method = "🔧 Hull Scraping"
-            method_color = self.SALVAGE_COLOR
-        elif match_type == 'known':
-            mining_method = None
-            method_color = self.MUTED_COLOR
+            self.value_label.configure(text=f"~{self._format_value(est_value)} aUEC")
+            self.value_label.pack(side=tk.RIGHT)
         else:
-            mining_method = None
-            method_color = self.MUTED_COLOR
+            self.value_label.pack_forget()
         
         if mining_method:
-            method_row = tk.Frame(container, bg=self.BG_COLOR)
-            method_row.pack(fill=tk.X, pady=(0, int(5 * self.scale)))
-            
-            method_label = tk.Label(
-                method_row,
-                text=mining_method,
-                font=self._scaled_font("Segoe UI", 9),
-                fg=method_color,
-                bg=self.BG_COLOR,
-                anchor=tk.W
-            )
-            method_label.pack(side=tk.LEFT)
+            self.method_label.configure(text=mining_method, fg=method_color)
+            self.method_label.grid()
+        else:
+            self.method_label.grid_remove()
         
         # Composition table (only for mixed composition deposits)
-        composition = match.get('composition', [])
+        composition = match.get('composition') or []
         single_mineral = match.get('single_mineral', False)
         
         if single_mineral:
-            # Single mineral deposit - show possible minerals
-            possible_minerals = match.get('possible_minerals', [])
-            info_row = tk.Frame(container, bg=self.BG_LIGHT)
-            info_row.pack(fill=tk.X, pady=(int(5 * self.scale), 0))
-            
-            if possible_minerals:
-                minerals_text = ", ".join(possible_minerals[:5])  # Show first 5
-                if len(possible_minerals) > 5:
-                    minerals_text += f" (+{len(possible_minerals) - 5} more)"
-                tk.Label(
-                    info_row,
-                    text=f"100% purity - one of:",
-                    font=self._scaled_font("Consolas", 9),
-                    fg=self.MUTED_COLOR,
-                    bg=self.BG_LIGHT,
-                    padx=10
-                ).pack(anchor=tk.W, pady=(5, 0))
-                tk.Label(
-                    info_row,
-                    text=minerals_text,
-                    font=self._scaled_font("Consolas", 10),
-                    fg="#3fb950",
-                    bg=self.BG_LIGHT,
-                    padx=10
-                ).pack(anchor=tk.W, pady=(0, 5))
-            else:
-                tk.Label(
-                    info_row,
-                    text="100% single mineral purity",
-                    font=self._scaled_font("Consolas", 10),
-                    fg="#3fb950",
-                    bg=self.BG_LIGHT,
-                    padx=10,
-                    pady=5
-                ).pack(anchor=tk.W)
-            
+            self._update_single_mineral(match.get('possible_minerals') or [])
+            self.info_frame.grid()
+            self._show_table(False)
+            self._fill_rows([])
         elif composition:
-            # Table header
-            table_header = tk.Frame(container, bg=self.BG_LIGHT)
-            table_header.pack(fill=tk.X, pady=(int(5 * self.scale), 0))
-            
-            tk.Label(
-                table_header,
-                text="Mineral",
-                font=self._scaled_font("Consolas", 9, "bold"),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_LIGHT,
-                width=14,
-                anchor=tk.W
-            ).pack(side=tk.LEFT, padx=(5, 0))
-            
-            tk.Label(
-                table_header,
-                text="Prob",
-                font=self._scaled_font("Consolas", 9, "bold"),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_LIGHT,
-                width=6,
-                anchor=tk.E
-            ).pack(side=tk.LEFT)
-            
-            tk.Label(
-                table_header,
-                text="Med%",
-                font=self._scaled_font("Consolas", 9, "bold"),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_LIGHT,
-                width=6,
-                anchor=tk.E
-            ).pack(side=tk.LEFT)
+            self.info_frame.grid_remove()
+            self._show_table(True)
+            self._fill_rows(composition)
+        else:
+            self.info_frame.grid_remove()
+            self._show_table(False)
+            self._fill_rows([])
+    
+    def _update_single_mineral(self, possible_minerals):
+        """Fill the single-mineral info box."""
+        for label in (self.info_title_label, self.info_minerals_label, self.info_single_label):
+            label.pack_forget()
+        
+        if possible_minerals:
+            minerals_text = ", ".join(possible_minerals[:5])  # Show first 5
+            if len(possible_minerals) > 5:
+                minerals_text += f" (+{len(possible_minerals) - 5} more)"
+            self.info_minerals_label.configure(text=minerals_text)
+            self.info_title_label.pack(anchor=tk.W, pady=(5, 0))
+            self.info_minerals_label.pack(anchor=tk.W, pady=(0, 5))
+        else:
+            self.info_single_label.pack(anchor=tk.W)
+    
+    def _show_table(self, visible: bool):
+        for widget in (self.table_header, self.table, self.helper_frame):
+            if visible:
+                widget.grid()
+            else:
+                widget.grid_remove()
+    
+    def _fill_rows(self, composition):
+        """Fill pooled composition rows (show ALL minerals), hiding the rest."""
+        self._ensure_rows(len(composition))
+        
+        for i, row in enumerate(self._rows):
+            if i >= len(composition):
+                row.frame.grid_remove()
+                continue
             
-            tk.Label(
-                table_header,
-                text="Value",
-                font=self._scaled_font("Consolas", 9, "bold"),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_LIGHT,
-                width=8,
-                anchor=tk.E
-            ).pack(side=tk.LEFT, padx=(0, 5))
+            ore = composition[i]
+            row.set_background(self.BG_LIGHT if i % 2 == 0 else self.BG_COLOR)
             
-            # Table rows (show ALL minerals)
-            for i, ore in enumerate(composition):
-                row_bg = self.BG_LIGHT if i % 2 == 0 else self.BG_COLOR
-                row = tk.Frame(container, bg=row_bg)
-                row.pack(fill=tk.X)
-                
-                # Color code by UEX price per SCU
-                ore_price = ore.get('price', 0)
-                ore_value = ore.get('value', 0)
-                
-                if ore_price >= 25000:
-                    ore_color = "#3fb950"      # Green - premium
-                elif ore_price >= 10000:
-                    ore_color = "#f0883e"      # Orange - medium
-                else:
-                    ore_color = "#f85149"      # Red - low
-                
-                # Mineral name
-                tk.Label(
-                    row,
-                    text=ore.get('name', '?'),
-                    font=self._scaled_font("Consolas", 9),
-                    fg=ore_color,
-                    bg=row_bg,
-                    width=14,
-                    anchor=tk.W
-                ).pack(side=tk.LEFT, padx=(5, 0))
-                
-                # Probability (grey)
-                prob = ore.get('prob', 0)
-                prob_text = f"{prob:.0%}" if prob <= 1 else f"{prob:.1f}x"
-                tk.Label(
-                    row,
-                    text=prob_text,
-                    font=self._scaled_font("Consolas", 9),
-                    fg=self.MUTED_COLOR,
-                    bg=row_bg,
-                    width=6,
-                    anchor=tk.E
-                ).pack(side=tk.LEFT)
-                
-                # Median percentage (grey)
-                med_pct = ore.get('medPct', 0)
-                tk.Label(
-                    row,
-                    text=f"{med_pct:.0%}",
-                    font=self._scaled_font("Consolas", 9),
-                    fg=self.MUTED_COLOR,
-                    bg=row_bg,
-                    width=6,
-                    anchor=tk.E
-                ).pack(side=tk.LEFT)
-                
-                # Value
-                value_text = self._format_value(ore_value) if ore_value > 0 else "-"
-                tk.Label(
-                    row,
-                    text=value_text,
-                    font=self._scaled_font("Consolas", 9),
-                    fg="#3fb950" if ore_value > 0 else self.MUTED_COLOR,
-                    bg=row_bg,
-                    width=8,
-                    anchor=tk.E
-                ).pack(side=tk.LEFT, padx=(0, 5))
+            # Color code by UEX price per SCU
+            ore_price = ore.get('price', 0)
+            ore_value = ore.get('value', 0)
             
-            # Helper text
-            helper_frame = tk.Frame(container, bg=self.BG_COLOR)
-            helper_frame.pack(anchor=tk.W, pady=(int(5 * self.scale), 0))
+            if ore_price >= 25000:
+                ore_color = "#3fb950"      # Green - premium
+            elif ore_price >= 10000:
+                ore_color = "#f0883e"      # Orange - medium
+            else:
+                ore_color = "#f85149"      # Red - low
             
-            tk.Label(
-                helper_frame,
-                text="Prob = Probability that mineral will spawn",
-                font=self._scaled_font("Segoe UI", 8),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_COLOR
-            ).pack(anchor=tk.W)
+            # Probability / median percentage (grey)
+            prob = ore.get('prob', 0)
+            prob_text = f"{prob:.0%}" if prob <= 1 else f"{prob:.1f}x"
+            med_pct = ore.get('medPct', 0)
             
-            tk.Label(
-                helper_frame,
-                text="Med% = Median amount of mineral if spawned",
-                font=self._scaled_font("Segoe UI", 8),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_COLOR
-            ).pack(anchor=tk.W)
-            
-            tk.Label(
-                helper_frame,
-                text="Value = Average value of mineral if spawned",
-                font=self._scaled_font("Segoe UI", 8),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_COLOR
-            ).pack(anchor=tk.W)
-    
-    def _add_match_row(self, parent: tk.Frame, rank: int, match: Dict[str, Any]):
-        """Add a single match row."""
-        row = tk.Frame(parent, bg=self.BG_COLOR)
-        row.pack(fill=tk.X, pady=int(3 * self.scale))
-        
-        # Determine color based on type
-        match_type = match.get('type', 'unknown')
-        category = match.get('category', '')
-        
-        if match_type == 'ship':
-            color = self.SHIP_COLOR
-            icon = "🚀"
-        elif match_type in ('space_deposits', 'surface_deposits', 'known') or category in ('space_deposit', 'surface_deposit'):
-            color = self.MINING_COLOR
-            icon = "⛏️"
-        elif match_type == 'ground_deposit' or category == 'ground_deposits':
-            color = "#a371f7"
-            icon = "💎"
-        elif match_type == 'salvage':
-            color = self.SALVAGE_COLOR
-            icon = "🔧"
-        else:
-            color = self.FG_COLOR
-            icon = "❓"
-        
-        # Rank
-        rank_label = tk.Label(
-            row,
-            text=f"{rank}.",
-            font=self._scaled_font("Consolas", 10),
-            fg=self.MUTED_COLOR,
-            bg=self.BG_COLOR,
-            width=3
-        )
-        rank_label.pack(side=tk.LEFT)
-        
-        # Icon and name
-        name = match.get('name', 'Unknown')
-        confidence = match.get('confidence', 0)
-        
-        name_text = f"{icon} {name}"
-        if match_type == 'ship' and match.get('facing'):
-            name_text += f" ({match['facing']})"
-        
-        name_label = tk.Label(
-            row,
-            text=name_text,
-            font=self._scaled_font("Segoe UI", 10),
-            fg=color,
-            bg=self.BG_COLOR,
-            anchor=tk.W
-        )
-        name_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        
-        # Detail column (count/confidence)
-        if match_type in ('space_deposits', 'surface_deposits', 'ground_deposit', 'known') or category in ('space_deposit', 'surface_deposit', 'ground_deposits'):
-            count = match.get('count', 1)
-            detail = f"×{count}" if count > 1 else ""
-        elif match_type == 'salvage':
-            panels = match.get('panels', 1)
-            detail = f"{panels} panels"
-        else:
-            detail = f"{confidence:.0%}" if confidence else ""
-        
-        # Estimated value (for resources, not salvage - panels vary in size)
-        est_value = match.get('est_value')
-        if est_value and match_type != 'salvage':
-            value_label = tk.Label(
-                row,
-                text=f"Est value: {self._format_value(est_value)}",
-                font=self._scaled_font("Consolas", 9),
-                fg="#3fb950",  # Green for money
-                bg=self.BG_COLOR
-            )
-            value_label.pack(side=tk.RIGHT, padx=(5, 0))
-        
-        if detail:
-            detail_label = tk.Label(
-                row,
-                text=detail,
-                font=self._scaled_font("Consolas", 9),
-                fg=self.MUTED_COLOR,
-                bg=self.BG_COLOR
+            row.name.configure(text=ore.get('name', '?'), fg=ore_color)
+            row.prob.configure(text=prob_text, fg=self.MUTED_COLOR)
+            row.med_pct.configure(text=f"{med_pct:.0%}", fg=self.MUTED_COLOR)
+            row.value.configure(
+                text=self._format_value(ore_value) if ore_value > 0 else "-",
+                fg=self.MONEY_COLOR if ore_value > 0 else self.MUTED_COLOR
             )
-            detail_label.pack(side=tk.RIGHT)
+            row.frame.grid()
+    
+    def _ensure_rows(self, count: int):
+        """Grow the row pool to at least count rows (new rows start hidden)."""
+        font = self._font("Consolas", 9)
+        while len(self._rows) < count:
+            row = _CompositionRow(self.table, font)
+            row.frame.grid(row=len(self._rows), column=0, sticky=tk.EW)
+            row.frame.grid_remove()
+            self._rows.append(row)
     
     def _position_window(self):
         """Position the window based on settings."""
         if self.position:
             # Use saved position
             x, y = self.position
-            self.window.geometry(f"+{x}+{y}")
         else:
             # Default to center
             screen_width = self.window.winfo_screenwidth()
             screen_height = self.window.winfo_screenheight()
-            window_width = self.window.winfo_width()
-            window_height = self.window.winfo_height()
-            x = (screen_width - window_width) // 2
-            y = (screen_height - window_height) // 2
-            self.window.geometry(f"+{x}+{y}")
+            x = (screen_width - self.window.winfo_reqwidth()) // 2
+            y = (screen_height - self.window.winfo_reqheight()) // 2
+        self.window.geometry(f"+{x}+{y}")
     
-    def _hide(self):
-        """Hide the overlay."""
-        if self.window:
+    def hide(self):
+        """Hide the overlay (kept for reuse)."""
+        if self._after_id:
             try:
-                self.window.destroy()
-            except:
+                self.window.after_cancel(self._after_id)
+            except tk.TclError:
                 pass
-            self.window = None
+            self._after_id = None
+        try:
+            self.window.withdraw()
+        except tk.TclError:
+            pass
     
     def destroy(self):
         """Cleanup resources."""
-        if self._after_id and self.window:
-            try:
-                self.window.after_cancel(self._after_id)
-            except:
-                pass
-        if self.window:
-            try:
-                self.window.destroy()
-            except:
-                pass
-            self.window = None
+        self.hide()
         try:
-            self._root.destroy()
-        except:
+            self.window.destroy()
+        except tk.TclError:
             pass
 
 
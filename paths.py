@@ -53,3 +53,8 @@ def get_debug_path() -> Path:
     Returns a folder next to the executable (or script) for bug reports.
     """
     return get_user_data_path() / "SignatureScannerBugreport"
+
+
+def get_log_path() -> Path:
+    """Get the folder for log files."""
+    return get_user_data_path() / "logs"
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Pipelined scan engine for SC Signature Scanner.
+
+Runs each scan stage (decode, preprocess, recognize, valuate) on its own
+thread, connected by bounded queues. While screenshot N is in OCR,
+screenshot N+1 is already being decoded and enhanced, and N-1 is being
+valued. Results are delivered in submission order.
+
+Per-stage occupancy (busy time / elapsed time) shows which stage is the
+bottleneck: the stage closest to 100% limits throughput.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from results import ScanResult
+
+
+# Bounded queue size between stages - enough to absorb a PrintScreen burst
+# without holding many decoded screenshots in memory
+DEFAULT_QUEUE_SIZE = 2
+POLL_INTERVAL = 0.1  # Seconds between abort checks while a stage waits on a queue
+
+_STOP = object()  # Sentinel passed down the pipeline on shutdown
+
+
+@dataclass
+class StageMetrics:
+    """Timing counters for one pipeline stage."""
+    name: str
+    processed: int = 0
+    busy: float = 0.0      # Seconds spent running the stage
+    starved: float = 0.0   # Seconds waiting for input
+    blocked: float = 0.0   # Seconds waiting for room in the next queue
+    started: float = 0.0
+    queue_depth: int = 0   # Items waiting in this stage's input queue
+
+    @property
+    def occupancy(self) -> float:
+        """Fraction of wall time this stage was busy (0.0 - 1.0)."""
+        elapsed = time.perf_counter() - self.started if self.started else 0.0
+        return self.busy / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def avg_ms(self) -> float:
+        """Average stage time per item in milliseconds."""
+        return self.busy / self.processed * 1000 if self.processed else 0.0
+
+
+class ScanPipeline:
+    """Stage-per-thread scan engine around a SignatureScanner."""
+
+    def __init__(self, scanner, on_result: Callable[[Path, ScanResult], None],
+                 queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Args:
+            scanner: SignatureScanner providing new_context/scan_stages/run_stage/finish
+            on_result: Called with (image_path, result) on the last stage's thread
+            queue_size: Capacity of each inter-stage queue
+        """
+        self.scanner = scanner
+        self.on_result = on_result
+        self.queue_size = queue_size
+
+        self._stages = scanner.scan_stages()
+        self._queues: List[queue.Queue] = []
+        self._threads: List[threading.Thread] = []
+        self.metrics: Dict[str, StageMetrics] = {}
+        self._running = False
+        self._abort = threading.Event()  # Drop queued scans and exit now
+
+    def start(self):
+        """Start the stage threads."""
+        if self._running:
+            return
+
+        # One input queue per stage
+        self._queues = [queue.Queue(maxsize=self.queue_size) for _ in self._stages]
+        self.metrics = {name: StageMetrics(name) for name, _ in self._stages}
+        self._threads = []
+        self._abort.clear()
+
+        for index, (name, stage) in enumerate(self._stages):
+            thread = threading.Thread(
+                target=self._run_stage,
+                args=(index, name, stage),
+                name=f"ScanPipeline-{name}",
+                daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+        self._running = True
+
+    def stop(self, timeout: float = 5.0):
+        """Finish queued scans and stop the stage threads.
+
+        Waits at most timeout seconds. If the first queue is still full by
+        then (e.g. a screenshot burst), queued scans are dropped instead and
+        reported to on_result as failed.
+        """
+        if not self._running:
+            return
+        self._running = False
+        deadline = time.monotonic() + timeout
+        try:
+            self._queues[0].put(_STOP, timeout=timeout)
+        except queue.Full:
+            self._abort.set()
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+        if self._abort.is_set():
+            self._drain()
+
+    def submit(self, image_path: Path, timeout: Optional[float] = None) -> bool:
+        """Queue a screenshot for scanning.
+
+        Blocks while the first stage is full (back-pressure on the caller).
+
+        Returns:
+            False if the pipeline is stopped or the timeout expired
+        """
+        if not self._running:
+            return False
+        available, error = self.scanner.is_ocr_available()
+        if not available:
+            self.on_result(image_path, ScanResult(error=f'OCR not available: {error}'))
+            return True
+        ctx = self.scanner.new_context(image_path)
+        try:
+            self._queues[0].put(ctx, timeout=timeout)
+        except queue.Full:
+            return False
+        if self._abort.is_set():
+            self._drain()  # stop() may have drained the queue already
+        return True
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def format_metrics(self) -> str:
+        """One-line summary of per-stage occupancy and average time."""
+        parts = []
+        for index, m in enumerate(self.metrics.values()):
+            m.queue_depth = self._queues[index].qsize() if self._queues else 0
+            queued = f", {m.queue_depth} queued" if m.queue_depth else ""
+            parts.append(f"{m.name} {m.occupancy:.0%} ({m.avg_ms:.0f}ms{queued})")
+        return " | ".join(parts)
+
+    def _run_stage(self, index: int, name: str, stage: Callable):
+        """Stage worker loop."""
+        inbox = self._queues[index]
+        outbox = self._queues[index + 1] if index + 1 < len(self._queues) else None
+        metrics = self.metrics[name]
+        metrics.started = time.perf_counter()
+
+        while True:
+            wait_start = time.perf_counter()
+            ctx = self._get(inbox)
+            metrics.starved += time.perf_counter() - wait_start
+
+            if ctx is _STOP:
+                if outbox is not None:
+                    self._put(outbox, _STOP)
+                return
+
+            busy_start = time.perf_counter()
+            self.scanner.run_stage(stage, ctx)
+            metrics.busy += time.perf_counter() - busy_start
+            metrics.processed += 1
+
+            if outbox is not None:
+                # Finished scans (early errors) still travel in order
+                block_start = time.perf_counter()
+                if not self._put(outbox, ctx):
+                    self._drop(ctx)
+                    return
+                metrics.blocked += time.perf_counter() - block_start
+            else:
+                self._deliver(ctx)
+
+    def _deliver(self, ctx):
+        """Release a scan's resources and hand its result to on_result."""
+        result = self.scanner.finish(ctx)
+        try:
+            self.on_result(ctx.image_path, result)
+        except Exception as e:
+            print(f"Scan result handler failed: {e}")
+
+    def _drop(self, ctx):
+        """Report a scan the aborted pipeline will not finish."""
+        if ctx is _STOP:
+            return
+        if ctx.result is None:
+            ctx.result = ScanResult(error='Scan cancelled: pipeline stopped')
+        self._deliver(ctx)
+
+    def _drain(self):
+        """Drop every scan still waiting in a queue after an abort."""
+        for inbox in self._queues:
+            while True:
+                try:
+                    ctx = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                self._drop(ctx)
+
+    def _get(self, inbox: queue.Queue):
+        """Next item from a queue, or _STOP once the pipeline is aborted."""
+        while not self._abort.is_set():
+            try:
+                return inbox.get(timeout=POLL_INTERVAL)
+            except queue.Empty:
+                pass
+        return _STOP
+
+    def _put(self, outbox: queue.Queue, item) -> bool:
+        """Pass an item on. Returns False if the pipeline was aborted meanwhile."""
+        while not self._abort.is_set():
+            try:
+                outbox.put(item, timeout=POLL_INTERVAL)
+            except queue.Full:
+                continue
+            if self._abort.is_set():
+                self._drain()  # stop() may have drained the queue already
+            return True
+        return False
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+Streaming PNG decoding for SC Signature Scanner.
+
+The game writes a screenshot over a noticeable fraction of a second, and
+the scan region is usually in the upper part of the frame. Instead of
+waiting for the file to stop growing, PngStream follows it while it is
+written:
+
+1. Bytes are read as they are appended and split into PNG chunks.
+2. IDAT data is inflated as soon as it arrives, even from a chunk that is
+   not complete yet, so the decoded scanlines grow with the file.
+3. Once the rows the scan needs are inflated, they are unfiltered into an
+   image and the scan can go ahead.
+4. verify() waits for the rest of the file, decodes it normally and checks
+   that the rows scanned early are identical. The scanner rescans from the
+   complete file if they are not (e.g. the file was rewritten).
+
+Only non-interlaced 8-bit grayscale/RGB(A) images can be decoded early;
+anything else is simply followed to the end and loaded normally.
+"""
+
+import time
+import zlib
+from pathlib import Path
+from typing import Optional, Tuple
+
+from PIL import Image
+
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+READ_SIZE = 256 * 1024
+POLL_INTERVAL = 0.01  # Seconds between reads while the file is not growing
+STALL_TIMEOUT = 5.0  # Give up if the file stops growing for this long
+
+# PNG colour type -> (PIL mode, bytes per pixel) for 8-bit images
+COLOR_TYPES = {
+    0: ('L', 1),
+    2: ('RGB', 3),
+    4: ('LA', 2),
+    6: ('RGBA', 4),
+}
+
+
+class PngStreamError(Exception):
+    """The file is not a PNG, is malformed, or stopped growing."""
+
+
+class PngStream:
+    """Follows a PNG file while it is written and decodes rows early."""
+
+    def __init__(self, path: Path, stall_timeout: float = STALL_TIMEOUT):
+        """
+        Args:
+            path: PNG file (may still be growing)
+            stall_timeout: Seconds without new data before giving up
+
+        Raises:
+            PngStreamError: If the file cannot be opened in time
+        """
+        self.path = Path(path)
+        self.stall_timeout = stall_timeout
+        self.width = 0
+        self.height = 0
+        self.mode: Optional[str] = None  # None = rows cannot be decoded early
+        self.complete = False  # IEND seen
+        self.bytes_read = 0
+
+        self._stride = 0  # Bytes per scanline, excluding the filter byte
+        self._file = self._open()
+        self._pending = bytearray()  # Read but not yet parsed
+        self._signature_seen = False
+        self._chunk_type: Optional[bytes] = None  # Chunk being parsed
+        self._chunk_left = 0  # Data bytes of that chunk still to come
+        self._chunk_data = bytearray()  # Data of a non-IDAT chunk
+        self._inflater = zlib.decompressobj()
+        self._raw = bytearray()  # Inflated, still filtered scanlines
+        self._rows_wanted = 0  # Stop inflating beyond this many rows
+        self._top: Optional[Image.Image] = None  # Rows handed out early
+
+    # === Public API ===
+
+    def read_header(self) -> Tuple[int, int]:
+        """Wait for the IHDR chunk.
+
+        Returns:
+            (width, height) of the image
+        """
+        self._pump_until(lambda: self.width > 0)
+        return self.width, self.height
+
+    @property
+    def can_decode_rows(self) -> bool:
+        return self.mode is not None
+
+    @property
+    def rows_available(self) -> int:
+        return len(self._raw) // (self._stride + 1) if self._stride else 0
+
+    def read_rows(self, rows: int) -> Optional[Image.Image]:
+        """Wait until the top rows are written and decode them.
+
+        Args:
+            rows: Number of rows from the top of the image
+
+        Returns:
+            Image of width x rows, or None if this PNG cannot be decoded
+            early (the caller should wait for the whole file instead)
+        """
+        self.read_header()
+        if not self.can_decode_rows:
+            return None
+        rows = max(1, min(rows, self.height))
+        self._rows_wanted = rows
+        self._pump_until(lambda: self.rows_available >= rows)
+
+        # Let Pillow's PNG decoder do the unfiltering: re-wrap the scanlines
+        # in a stored (uncompressed) zlib stream
+        data = zlib.compress(bytes(self._raw[:rows * (self._stride + 1)]), 0)
+        self._top = Image.frombytes(self.mode, (self.width, rows), data, 'zip', self.mode)
+        self._raw = bytearray()  # Not needed any more - stop inflating
+        return self._top
+
+    def wait_complete(self):
+        """Follow the file until it is completely written."""
+        self._pump_until(lambda: self.complete)
+
+    def verify(self) -> bool:
+        """Check the early rows against the completely written file.
+
+        Returns:
+            True if the rows from read_rows() match the final image (or
+            none were read)
+        """
+        if self._top is None:
+            return True
+        try:
+            self.wait_complete()
+            with Image.open(self.path) as final:
+                if final.size != (self.width, self.height) or final.mode != self.mode:
+                    return False
+                final.load()
+                top = final.crop((0, 0, self.width, self._top.height))
+        except (PngStreamError, OSError, SyntaxError, ValueError):
+            return False
+        return top.tobytes() == self._top.tobytes()
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # === File following ===
+
+    def _open(self):
+        deadline = time.monotonic() + self.stall_timeout
+        while True:
+            try:
+                return open(self.path, 'rb', buffering=0)
+            except PermissionError:
+                # Some writers hold the file exclusively until done
+                if time.monotonic() >= deadline:
+                    raise PngStreamError(f"{self.path.name} stayed locked")
+                time.sleep(POLL_INTERVAL)
+            except OSError as e:
+                raise PngStreamError(str(e))
+
+    def _pump_until(self, done):
+        """Read and parse appended data until done() or the file stalls."""
+        last_growth = time.monotonic()
+        while not done():
+            if self.complete:
+                raise PngStreamError(f"{self.path.name} ended early")
+            data = self._file.read(READ_SIZE) if self._file else b''
+            if data:
+                self.bytes_read += len(data)
+                self._pending += data
+                self._parse()
+                last_growth = time.monotonic()
+            elif time.monotonic() - last_growth > self.stall_timeout:
+                raise PngStreamError(f"{self.path.name} stopped growing at {self.bytes_read} bytes")
+            else:
+                time.sleep(POLL_INTERVAL)
+
+    def _parse(self):
+        """Consume as much of the pending data as possible."""
+        pending = self._pending
+        pos = 0
+        if not self._signature_seen:
+            if len(pending) < len(PNG_SIGNATURE):
+                return
+            if pending[:len(PNG_SIGNATURE)] != PNG_SIGNATURE:
+                raise PngStreamError(f"{self.path.name} is not a PNG")
+            self._signature_seen = True
+            pos = len(PNG_SIGNATURE)
+
+        while not self.complete:
+            if self._chunk_type is None:
+                if len(pending) - pos < 8:
+                    break
+                self._chunk_left = int.from_bytes(pending[pos:pos + 4], 'big')
+                self._chunk_type = bytes(pending[pos + 4:pos + 8])
+                pos += 8
+            elif self._chunk_left:
+                take = min(self._chunk_left, len(pending) - pos)
+                if not take:
+                    break
+                piece = pending[pos:pos + take]
+                if self._chunk_type == b'IDAT':
+                    # Inflate partial chunks too - one chunk may hold the whole image
+                    self._inflate(piece)
+                else:
+                    self._chunk_data += piece
+                self._chunk_left -= take
+                pos += take
+            else:
+                if len(pending) - pos < 4:
+                    break
+                pos += 4  # CRC - the final decode in verify() checks the data
+                self._end_chunk()
+
+        del pending[:pos]
+
+    def _end_chunk(self):
+        chunk_type, data = self._chunk_type, self._chunk_data
+        self._chunk_type = None
+        self._chunk_data = bytearray()
+        if chunk_type == b'IHDR':
+            self._read_ihdr(bytes(data))
+        elif chunk_type == b'IEND':
+            self.complete = True
+
+    def _read_ihdr(self, data: bytes):
+        if len(data) != 13:
+            raise PngStreamError(f"{self.path.name} has a malformed header")
+        self.width = int.from_bytes(data[0:4], 'big')
+        self.height = int.from_bytes(data[4:8], 'big')
+        bit_depth, color_type, interlace = data[8], data[9], data[12]
+        if bit_depth == 8 and interlace == 0 and color_type in COLOR_TYPES:
+            self.mode, channels = COLOR_TYPES[color_type]
+            self._stride = self.width * channels
+
+    def _inflate(self, piece: bytearray):
+        if self.mode is None or self._top is not None:
+            return  # Rows are not (or no longer) needed - just follow the file
+        if self._rows_wanted and self.rows_available >= self._rows_wanted:
+            return  # Everything needed is decoded
+        try:
+            self._raw += self._inflater.decompress(piece)
+        except zlib.error as e:
+            raise PngStreamError(f"{self.path.name} has corrupt image data: {e}")
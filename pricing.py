@@ -4,20 +4,31 @@ Fetches ore prices from UEX API and calculates rock values using Regolith data.
 """
 
 import json
+import threading
 import time
-import urllib.request
-import urllib.error
-from typing import Dict, Optional, Tuple, List
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, List
 from pathlib import Path
 
+import requests
+
+import http_client
+import cache_format
 import regolith_api
+import settings
 
 
 # Constants
 UEX_API_BASE = "https://api.uexcorp.uk/2.0"
 CACHE_TTL = 1800  # 30 minutes in seconds
+REGOLITH_REFRESH_INTERVAL = 6 * 3600  # Survey data changes slowly
+RETRY_INTERVAL = 300  # Seconds before retrying a failed background refresh
 DEFAULT_REFINERY_YIELD = 0.5  # 50% - volume conversion factor for refined material
 
+_EMPTY: Mapping = MappingProxyType({})
+
 # Mineral densities (kg per SCU) - from Lazarr Bandara's research paper
 # These are tested and confirmed values for Star Citizen 4.2+
 MINERAL_DENSITY = {
@@ -49,194 +60,28 @@ MINERAL_DENSITY = {
 }
 
 
-class PricingManager:
-    """Manages ore pricing data from UEX and rock composition from Regolith."""
+@dataclass(frozen=True)
+class PricingSnapshot:
+    """Immutable pricing state: prices, rock compositions and refinery yield.
+    
+    Refreshes build a new snapshot and publish it with a single reference
+    swap, so a reader holding a snapshot always sees one consistent set of
+    data without taking locks. The tables are read-only mappings; their
+    nested values must be treated as read-only too.
+    """
+    version: int = 0
+    ore_prices: Mapping[str, float] = field(default_factory=lambda: _EMPTY)  # ORE_NAME -> price per SCU
+    rock_types: Mapping[str, Any] = field(default_factory=lambda: _EMPTY)  # System -> RockType -> data (from Regolith cache)
+    refinery_yield: float = DEFAULT_REFINERY_YIELD
+    last_fetch: float = 0  # Epoch seconds of the UEX prices
+    prices_loaded: bool = False
+    rock_types_loaded: bool = False
+    
+    @property
+    def prices_as_of(self) -> Optional[float]:
+        """Epoch seconds of the UEX prices, or None if none are loaded."""
+        return self.last_fetch if self.prices_loaded else None
     
-    def __init__(self, data_dir: str = "data"):
-        self.data_dir = Path(data_dir)
-        self.cache_file = self.data_dir / "uex_prices.json"
-        
-        # Data stores
-        self.ore_prices: Dict[str, float] = {}  # ORE_NAME -> price per SCU
-        self.rock_types: Dict = {}  # System -> RockType -> data (from Regolith cache)
-        self.commodities: Dict[int, dict] = {}  # id -> commodity data
-        
-        # Status
-        self.last_fetch: float = 0
-        self.fetch_error: Optional[str] = None
-        self.prices_loaded: bool = False
-        self.rock_types_loaded: bool = False
-        
-        # Refinery yield factor (adjustable by user)
-        self.refinery_yield: float = DEFAULT_REFINERY_YIELD
-        
-    def initialize(self) -> bool:
-        """Load rock types and fetch/load prices. Returns True if successful."""
-        # Load Regolith rock types
-        self._load_rock_types()
-        
-        # Load cached prices or fetch new
-        if not self._load_cached_prices():
-            self.refresh_prices()
-            
-        return self.prices_loaded
-        
-    def _load_rock_types(self) -> bool:
-        """Load rock types from Regolith API cache."""
-        try:
-            api = regolith_api.get_api()
-            cache = api.get_cached_data()
-            
-            if not cache:
-                self.fetch_error = "Regolith cache not available - API validation required"
-                self.rock_types_loaded = False
-                return False
-            
-            rock_compositions = cache.get('rock_compositions', {})
-            if not rock_compositions:
-                self.fetch_error = "Regolith cache contains no rock composition data"
-                self.rock_types_loaded = False
-                return False
-            
-            self.rock_types = rock_compositions
-            self.rock_types_loaded = True
-            self.fetch_error = None
-            return True
-            
-        except Exception as e:
-            self.fetch_error = f"Failed to load rock types from Regolith cache: {e}"
-            self.rock_types_loaded = False
-            return False
-            
-    def _load_cached_prices(self) -> bool:
-        """Load prices from cache if valid."""
-        try:
-            if not self.cache_file.exists():
-                return False
-                
-            with open(self.cache_file, 'r', encoding='utf-8') as f:
-                cache = json.load(f)
-                
-            # Check cache age
-            cached_time = cache.get('timestamp', 0)
-            if time.time() - cached_time > CACHE_TTL:
-                return False  # Cache expired
-                
-            self.ore_prices = cache.get('ore_prices', {})
-            self.commodities = {int(k): v for k, v in cache.get('commodities', {}).items()}
-            self.refinery_yield = cache.get('refinery_yield', DEFAULT_REFINERY_YIELD)
-            self.last_fetch = cached_time
-            self.prices_loaded = bool(self.ore_prices)
-            return self.prices_loaded
-            
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return False
-            
-    def _save_cache(self):
-        """Save prices to cache file."""
-        cache = {
-            'timestamp': self.last_fetch,
-            'ore_prices': self.ore_prices,
-            'commodities': {str(k): v for k, v in self.commodities.items()},
-            'refinery_yield': self.refinery_yield
-        }
-        self.data_dir.mkdir(exist_ok=True)
-        with open(self.cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache, f, indent=2)
-            
-    def get_refinery_yield(self) -> float:
-        """Get current refinery yield factor (0.0 to 1.0)."""
-        return self.refinery_yield
-        
-    def set_refinery_yield(self, yield_factor: float):
-        """
-        Set refinery yield factor.
-        
-        Args:
-            yield_factor: Value between 0.0 and 1.0 (e.g., 0.5 = 50%)
-        """
-        self.refinery_yield = max(0.0, min(1.0, yield_factor))
-        self._save_cache()  # Persist the setting
-            
-    def refresh_prices(self) -> bool:
-        """Fetch fresh prices from UEX API."""
-        self.fetch_error = None
-        
-        try:
-            # Fetch commodities list
-            url = f"{UEX_API_BASE}/commodities"
-            req = urllib.request.Request(
-                url, 
-                headers={
-                    'User-Agent': 'SC-Signature-Scanner/1.0',
-                    'Accept': 'application/json'
-                }
-            )
-            
-            with urllib.request.urlopen(req, timeout=15) as response:
-                data = json.loads(response.read().decode('utf-8'))
-                
-            if data.get('status') != 'ok':
-                self.fetch_error = f"UEX API error: {data.get('status')}"
-                return False
-                
-            # Process commodities - extract ore prices
-            self.ore_prices = {}
-            self.commodities = {}
-            
-            for commodity in data.get('data', []):
-                cid = commodity['id']
-                self.commodities[cid] = commodity
-                
-                # Normalize name - strip suffixes and uppercase
-                name = commodity['name'].upper()
-                for suffix in [' (ORE)', ' (RAW)']:
-                    if name.endswith(suffix):
-                        name = name[:-len(suffix)]
-                        break
-                
-                # Map to Regolith naming conventions
-                name = self._normalize_ore_name(name)
-                
-                # Get price - prefer raw ore sell price
-                if commodity.get('is_raw') == 1:
-                    price = commodity.get('price_sell', 0)
-                    if price > 0:
-                        self.ore_prices[name] = price
-                elif commodity.get('is_refined') == 1:
-                    # Use refined price if we don't have raw
-                    price = commodity.get('price_sell', 0)
-                    if price > 0 and name not in self.ore_prices:
-                        self.ore_prices[name] = price
-                        
-            self.last_fetch = time.time()
-            self.prices_loaded = bool(self.ore_prices)
-            self._save_cache()
-            return self.prices_loaded
-            
-        except urllib.error.URLError as e:
-            self.fetch_error = f"Network error: {e.reason}"
-            return False
-        except urllib.error.HTTPError as e:
-            self.fetch_error = f"HTTP error {e.code}: {e.reason}"
-            return False
-        except json.JSONDecodeError as e:
-            self.fetch_error = f"Invalid API response: {e}"
-            return False
-        except Exception as e:
-            self.fetch_error = f"Error fetching prices: {e}"
-            return False
-            
-    def _normalize_ore_name(self, name: str) -> str:
-        """Normalize ore name to match Regolith conventions."""
-        # UEX -> Regolith mapping
-        mappings = {
-            'INERT MATERIALS': 'INERTMATERIAL',
-            'QUANTAINIUM': 'QUANTANIUM',
-            'RAW ICE': 'ICE',
-        }
-        return mappings.get(name, name)
-        
     def get_ore_price(self, ore_name: str) -> float:
         """Get price per SCU for an ore. Returns 0 if not found."""
         name = ore_name.upper().strip()
@@ -371,24 +216,400 @@ class PricingManager:
         """Get list of rock types for a system (excluding nulls)."""
         system_data = self.rock_types.get(system.upper(), {})
         return [k for k, v in system_data.items() if v is not None]
+
+
+class PricingManager:
+    """Manages ore pricing data from UEX and rock composition from Regolith.
+    
+    All data lives in the current PricingSnapshot. Readers call snapshot()
+    once and use it for the whole valuation; writers build a new snapshot
+    under a lock and swap it in.
+    """
+    
+    def __init__(self, data_dir: str = "data"):
+        self.data_dir = Path(data_dir)
+        self.cache_file = self.data_dir / "uex_prices.bin"
+        self.legacy_cache_file = self.data_dir / "uex_prices.json"  # Pre-compact format
+        
+        # Published data (replaced, never modified)
+        self._snapshot = PricingSnapshot()
+        self._publish_lock = threading.Lock()  # Serializes writers only
+        self._save_lock = threading.Lock()  # Cache writes from refresher and write-behind
+        
+        # Status
+        self.fetch_error: Optional[str] = None
+    
+    def snapshot(self) -> PricingSnapshot:
+        """The current pricing data. Safe to use from any thread."""
+        return self._snapshot
+    
+    def _publish(self, **changes) -> PricingSnapshot:
+        """Publish a new snapshot with the given fields replaced."""
+        for name in ('ore_prices', 'rock_types'):
+            if name in changes:
+                changes[name] = MappingProxyType(dict(changes[name]))
+        with self._publish_lock:
+            current = self._snapshot
+            self._snapshot = replace(current, version=current.version + 1, **changes)
+            return self._snapshot
+    
+    # Read-only views of the current snapshot
+    ore_prices = property(lambda self: self._snapshot.ore_prices)
+    rock_types = property(lambda self: self._snapshot.rock_types)
+    refinery_yield = property(lambda self: self._snapshot.refinery_yield)
+    last_fetch = property(lambda self: self._snapshot.last_fetch)
+    prices_loaded = property(lambda self: self._snapshot.prices_loaded)
+    rock_types_loaded = property(lambda self: self._snapshot.rock_types_loaded)
+        
+    def initialize(self) -> bool:
+        """Load rock types and fetch/load prices. Returns True if successful.
+        
+        Cached prices are served even when older than CACHE_TTL; the
+        PriceRefresher updates them in the background. Only a missing
+        cache blocks on the network.
+        """
+        # Load Regolith rock types
+        self._load_rock_types()
+        
+        # Load cached prices (stale is fine) or fetch new
+        if not self._load_cached_prices(allow_stale=True):
+            self.refresh_prices()
+            
+        return self.prices_loaded
+    
+    def is_stale(self) -> bool:
+        """True if prices are older than CACHE_TTL (or not loaded)."""
+        return time.time() - self.last_fetch > CACHE_TTL
+    
+    def reload_rock_types(self) -> bool:
+        """Reload rock compositions after the Regolith cache was refreshed."""
+        return self._load_rock_types()
+        
+    def _load_rock_types(self) -> bool:
+        """Load rock types from Regolith API cache."""
+        try:
+            api = regolith_api.get_api()
+            cache = api.get_cached_data()
+            
+            if not cache:
+                self.fetch_error = "Regolith cache not available - API validation required"
+                self._publish(rock_types_loaded=False)
+                return False
+            
+            rock_compositions = cache.get('rock_compositions', {})
+            if not rock_compositions:
+                self.fetch_error = "Regolith cache contains no rock composition data"
+                self._publish(rock_types_loaded=False)
+                return False
+            
+            self._publish(rock_types=rock_compositions, rock_types_loaded=True)
+            self.fetch_error = None
+            return True
+            
+        except Exception as e:
+            self.fetch_error = f"Failed to load rock types from Regolith cache: {e}"
+            self._publish(rock_types_loaded=False)
+            return False
+            
+    def _load_cached_prices(self, allow_stale: bool = False) -> bool:
+        """Load prices from cache if valid (or at all, with allow_stale)."""
+        try:
+            if self.cache_file.exists():
+                # Freshness from the header before touching the body
+                cache = cache_format.read_header(self.cache_file)
+                cached_time = cache.get('timestamp', 0)
+                if not allow_stale and time.time() - cached_time > CACHE_TTL:
+                    return False  # Cache expired
+                _, sections = cache_format.read(self.cache_file, ['ore_prices'])
+                cache.update(sections)
+            elif self.legacy_cache_file.exists():
+                with open(self.legacy_cache_file, 'r', encoding='utf-8') as f:
+                    cache = json.load(f)
+                cached_time = cache.get('timestamp', 0)
+                if not allow_stale and time.time() - cached_time > CACHE_TTL:
+                    return False  # Cache expired
+            else:
+                return False
+                
+            ore_prices = cache.get('ore_prices', {})
+            snapshot = self._publish(
+                ore_prices=ore_prices,
+                refinery_yield=cache.get('refinery_yield', DEFAULT_REFINERY_YIELD),
+                last_fetch=cached_time,
+                prices_loaded=bool(ore_prices)
+            )
+            return snapshot.prices_loaded
+            
+        except (cache_format.CacheFormatError, OSError, json.JSONDecodeError, KeyError, ValueError):
+            return False
+            
+    def _save_cache(self):
+        """Save prices to cache file (ore prices only - not full commodity records)."""
+        with self._save_lock:
+            snapshot = self._snapshot
+            header = {
+                'timestamp': snapshot.last_fetch,
+                'refinery_yield': snapshot.refinery_yield
+            }
+            self.data_dir.mkdir(exist_ok=True)
+            cache_format.write(self.cache_file, header, {'ore_prices': dict(snapshot.ore_prices)})
+            if self.legacy_cache_file.exists():
+                self.legacy_cache_file.unlink()
+            
+    def get_refinery_yield(self) -> float:
+        """Get current refinery yield factor (0.0 to 1.0)."""
+        return self.refinery_yield
+        
+    def set_refinery_yield(self, yield_factor: float):
+        """
+        Set refinery yield factor.
+        
+        Args:
+            yield_factor: Value between 0.0 and 1.0 (e.g., 0.5 = 50%)
+        """
+        yield_factor = max(0.0, min(1.0, yield_factor))
+        if yield_factor == self.refinery_yield:
+            return
+        self._publish(refinery_yield=yield_factor)
+        # Persist the setting write-behind (repeated changes -> one write)
+        settings.schedule_write('uex_prices', self._save_cache)
+            
+    def refresh_prices(self) -> bool:
+        """Fetch fresh prices from UEX API."""
+        self.fetch_error = None
+        
+        try:
+            # Fetch commodities list
+            url = f"{UEX_API_BASE}/commodities"
+            response = http_client.get_client().get(
+                url,
+                headers={'Accept': 'application/json'},
+                timeout=15
+            )
+            response.raise_for_status()
+            data = response.json()
+                
+            if data.get('status') != 'ok':
+                self.fetch_error = f"UEX API error: {data.get('status')}"
+                return False
+                
+            # Process commodities - extract ore prices
+            # Built off to the side so readers never see a half-filled table
+            ore_prices: Dict[str, float] = {}
+            
+            for commodity in data.get('data', []):
+                # Normalize name - strip suffixes and uppercase
+                name = commodity['name'].upper()
+                for suffix in [' (ORE)', ' (RAW)']:
+                    if name.endswith(suffix):
+                        name = name[:-len(suffix)]
+                        break
+                
+                # Map to Regolith naming conventions
+                name = self._normalize_ore_name(name)
+                
+                # Get price - prefer raw ore sell price
+                if commodity.get('is_raw') == 1:
+                    price = commodity.get('price_sell', 0)
+                    if price > 0:
+                        ore_prices[name] = price
+                elif commodity.get('is_refined') == 1:
+                    # Use refined price if we don't have raw
+                    price = commodity.get('price_sell', 0)
+                    if price > 0 and name not in ore_prices:
+                        ore_prices[name] = price
+            
+            if not ore_prices:
+                # Keep serving the previous prices
+                self.fetch_error = "UEX API returned no ore prices"
+                return False
+            
+            # One reference swap - scans in flight keep their snapshot
+            self._publish(
+                ore_prices=ore_prices,
+                last_fetch=time.time(),
+                prices_loaded=True
+            )
+            self._save_cache()
+            return True
+            
+        except requests.exceptions.HTTPError as e:
+            self.fetch_error = f"HTTP error {e.response.status_code}: {e.response.reason}"
+            return False
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            self.fetch_error = f"Network error: {e}"
+            return False
+        except ValueError as e:
+            self.fetch_error = f"Invalid API response: {e}"
+            return False
+        except Exception as e:
+            self.fetch_error = f"Error fetching prices: {e}"
+            return False
+            
+    def _normalize_ore_name(self, name: str) -> str:
+        """Normalize ore name to match Regolith conventions."""
+        # UEX -> Regolith mapping
+        mappings = {
+            'INERT MATERIALS': 'INERTMATERIAL',
+            'QUANTAINIUM': 'QUANTANIUM',
+            'RAW ICE': 'ICE',
+        }
+        return mappings.get(name, name)
+        
+    # === Read access (delegates to the current snapshot) ===
+    
+    def get_ore_price(self, ore_name: str) -> float:
+        """Get price per SCU for an ore. Returns 0 if not found."""
+        return self._snapshot.get_ore_price(ore_name)
+        
+    def calculate_rock_value(
+        self, 
+        system: str, 
+        rock_type: str,
+        mass_override: Optional[float] = None,
+        apply_refinery_yield: bool = True
+    ) -> Tuple[float, Dict[str, Tuple[float, float, float, float]]]:
+        """Calculate estimated value for a rock type (see PricingSnapshot)."""
+        return self._snapshot.calculate_rock_value(
+            system, rock_type, mass_override, apply_refinery_yield
+        )
+        
+    def get_rock_summary(self, system: str, rock_type: str) -> Optional[dict]:
+        """Get summary info for a rock type including estimated value."""
+        return self._snapshot.get_rock_summary(system, rock_type)
+        
+    def get_available_systems(self) -> List[str]:
+        """Get list of systems with rock data."""
+        return self._snapshot.get_available_systems()
+        
+    def get_rock_types_for_system(self, system: str) -> List[str]:
+        """Get list of rock types for a system (excluding nulls)."""
+        return self._snapshot.get_rock_types_for_system(system)
         
     def get_status(self) -> dict:
         """Get current status of pricing system."""
+        snapshot = self._snapshot
         return {
-            'prices_loaded': self.prices_loaded,
-            'rock_types_loaded': self.rock_types_loaded,
-            'ore_count': len(self.ore_prices),
-            'systems': self.get_available_systems(),
-            'last_fetch': self.last_fetch,
-            'cache_age_seconds': time.time() - self.last_fetch if self.last_fetch else None,
-            'refinery_yield': self.refinery_yield,
-            'refinery_yield_pct': int(self.refinery_yield * 100),
+            'prices_loaded': snapshot.prices_loaded,
+            'rock_types_loaded': snapshot.rock_types_loaded,
+            'ore_count': len(snapshot.ore_prices),
+            'systems': snapshot.get_available_systems(),
+            'last_fetch': snapshot.last_fetch,
+            'cache_age_seconds': time.time() - snapshot.last_fetch if snapshot.last_fetch else None,
+            'refinery_yield': snapshot.refinery_yield,
+            'refinery_yield_pct': int(snapshot.refinery_yield * 100),
+            'version': snapshot.version,
             'error': self.fetch_error
         }
 
 
+class PriceRefresher:
+    """Background refresh of UEX prices and Regolith survey data.
+    
+    Stale-while-revalidate: the manager keeps serving whatever it has
+    loaded while this thread fetches newer data on each source's own
+    interval. A failed refresh is retried after RETRY_INTERVAL.
+    """
+    
+    SOURCES = ('uex', 'regolith')
+    
+    def __init__(self, manager: PricingManager,
+                 on_update: Optional[Callable[[str, bool, str], None]] = None,
+                 uex_interval: float = CACHE_TTL,
+                 regolith_interval: float = REGOLITH_REFRESH_INTERVAL):
+        """
+        Args:
+            manager: PricingManager to refresh
+            on_update: Called as (source, success, message) on the refresher
+                thread after each refresh attempt
+            uex_interval: Seconds between UEX price refreshes
+            regolith_interval: Seconds between Regolith data refreshes
+        """
+        self.manager = manager
+        self.on_update = on_update
+        self.intervals = {'uex': uex_interval, 'regolith': regolith_interval}
+        self._due: Dict[str, float] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        """Start refreshing. Stale sources are refreshed right away."""
+        if self._thread and self._thread.is_alive():
+            return
+        now = time.time()
+        self._due = {
+            'uex': self.manager.last_fetch + self.intervals['uex'],
+            'regolith': self._regolith_last_updated() + self.intervals['regolith'],
+        }
+        self._due = {source: max(due, now) for source, due in self._due.items()}
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="PriceRefresher", daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop the refresher thread."""
+        self._stopped.set()
+        self._wake.set()
+    
+    def refresh_now(self, source: Optional[str] = None):
+        """Schedule an immediate refresh of one source (or all)."""
+        for name in ([source] if source else self.SOURCES):
+            self._due[name] = 0
+        self._wake.set()
+    
+    def _run(self):
+        """Refresher loop."""
+        while not self._stopped.is_set():
+            now = time.time()
+            for source in self.SOURCES:
+                if self._due[source] <= now and not self._stopped.is_set():
+                    success = self._refresh(source)
+                    interval = self.intervals[source] if success else RETRY_INTERVAL
+                    self._due[source] = time.time() + interval
+            
+            timeout = max(0.0, min(self._due.values()) - time.time())
+            self._wake.wait(timeout)
+            self._wake.clear()
+    
+    def _refresh(self, source: str) -> bool:
+        """Refresh one source and report it."""
+        try:
+            if source == 'uex':
+                success = self.manager.refresh_prices()
+                message = (f"{len(self.manager.ore_prices)} ore prices" if success
+                           else self.manager.fetch_error or "Unknown error")
+            else:
+                api = regolith_api.get_api()
+                if not api.api_key:
+                    return True  # Nothing to do without a key
+                success, message = api.refresh_cache()
+                if success:
+                    self.manager.reload_rock_types()
+        except Exception as e:
+            success, message = False, str(e)
+        
+        if self.on_update:
+            try:
+                self.on_update(source, success, message)
+            except Exception as e:
+                print(f"Price refresh callback failed: {e}")
+        return success
+    
+    @staticmethod
+    def _regolith_last_updated() -> float:
+        """Epoch seconds of the Regolith cache's last refresh (0 if unknown)."""
+        cache = regolith_api.get_api().get_cached_data() or {}
+        try:
+            stamp = cache.get("last_updated", "").replace("Z", "+00:00")
+            return datetime.fromisoformat(stamp).timestamp()
+        except (ValueError, TypeError, AttributeError):
+            return 0
+
+
 # Module-level singleton
 _pricing_manager: Optional[PricingManager] = None
+_price_refresher: Optional[PriceRefresher] = None
 
 
 def get_pricing_manager() -> PricingManager:
@@ -423,6 +644,36 @@ def refresh_pricing() -> Tuple[bool, Optional[str]]:
     return success, manager.fetch_error if not success else None
 
 
+def start_background_refresh(on_update: Optional[Callable[[str, bool, str], None]] = None) -> PriceRefresher:
+    """
+    Start (or return) the background price refresher.
+    
+    Args:
+        on_update: Called as (source, success, message) from the refresher thread
+    """
+    global _price_refresher
+    if _price_refresher is None:
+        _price_refresher = PriceRefresher(get_pricing_manager(), on_update)
+    _price_refresher.start()
+    return _price_refresher
+
+
+def stop_background_refresh():
+    """Stop the background price refresher, if running."""
+    if _price_refresher is not None:
+        _price_refresher.stop()
+
+
+def get_snapshot() -> PricingSnapshot:
+    """Current pricing snapshot (consistent, lock-free)."""
+    return get_pricing_manager().snapshot()
+
+
+def get_prices_as_of() -> Optional[float]:
+    """Epoch seconds of the currently loaded UEX prices, or None."""
+    return get_snapshot().prices_as_of
+
+
 def get_rock_value(system: str, rock_type: str) -> float:
     """Quick helper to get estimated value for a rock type."""
     manager = get_pricing_manager()
@@ -7,58 +7,247 @@ GUI tool for defining the signature scan region on a screenshot.
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from pathlib import Path
-from typing import Optional, Tuple, Callable
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from PIL import Image, ImageTk
-import json
+
+from settings import SettingsFile
 
 
 CONFIG_FILE = Path(__file__).parent / "scan_region.json"
 
+# Held in memory - scans read the region without touching the disk
+_region_file = SettingsFile(CONFIG_FILE)
+
+# scan_region.json layout:
+#   "profiles": {"2560x1440": {"width", "height", "x1", "y1", "x2", "y2", "fields"}}
+#       Region per screenshot size, in normalized (0-1) coordinates.
+#       Optional "fields" holds extra HUD readouts ({"mass": {"x1", ...}}),
+#       also normalized
+#   "fallback": {"x1", "y1", "x2", "y2"}
+#       Pixel region from the old single-rectangle format, used (clamped)
+#       when no profile fits
+#   "anchor": HUD anchor for hud_locator (optional)
+ASPECT_DIGITS = 3  # Aspect ratios equal to this precision share profiles
+
+# Readouts that can be scanned along with the signature
+FIELDS = ('signature', 'mass', 'instability', 'resistance')
+FIELD_COLORS = {
+    'signature': '#4ecca3',
+    'mass': '#5dade2',
+    'instability': '#e74c3c',
+    'resistance': '#c39bd3',
+}
+
+Rect = Tuple[int, int, int, int]
+
+
+class _RegionIndex:
+    """Lookups derived from scan_region.json, rebuilt when the file changes."""
+    
+    def __init__(self, data: Optional[Dict[str, Any]]):
+        data = _migrate(data or {})
+        profiles = data.get('profiles', {})
+        self.by_size: Dict[Tuple[int, int], Dict[str, float]] = {}
+        self.by_aspect: Dict[float, Dict[str, float]] = {}
+        for profile in profiles.values():
+            size = (profile['width'], profile['height'])
+            self.by_size[size] = profile
+            self.by_aspect[_aspect(*size)] = profile
+        self.fallback: Optional[Rect] = _rect(data.get('fallback'))
+        self.anchor: Optional[Dict[str, Any]] = data.get('anchor')
+        self.resolved: Dict[Tuple[int, int], Optional[Rect]] = {}
+        self.resolved_fields: Dict[Tuple[int, int], Dict[str, Rect]] = {}
+    
+    def region_for(self, width: int, height: int) -> Optional[Rect]:
+        """Pixel region for an image size (exact profile > same aspect > fallback)."""
+        size = (width, height)
+        if size in self.resolved:
+            return self.resolved[size]
+        
+        profile = self.by_size.get(size) or self.by_aspect.get(_aspect(width, height))
+        if profile:
+            region = _denormalize(profile, width, height)
+        else:
+            region = self.fallback
+        self.resolved[size] = region
+        return region
+    
+    def fields_for(self, width: int, height: int) -> Dict[str, Rect]:
+        """Pixel regions of the extra readouts for an image size (cached per size)."""
+        size = (width, height)
+        fields = self.resolved_fields.get(size)
+        if fields is None:
+            profile = self.by_size.get(size) or self.by_aspect.get(_aspect(width, height))
+            fields = {
+                name: _denormalize(rect, width, height)
+                for name, rect in (profile or {}).get('fields', {}).items()
+                if name in FIELDS
+            }
+            self.resolved_fields[size] = fields
+        return fields
+
+
+_index: Optional[_RegionIndex] = None
+_index_generation = -1
+
+
+def _aspect(width: int, height: int) -> float:
+    return round(width / height, ASPECT_DIGITS) if height else 0.0
+
+
+def _rect(data: Optional[Dict[str, Any]]) -> Optional[Rect]:
+    if not data:
+        return None
+    try:
+        return (data['x1'], data['y1'], data['x2'], data['y2'])
+    except KeyError:
+        return None
+
+
+def _denormalize(profile: Dict[str, float], width: int, height: int) -> Rect:
+    return (
+        round(profile['x1'] * width),
+        round(profile['y1'] * height),
+        round(profile['x2'] * width),
+        round(profile['y2'] * height)
+    )
+
+
+def _migrate(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn the old single pixel rectangle into the fallback region."""
+    if 'profiles' in data or 'fallback' in data or 'anchor' in data:
+        return data
+    legacy = _rect(data)
+    return {'profiles': {}, 'fallback': {'x1': legacy[0], 'y1': legacy[1], 'x2': legacy[2], 'y2': legacy[3]}} if legacy else {}
+
+
+def _get_index() -> _RegionIndex:
+    global _index, _index_generation
+    generation = _region_file.generation
+    if _index is None or generation != _index_generation:
+        _index = _RegionIndex(_region_file.load())
+        _index_generation = generation
+    return _index
+
+
+def region_for_image(width: int, height: int) -> Optional[Rect]:
+    """Get the scan region for a screenshot size (dict lookups, cached per size).
+    
+    Returns:
+        Tuple of (x1, y1, x2, y2) in image pixels, or None if not configured.
+    """
+    return _get_index().region_for(width, height)
+
+
+def fields_for_image(width: int, height: int) -> Dict[str, Rect]:
+    """Get the extra readout regions (mass, instability, ...) for a screenshot size.
+    
+    Returns:
+        Dict of field name -> (x1, y1, x2, y2) in image pixels (empty if
+        none are configured). Does not include the signature region.
+    """
+    return _get_index().fields_for(width, height)
+
 
-def load_region() -> Optional[Tuple[int, int, int, int]]:
+def load_region(image_size: Optional[Tuple[int, int]] = None) -> Optional[Rect]:
     """Load saved scan region.
     
+    Args:
+        image_size: (width, height) of the screenshot. If None, returns the
+            most recently saved profile at its own size (or the fallback).
+    
     Returns:
         Tuple of (x1, y1, x2, y2) or None if not configured.
     """
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                data = json.load(f)
-                return (
-                    data['x1'],
-                    data['y1'],
-                    data['x2'],
-                    data['y2']
-                )
-        except (json.JSONDecodeError, KeyError, IOError):
-            pass
-    return None
-
-
-def save_region(x1: int, y1: int, x2: int, y2: int):
-    """Save scan region to config."""
-    data = {
-        'x1': x1,
-        'y1': y1,
-        'x2': x2,
-        'y2': y2,
-        'width': x2 - x1,
-        'height': y2 - y1
-    }
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    if image_size:
+        return region_for_image(*image_size)
+    
+    data = _migrate(_region_file.load() or {})
+    profiles = list(data.get('profiles', {}).values())
+    if profiles:
+        latest = profiles[-1]
+        return _denormalize(latest, latest['width'], latest['height'])
+    return _rect(data.get('fallback'))
+
+
+def list_profiles() -> List[Tuple[int, int]]:
+    """Screenshot sizes that have a region profile."""
+    return list(_get_index().by_size)
+
+
+def save_region(x1: int, y1: int, x2: int, y2: int,
+                image_size: Optional[Tuple[int, int]] = None,
+                fields: Optional[Dict[str, Rect]] = None):
+    """Save scan region to config.
+    
+    Args:
+        x1, y1, x2, y2: Region in screenshot pixels
+        image_size: (width, height) of the screenshot the region was drawn
+            on. Stored as a normalized profile for that size; without it
+            the region is saved as the pixel fallback.
+        fields: Extra readout regions (name -> pixel rect) for the profile.
+            Only stored with image_size.
+    """
+    data = _migrate(_region_file.load() or {})
+    data.setdefault('profiles', {})
+    
+    if image_size:
+        width, height = image_size
+        key = f"{width}x{height}"
+        profiles = data['profiles']
+        profiles.pop(key, None)  # Re-insert so it becomes the latest
+        profiles[key] = {
+            'width': width,
+            'height': height,
+            'x1': x1 / width,
+            'y1': y1 / height,
+            'x2': x2 / width,
+            'y2': y2 / height
+        }
+        if fields:
+            profiles[key]['fields'] = {
+                name: {'x1': fx1 / width, 'y1': fy1 / height, 'x2': fx2 / width, 'y2': fy2 / height}
+                for name, (fx1, fy1, fx2, fy2) in fields.items()
+            }
+    else:
+        data['fallback'] = {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2}
+    _region_file.save(data)
+
+
+def load_anchor() -> Optional[Dict[str, Any]]:
+    """Get the HUD anchor settings (see hud_locator), or None."""
+    return _get_index().anchor
+
+
+def save_anchor(anchor: Optional[Dict[str, Any]]):
+    """Save (or with None, remove) the HUD anchor settings."""
+    data = _migrate(_region_file.load() or {})
+    data.setdefault('profiles', {})
+    if anchor:
+        data['anchor'] = anchor
+    else:
+        data.pop('anchor', None)
+    _region_file.save(data)
 
 
 def clear_region():
-    """Clear saved scan region."""
-    if CONFIG_FILE.exists():
-        CONFIG_FILE.unlink()
+    """Clear saved scan region (all profiles and the HUD anchor)."""
+    anchor = load_anchor()
+    if anchor and anchor.get('template'):
+        template = CONFIG_FILE.parent / anchor['template']
+        if template.exists():
+            template.unlink()
+    _region_file.delete()
 
 
 def is_configured() -> bool:
-    """Check if a scan region has been configured."""
-    return CONFIG_FILE.exists()
+    """Check if a scan region has been configured.
+    
+    A HUD anchor alone does not count - it only moves a region, and scans
+    have nothing to fall back on when it is not found.
+    """
+    index = _get_index()
+    return bool(index.by_size or index.fallback)
 
 
 class RegionSelector:
@@ -85,6 +274,16 @@ class RegionSelector:
         self.rect_id = None
         self.selection: Optional[Tuple[int, int, int, int]] = None  # In original image coords
         
+        # Extra readout regions (mass, instability, resistance)
+        self.active_field = 'signature'
+        self.field_selections: Dict[str, Rect] = {}
+        self.field_rect_ids: Dict[str, int] = {}
+        
+        # Optional HUD anchor (see hud_locator)
+        self.anchor_mode = False
+        self.anchor_rect_id = None
+        self.anchor_selection: Optional[Tuple[int, int, int, int]] = None
+        
         self.root: Optional[tk.Toplevel] = None
         self.canvas: Optional[tk.Canvas] = None
     
@@ -168,6 +367,34 @@ class RegionSelector:
         )
         clear_btn.pack(side=tk.LEFT, padx=(0, 10))
         
+        self.anchor_btn = tk.Button(
+            btn_frame,
+            text="⚓ Mark HUD Anchor",
+            bg='#444',
+            fg='#f4a259',
+            font=('Segoe UI', 10),
+            relief='flat',
+            padx=20,
+            pady=8,
+            cursor='hand2',
+            command=self._toggle_anchor_mode
+        )
+        self.anchor_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
+        self.field_btn = tk.Button(
+            btn_frame,
+            text="▦ Drawing: Signature",
+            bg='#444',
+            fg=FIELD_COLORS['signature'],
+            font=('Segoe UI', 10),
+            relief='flat',
+            padx=20,
+            pady=8,
+            cursor='hand2',
+            command=self._next_field
+        )
+        self.field_btn.pack(side=tk.LEFT, padx=(0, 10))
+        
         cancel_btn = tk.Button(
             btn_frame,
             text="Cancel (Esc)",
@@ -195,7 +422,9 @@ class RegionSelector:
         # Top section: Instructions
         instructions = tk.Label(
             self.root,
-            text="Click and drag to define the scan region around where signatures appear",
+            text="Click and drag to define the scan region around where signatures appear"
+                 "  •  Optional: mark a fixed HUD element next to it as anchor,"
+                 " or the mass/instability/resistance values (numbers only)",
             bg='#1a1a2e',
             fg='#f4a259',
             font=('Segoe UI', 10)
@@ -233,8 +462,8 @@ class RegionSelector:
         self.display_image = ImageTk.PhotoImage(display_img)
         self.canvas.create_image(0, 0, anchor=tk.NW, image=self.display_image)
         
-        # Load existing region if any
-        existing = load_region()
+        # Load existing region for this screenshot size, if any
+        existing = load_region(self.original_image.size)
         if existing:
             x1, y1, x2, y2 = existing
             self.selection = existing
@@ -244,7 +473,17 @@ class RegionSelector:
                 int(x2 * self.scale_factor),
                 int(y2 * self.scale_factor)
             )
-            self._update_info()
+        
+        for name, (fx1, fy1, fx2, fy2) in fields_for_image(*self.original_image.size).items():
+            self.field_selections[name] = (fx1, fy1, fx2, fy2)
+            self._draw_field_rect(
+                name,
+                int(fx1 * self.scale_factor),
+                int(fy1 * self.scale_factor),
+                int(fx2 * self.scale_factor),
+                int(fy2 * self.scale_factor)
+            )
+        self._update_info()
         
         # Bindings
         self.canvas.bind('<Button-1>', self._on_press)
@@ -258,13 +497,41 @@ class RegionSelector:
         
         self.root.mainloop()
     
+    def _toggle_anchor_mode(self):
+        """Switch between drawing the scan region and the HUD anchor."""
+        self.anchor_mode = not self.anchor_mode
+        self.anchor_btn.configure(
+            text="✓ Done Marking Anchor" if self.anchor_mode else "⚓ Mark HUD Anchor",
+            bg='#f4a259' if self.anchor_mode else '#444',
+            fg='#1a1a2e' if self.anchor_mode else '#f4a259'
+        )
+    
+    def _next_field(self):
+        """Cycle which readout the next drag draws (signature, mass, ...)."""
+        index = FIELDS.index(self.active_field)
+        self.active_field = FIELDS[(index + 1) % len(FIELDS)]
+        self.field_btn.configure(
+            text=f"▦ Drawing: {self.active_field.capitalize()}",
+            fg=FIELD_COLORS[self.active_field]
+        )
+        if self.anchor_mode:
+            self._toggle_anchor_mode()
+    
     def _on_press(self, event):
         """Handle mouse press - start drawing rectangle."""
         self.start_x = event.x
         self.start_y = event.y
         
         # Remove existing rectangle
-        if self.rect_id:
+        if self.anchor_mode:
+            if self.anchor_rect_id:
+                self.canvas.delete(self.anchor_rect_id)
+                self.anchor_rect_id = None
+        elif self.active_field != 'signature':
+            rect_id = self.field_rect_ids.pop(self.active_field, None)
+            if rect_id:
+                self.canvas.delete(rect_id)
+        elif self.rect_id:
             self.canvas.delete(self.rect_id)
             self.rect_id = None
     
@@ -285,17 +552,31 @@ class RegionSelector:
         x2 = min(canvas_w, x2)
         y2 = min(canvas_h, y2)
         
-        # Draw rectangle
-        self._draw_rect(x1, y1, x2, y2)
-        
         # Store selection in original image coordinates
-        self.selection = (
+        selection = (
             int(x1 / self.scale_factor),
             int(y1 / self.scale_factor),
             int(x2 / self.scale_factor),
             int(y2 / self.scale_factor)
         )
         
+        # Draw rectangle
+        if self.anchor_mode:
+            if self.anchor_rect_id:
+                self.canvas.delete(self.anchor_rect_id)
+            self.anchor_rect_id = self.canvas.create_rectangle(
+                x1, y1, x2, y2,
+                outline='#f4a259',
+                width=2
+            )
+            self.anchor_selection = selection
+        elif self.active_field != 'signature':
+            self._draw_field_rect(self.active_field, x1, y1, x2, y2)
+            self.field_selections[self.active_field] = selection
+        else:
+            self._draw_rect(x1, y1, x2, y2)
+            self.selection = selection
+        
         self._update_info()
     
     def _on_release(self, event):
@@ -314,16 +595,32 @@ class RegionSelector:
             dash=(5, 3)
         )
     
+    def _draw_field_rect(self, name: str, x1: int, y1: int, x2: int, y2: int):
+        """Draw a readout field rectangle."""
+        rect_id = self.field_rect_ids.pop(name, None)
+        if rect_id:
+            self.canvas.delete(rect_id)
+        
+        self.field_rect_ids[name] = self.canvas.create_rectangle(
+            x1, y1, x2, y2,
+            outline=FIELD_COLORS[name],
+            width=2,
+            dash=(2, 2)
+        )
+    
     def _update_info(self):
         """Update info label with current selection."""
         if self.selection:
             x1, y1, x2, y2 = self.selection
             w = x2 - x1
             h = y2 - y1
-            self.info_label.configure(
-                text=f"Region: ({x1}, {y1}) to ({x2}, {y2}) • Size: {w} × {h} px",
-                fg='#4ecca3'
-            )
+            text = f"Region: ({x1}, {y1}) to ({x2}, {y2}) • Size: {w} × {h} px"
+            if self.anchor_selection:
+                ax1, ay1, ax2, ay2 = self.anchor_selection
+                text += f" • Anchor: {ax2 - ax1} × {ay2 - ay1} px"
+            if self.field_selections:
+                text += f" • Fields: {', '.join(self.field_selections)}"
+            self.info_label.configure(text=text, fg='#4ecca3')
         else:
             self.info_label.configure(
                 text="No region selected",
@@ -343,7 +640,23 @@ class RegionSelector:
             messagebox.showwarning("Region Too Small", "Please select a larger region.")
             return
         
-        save_region(x1, y1, x2, y2)
+        if self.anchor_selection:
+            ax1, ay1, ax2, ay2 = self.anchor_selection
+            if (ax2 - ax1) < 8 or (ay2 - ay1) < 8:
+                messagebox.showwarning("Anchor Too Small", "Please mark a larger HUD anchor.")
+                return
+        
+        for name, (fx1, fy1, fx2, fy2) in self.field_selections.items():
+            if (fx2 - fx1) < 10 or (fy2 - fy1) < 5:
+                messagebox.showwarning("Field Too Small", f"Please draw a larger {name} region.")
+                return
+        
+        save_region(x1, y1, x2, y2, image_size=self.original_image.size,
+                    fields=self.field_selections)
+        
+        if self.anchor_selection:
+            import hud_locator  # Imports this module
+            hud_locator.save_anchor(self.original_image, self.anchor_selection, self.selection)
         
         if self.on_save:
             self.on_save(x1, y1, x2, y2)
@@ -356,7 +669,15 @@ class RegionSelector:
         if self.rect_id:
             self.canvas.delete(self.rect_id)
             self.rect_id = None
+        if self.anchor_rect_id:
+            self.canvas.delete(self.anchor_rect_id)
+            self.anchor_rect_id = None
+        for rect_id in self.field_rect_ids.values():
+            self.canvas.delete(rect_id)
+        self.field_rect_ids.clear()
         self.selection = None
+        self.anchor_selection = None
+        self.field_selections.clear()
         self._update_info()
     
     def _cancel(self):
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Scan region auto-tightening for SC Signature Scanner.
+
+Users tend to draw generous scan regions, and OCR time grows with the
+crop. The tuner records where inside the configured region the digits
+were actually found on recent successful scans and, once it has enough
+history, crops to the bounding box of those detections plus a safety
+margin.
+
+A tightened scan that finds nothing is retried on the full region by the
+scanner. If the full region then succeeds, the tight crop missed; too
+many misses revert to the full region and the tuner waits for fresh
+history before tightening again.
+
+Statistics are per configured region (in memory, per session), so a
+changed region or screenshot size starts over.
+"""
+
+import math
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Tuple
+
+Rect = Tuple[int, int, int, int]
+NormRect = Tuple[float, float, float, float]  # Fractions of the full region
+
+
+HISTORY_SIZE = 30  # Recent detections kept per region
+MIN_SAMPLES = 10  # Detections needed before tightening
+MARGIN_X = 1.0  # Horizontal safety margin, in text heights (about one digit)
+MARGIN_Y = 0.5  # Vertical safety margin, in text heights
+MIN_GAIN = 0.8  # Only tighten if the crop shrinks to at most this area fraction
+OUTCOME_WINDOW = 10  # Recent tightened scans checked for misses
+MAX_MISSES = 2  # Misses within the window that trigger a revert
+
+
+@dataclass
+class _RegionStats:
+    boxes: Deque[NormRect] = field(default_factory=lambda: deque(maxlen=HISTORY_SIZE))
+    outcomes: Deque[bool] = field(default_factory=lambda: deque(maxlen=OUTCOME_WINDOW))  # True = miss
+    tight: Optional[NormRect] = None
+    reverts: int = 0
+
+
+class RegionTuner:
+    """Learns a tighter crop inside each configured scan region."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._stats: Dict[Rect, _RegionStats] = {}
+        self._lock = threading.Lock()
+
+    def tightened(self, region: Rect) -> Optional[Rect]:
+        """Get the tightened crop for a configured region (None = use it as is)."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            stats = self._stats.get(region)
+            if stats is None or stats.tight is None:
+                return None
+            return _to_pixels(region, stats.tight)
+
+    def record(self, region: Rect, text_box: Optional[Rect], tight_missed: bool = False):
+        """Record the outcome of a scan.
+
+        Args:
+            region: Configured (full) scan region, in image pixels
+            text_box: Where the digits were found, in image pixels
+                (None if nothing was found)
+            tight_missed: The tightened crop found nothing but the full
+                region did
+        """
+        with self._lock:
+            stats = self._stats.setdefault(region, _RegionStats())
+
+            if stats.tight is not None:
+                stats.outcomes.append(tight_missed)
+                if sum(stats.outcomes) >= MAX_MISSES:
+                    self._revert(stats)
+
+            if text_box is not None:
+                stats.boxes.append(_normalize(region, text_box))
+                if stats.tight is None and len(stats.boxes) >= MIN_SAMPLES:
+                    stats.tight = self._propose(region, stats)
+
+    def proposal(self, region: Rect) -> Optional[Rect]:
+        """Tightened crop suggested by the current history (even if disabled)."""
+        with self._lock:
+            stats = self._stats.get(region)
+            if stats is None or len(stats.boxes) < MIN_SAMPLES:
+                return None
+            tight = stats.tight or self._propose(region, stats)
+            return _to_pixels(region, tight) if tight else None
+
+    def status(self, region: Rect) -> Dict[str, object]:
+        """Summary for logging/debug output."""
+        with self._lock:
+            stats = self._stats.get(region) or _RegionStats()
+            area = None
+            if stats.tight:
+                x1, y1, x2, y2 = stats.tight
+                area = round((x2 - x1) * (y2 - y1), 3)
+            return {
+                'samples': len(stats.boxes),
+                'tightened': stats.tight is not None,
+                'area_fraction': area,
+                'recent_misses': sum(stats.outcomes),
+                'reverts': stats.reverts,
+            }
+
+    def reset(self):
+        """Forget all history (e.g. after the region was redefined)."""
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def _propose(region: Rect, stats: _RegionStats) -> Optional[NormRect]:
+        """Union of recent detections plus margin, if it is a worthwhile cut."""
+        x1 = min(b[0] for b in stats.boxes)
+        y1 = min(b[1] for b in stats.boxes)
+        x2 = max(b[2] for b in stats.boxes)
+        y2 = max(b[3] for b in stats.boxes)
+
+        # Margins scale with the median text height. Boxes are normalized per
+        # axis, so convert the height to a fraction of the region width.
+        heights = sorted(b[3] - b[1] for b in stats.boxes)
+        text_h = heights[len(heights) // 2]
+        rx1, ry1, rx2, ry2 = region
+        mx = MARGIN_X * text_h * (ry2 - ry1) / max(1, rx2 - rx1)
+        my = MARGIN_Y * text_h
+
+        tight = (max(0.0, x1 - mx), max(0.0, y1 - my), min(1.0, x2 + mx), min(1.0, y2 + my))
+        if (tight[2] - tight[0]) * (tight[3] - tight[1]) > MIN_GAIN:
+            return None
+        return tight
+
+    @staticmethod
+    def _revert(stats: _RegionStats):
+        stats.tight = None
+        stats.outcomes.clear()
+        stats.boxes.clear()  # Require fresh history before tightening again
+        stats.reverts += 1
+
+
+def _normalize(region: Rect, box: Rect) -> NormRect:
+    rx1, ry1, rx2, ry2 = region
+    w = max(1, rx2 - rx1)
+    h = max(1, ry2 - ry1)
+    bx1, by1, bx2, by2 = box
+    return (
+        min(1.0, max(0.0, (bx1 - rx1) / w)),
+        min(1.0, max(0.0, (by1 - ry1) / h)),
+        min(1.0, max(0.0, (bx2 - rx1) / w)),
+        min(1.0, max(0.0, (by2 - ry1) / h)),
+    )
+
+
+def _to_pixels(region: Rect, norm: NormRect) -> Rect:
+    rx1, ry1, rx2, ry2 = region
+    w = rx2 - rx1
+    h = ry2 - ry1
+    return (
+        rx1 + int(norm[0] * w),
+        ry1 + int(norm[1] * h),
+        rx1 + math.ceil(norm[2] * w),
+        ry1 + math.ceil(norm[3] * h),
+    )
@@ -5,7 +5,7 @@ Regolith.rocks API Client for SC Signature Scanner.
 Handles:
 - API key validation
 - Data fetching (lookups, survey data)
-- Local cache management (7-day expiry)
+- Local cache management (7-day expiry, compact format - see cache_format.py)
 
 API Documentation: See RegolithAPI/API_DOCUMENTATION.md
 """
@@ -14,23 +14,91 @@ import json
 import requests
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterable, Optional, Tuple
 
+import cache_format
+import http_client
 import paths
 
 
 # API Configuration
 API_URL = "https://api.regolith.rocks"
-CACHE_FILE = "regolith_cache.json"
+API_HOST = "api.regolith.rocks"
+CACHE_FILE = "regolith_cache.bin"
+LEGACY_CACHE_FILE = "regolith_cache.json"  # Pre-compact format, migrated on first load
+BUDGET_FILE = "regolith_budget.json"
+DAILY_REQUEST_LIMIT = 3600
 CACHE_MAX_AGE_DAYS = 7
 CURRENT_EPOCH = "4.4"  # Current Star Citizen version
 
+# Cache keys stored in the file header (everything else is a body section)
+HEADER_KEYS = ("last_updated", "epoch", "datasets", "errors")
+
+# Sections kept in memory - the projection pricing uses
+PROJECTED_SECTIONS = ("rock_compositions", "lookups")
+
+# Systems kept from the rock composition survey
+SYSTEMS = ["STANTON", "PYRO", "NYX"]
+
+# Survey datasets fetched on refresh: cache key -> Regolith dataName
+SURVEY_DATASETS = {
+    "rock_compositions": "shipOreByRockClassProb",
+    "location_bonuses": "bonusMap",
+}
+
+LOOKUPS_FIELDS = """
+    lookups {
+        CIG {
+            densitiesLookups
+            methodsBonusLookup
+            oreProcessingLookup
+        }
+        UEX {
+            maxPrices
+            refineryBonuses
+        }
+    }
+"""
+
+SURVEY_FIELDS = """
+        data
+        dataName
+        epoch
+        lastUpdated
+"""
+
+# Freshness check only - compared against the cached "datasets" metadata
+SURVEY_META_FIELDS = """
+        dataName
+        epoch
+        lastUpdated
+"""
+
 
 class RegolithAPIError(Exception):
     """Exception for Regolith API errors."""
     pass
 
 
+class RegolithUnavailableError(RegolithAPIError):
+    """The API could not answer right now (offline, quota, server trouble).
+
+    Says nothing about the API key - retry later instead of asking for a
+    new one.
+    """
+    pass
+
+
+def _http() -> http_client.HTTPClient:
+    """Shared HTTP client, with the Regolith daily quota attached."""
+    client = http_client.get_client()
+    client.ensure_budget(
+        API_HOST, DAILY_REQUEST_LIMIT, 24 * 3600,
+        state_file=paths.get_user_data_path() / BUDGET_FILE
+    )
+    return client
+
+
 class RegolithAPI:
     """Client for Regolith.rocks GraphQL API."""
     
@@ -42,7 +110,10 @@ class RegolithAPI:
         """
         self.api_key = api_key
         self.cache_path = paths.get_user_data_path() / CACHE_FILE
-        self._cache: Optional[Dict[str, Any]] = None
+        self.legacy_cache_path = paths.get_user_data_path() / LEGACY_CACHE_FILE
+        self._cache: Optional[Dict[str, Any]] = None  # Header + projected sections
+        self._header: Optional[Dict[str, Any]] = None
+        self._header_mtime: Optional[int] = None
     
     def set_api_key(self, api_key: str):
         """Set or update the API key."""
@@ -61,6 +132,23 @@ class RegolithAPI:
         Raises:
             RegolithAPIError: On API errors or network issues
         """
+        body = self._post(query, variables)
+        
+        if "errors" in body:
+            error_msg = body["errors"][0].get("message", "Unknown API error")
+            raise RegolithAPIError(f"API error: {error_msg}")
+        
+        return body.get("data") or {}
+    
+    def _post(self, query: str, variables: Dict = None) -> Dict[str, Any]:
+        """Send a GraphQL document and return the full response body.
+        
+        GraphQL errors are left in the body (under "errors") so batched
+        queries can keep the fields that did resolve.
+        
+        Raises:
+            RegolithAPIError: On HTTP errors or network issues
+        """
         if not self.api_key:
             raise RegolithAPIError("API key not set")
         
@@ -74,42 +162,44 @@ class RegolithAPI:
             payload["variables"] = variables
         
         try:
-            response = requests.post(API_URL, json=payload, headers=headers, timeout=30)
+            response = _http().post(API_URL, json=payload, headers=headers, timeout=30)
             response.raise_for_status()
             
-            data = response.json()
-            
-            if "errors" in data:
-                error_msg = data["errors"][0].get("message", "Unknown API error")
-                raise RegolithAPIError(f"API error: {error_msg}")
-            
-            return data.get("data", {})
+            return response.json()
             
+        except http_client.BudgetExceededError as e:
+            raise RegolithUnavailableError(f"Daily request limit reached ({DAILY_REQUEST_LIMIT:,}/day). "
+                                           f"Try again in {e.retry_in / 60:.0f} min.")
+        except http_client.CircuitOpenError:
+            raise RegolithUnavailableError("Regolith.rocks API unreachable. Will retry shortly.")
         except requests.exceptions.Timeout:
-            raise RegolithAPIError("API request timed out")
+            raise RegolithUnavailableError("API request timed out")
         except requests.exceptions.ConnectionError:
-            raise RegolithAPIError("Could not connect to Regolith.rocks API")
+            raise RegolithUnavailableError("Could not connect to Regolith.rocks API")
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 401:
                 raise RegolithAPIError("Invalid API key")
             elif e.response.status_code == 403:
                 raise RegolithAPIError("API key unauthorized")
             elif e.response.status_code == 429:
-                raise RegolithAPIError("Rate limit exceeded (3,600 requests/day)")
+                raise RegolithUnavailableError("Rate limit exceeded (3,600 requests/day)")
             elif e.response.status_code >= 500:
-                raise RegolithAPIError(f"Regolith.rocks server error ({e.response.status_code}). Try again later.")
+                raise RegolithUnavailableError(f"Regolith.rocks server error ({e.response.status_code}). Try again later.")
             else:
                 raise RegolithAPIError(f"HTTP error: {e.response.status_code}")
-        except json.JSONDecodeError:
-            raise RegolithAPIError("Invalid response from API")
+        except (json.JSONDecodeError, ValueError):
+            raise RegolithUnavailableError("Invalid response from API")
+        except requests.exceptions.RequestException as e:
+            raise RegolithUnavailableError(f"Request failed: {e}")
     
-    def validate_key(self) -> Tuple[bool, str]:
+    def validate_key(self) -> Tuple[Optional[bool], str]:
         """Validate the API key by fetching user profile.
         
         Returns:
             Tuple of (is_valid, message)
             - If valid: (True, username)
             - If invalid: (False, error_message)
+            - If the API could not be reached: (None, error_message)
         """
         query = """
         {
@@ -134,6 +224,8 @@ class RegolithAPI:
             
             return True, f"{sc_name} ({plan})"
             
+        except RegolithUnavailableError as e:
+            return None, str(e)
         except RegolithAPIError as e:
             return False, str(e)
     
@@ -143,23 +235,7 @@ class RegolithAPI:
         Returns:
             Dict with CIG and UEX lookup data
         """
-        query = """
-        {
-            lookups {
-                CIG {
-                    densitiesLookups
-                    methodsBonusLookup
-                    oreProcessingLookup
-                }
-                UEX {
-                    maxPrices
-                    refineryBonuses
-                }
-            }
-        }
-        """
-        
-        data = self._make_request(query)
+        data = self._make_request("{" + LOOKUPS_FIELDS + "}")
         return data.get("lookups", {})
     
     def fetch_survey_data(self, data_name: str, epoch: str = CURRENT_EPOCH) -> Dict[str, Any]:
@@ -174,11 +250,7 @@ class RegolithAPI:
         """
         query = """
         query ($dataName: String!, $epoch: String!) {
-            surveyData(dataName: $dataName, epoch: $epoch) {
-                data
-                dataName
-                epoch
-                lastUpdated
+            surveyData(dataName: $dataName, epoch: $epoch) {""" + SURVEY_FIELDS + """
             }
         }
         """
@@ -189,57 +261,161 @@ class RegolithAPI:
         survey = data.get("surveyData", {})
         return survey.get("data", {})
     
-    def fetch_all_data(self) -> Dict[str, Any]:
+    def build_refresh_query(self, datasets: Iterable[str] = SURVEY_DATASETS,
+                            with_data: bool = True, with_lookups: bool = True) -> str:
+        """Build one GraphQL document for lookups and survey datasets.
+        
+        Each dataset is an aliased surveyData field (aliased by its cache
+        key), so a refresh is a single request against the daily quota.
+        
+        Args:
+            datasets: Cache keys of the survey datasets to include
+            with_data: Include dataset contents (False = freshness metadata only)
+            with_lookups: Include the lookups block
+        """
+        fields = [LOOKUPS_FIELDS] if with_lookups else []
+        selection = SURVEY_FIELDS if with_data else SURVEY_META_FIELDS
+        for key in datasets:
+            fields.append(
+                f'    {key}: surveyData(dataName: "{SURVEY_DATASETS[key]}", epoch: $epoch) {{'
+                + selection + '    }\n'
+            )
+        return "query ($epoch: String!) {" + "".join(fields) + "}"
+    
+    def _post_batch(self, query: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """Send a batched document.
+        
+        Returns:
+            Tuple of (data, errors keyed by the top-level field they came from)
+        """
+        body = self._post(query, {"epoch": CURRENT_EPOCH})
+        
+        errors: Dict[str, str] = {}
+        for error in body.get("errors") or []:
+            path = error.get("path") or ["request"]
+            errors.setdefault(str(path[0]), error.get("message", "Unknown API error"))
+        
+        return body.get("data") or {}, errors
+    
+    def fetch_all_data(self, previous: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Fetch all required data for the scanner.
         
+        With a previous cache, the first request fetches lookups plus only
+        the lastUpdated stamp of each survey dataset; datasets whose stamp
+        changed are fetched in a second request and merged into the
+        previous data. Without one, everything comes in a single request.
+        
+        A dataset that fails keeps its previous contents (or is left empty)
+        and is reported under "errors" instead of failing the whole
+        refresh. Lookups are required.
+        
+        Args:
+            previous: Previously cached data to refresh incrementally
+        
         Returns:
-            Complete data dict with lookups and survey data
+            Complete data dict with lookups, survey data and per-dataset metadata
+            
+        Raises:
+            RegolithAPIError: If the request fails or lookups are missing
         """
+        if previous and previous.get("epoch") != CURRENT_EPOCH:
+            previous = None  # New game version - nothing to reuse
+        known = (previous or {}).get("datasets", {})
+        incremental = bool(previous) and all(key in known for key in SURVEY_DATASETS)
+        
+        data, errors = self._post_batch(self.build_refresh_query(with_data=not incremental))
+        
+        if not data.get("lookups"):
+            message = errors.get("lookups") or errors.get("request") or "No lookup data returned"
+            raise RegolithAPIError(f"API error: {message}")
+        
         result = {
             "last_updated": datetime.utcnow().isoformat() + "Z",
             "epoch": CURRENT_EPOCH,
-            "lookups": {},
+            "lookups": data["lookups"],
             "rock_compositions": {},
-            "location_bonuses": {}
+            "location_bonuses": {},
+            "datasets": {}
         }
         
-        # Fetch lookups (prices, densities, refinery methods)
-        result["lookups"] = self.fetch_lookups()
+        if incremental:
+            changed = [
+                key for key in SURVEY_DATASETS
+                if key not in errors and self._dataset_meta(data.get(key)) != known[key]
+            ]
+            if changed:
+                changed_data, changed_errors = self._post_batch(
+                    self.build_refresh_query(changed, with_lookups=False)
+                )
+                errors.update(changed_errors)
+                data.update(changed_data)
+        else:
+            changed = list(SURVEY_DATASETS)
         
-        # Fetch rock compositions by type (for signature → value calculation)
-        for system in ["STANTON", "PYRO", "NYX"]:
-            try:
-                rock_data = self.fetch_survey_data("shipOreByRockClassProb")
-                if system in rock_data:
-                    result["rock_compositions"][system] = rock_data[system]
-            except RegolithAPIError:
-                pass  # System might not have data
+        for key in SURVEY_DATASETS:
+            survey = data.get(key)
+            if key in changed and key not in errors and survey:
+                result[key] = self._extract_dataset(key, survey.get("data") or {})
+                result["datasets"][key] = self._dataset_meta(survey)
+            elif previous and key in previous.get("datasets", {}):
+                # Unchanged (or failed) - keep what we have
+                result[key] = previous.get(key, {})
+                result["datasets"][key] = previous["datasets"][key]
         
-        # Fetch location bonuses
-        try:
-            result["location_bonuses"] = self.fetch_survey_data("bonusMap")
-        except RegolithAPIError:
-            result["location_bonuses"] = {}
+        errors.pop("lookups", None)
+        if errors:
+            result["errors"] = errors
+            for key, message in errors.items():
+                print(f"Warning: Regolith dataset '{key}' failed: {message}")
         
+        result["changed"] = [key for key in changed if key in result["datasets"] and key not in errors]
         return result
     
+    @staticmethod
+    def _dataset_meta(survey: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Freshness metadata of a surveyData response."""
+        survey = survey or {}
+        return {
+            "dataName": survey.get("dataName"),
+            "epoch": survey.get("epoch"),
+            "lastUpdated": survey.get("lastUpdated"),
+        }
+    
+    @staticmethod
+    def _extract_dataset(key: str, survey_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a survey dataset into its cached form."""
+        if key == "rock_compositions":
+            # Rock compositions by type (for signature -> value calculation)
+            return {system: survey_data[system] for system in SYSTEMS if system in survey_data}
+        return survey_data
+    
     # === Cache Management ===
     
-    def load_cache(self) -> Optional[Dict[str, Any]]:
+    def load_cache(self, sections: Optional[Iterable[str]] = PROJECTED_SECTIONS) -> Optional[Dict[str, Any]]:
         """Load cached data from disk.
         
+        Only the requested sections are decompressed. The default projection
+        (what pricing uses) is also kept in memory.
+        
+        Args:
+            sections: Body sections to load (None = everything)
+        
         Returns:
-            Cached data dict, or None if no valid cache exists
+            Cached data dict (header fields + sections), or None if no valid cache exists
         """
+        self._migrate_legacy_cache()
         if not self.cache_path.exists():
             return None
         
         try:
-            with open(self.cache_path, 'r', encoding='utf-8') as f:
-                self._cache = json.load(f)
-                return self._cache
-        except (json.JSONDecodeError, IOError):
+            header, loaded = cache_format.read(self.cache_path, sections)
+        except (cache_format.CacheFormatError, OSError):
             return None
+        
+        data = {**header, **loaded}
+        if sections == PROJECTED_SECTIONS:
+            self._cache = data
+        return data
     
     def save_cache(self, data: Dict[str, Any]):
         """Save data to cache file.
@@ -247,36 +423,67 @@ class RegolithAPI:
         Args:
             data: Data dict to cache
         """
-        self._cache = data
+        header = {key: data[key] for key in HEADER_KEYS if key in data}
+        sections = {key: value for key, value in data.items() if key not in HEADER_KEYS}
+        self._cache = {**header, **{key: sections[key] for key in PROJECTED_SECTIONS if key in sections}}
         
         try:
-            with open(self.cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
-        except IOError as e:
+            cache_format.write(self.cache_path, header, sections)
+        except OSError as e:
             print(f"Warning: Could not save cache: {e}")
     
+    def _migrate_legacy_cache(self):
+        """Convert an old JSON cache to the compact format."""
+        if self.cache_path.exists() or not self.legacy_cache_path.exists():
+            return
+        try:
+            with open(self.legacy_cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.save_cache(data)
+            self.legacy_cache_path.unlink()
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not migrate old cache: {e}")
+    
+    def _read_header(self) -> Optional[Dict[str, Any]]:
+        """Cache header, re-read only when the file changes."""
+        self._migrate_legacy_cache()
+        try:
+            mtime = self.cache_path.stat().st_mtime_ns
+        except OSError:
+            self._header = self._header_mtime = None
+            return None
+        
+        if mtime != self._header_mtime:
+            try:
+                self._header = cache_format.read_header(self.cache_path)
+            except (cache_format.CacheFormatError, OSError):
+                self._header = None
+            self._header_mtime = mtime
+        return self._header
+    
+    def _cache_age(self) -> Optional[timedelta]:
+        """Age of the cached data, or None if unknown."""
+        header = self._read_header()
+        if not header or not header.get("last_updated"):
+            return None
+        
+        try:
+            # Parse ISO format timestamp
+            last_updated = datetime.fromisoformat(header["last_updated"].replace("Z", "+00:00"))
+            return datetime.now(last_updated.tzinfo) - last_updated
+        except (ValueError, TypeError, AttributeError):
+            return None
+    
     def is_cache_valid(self) -> bool:
         """Check if cache exists and is less than 7 days old.
         
+        Reads only the cache header.
+        
         Returns:
             True if cache is valid, False otherwise
         """
-        cache = self.load_cache()
-        if not cache:
-            return False
-        
-        last_updated_str = cache.get("last_updated")
-        if not last_updated_str:
-            return False
-        
-        try:
-            # Parse ISO format timestamp
-            last_updated = datetime.fromisoformat(last_updated_str.replace("Z", "+00:00"))
-            age = datetime.now(last_updated.tzinfo) - last_updated
-            
-            return age < timedelta(days=CACHE_MAX_AGE_DAYS)
-        except (ValueError, TypeError):
-            return False
+        age = self._cache_age()
+        return age is not None and age < timedelta(days=CACHE_MAX_AGE_DAYS)
     
     def get_cache_age_str(self) -> str:
         """Get human-readable cache age.
@@ -284,32 +491,25 @@ class RegolithAPI:
         Returns:
             String like "2 days ago" or "Unknown"
         """
-        cache = self.load_cache()
-        if not cache:
+        if self._read_header() is None:
             return "No cache"
         
-        last_updated_str = cache.get("last_updated")
-        if not last_updated_str:
+        age = self._cache_age()
+        if age is None:
             return "Unknown"
         
-        try:
-            last_updated = datetime.fromisoformat(last_updated_str.replace("Z", "+00:00"))
-            age = datetime.now(last_updated.tzinfo) - last_updated
-            
-            if age.days == 0:
-                hours = age.seconds // 3600
-                if hours == 0:
-                    return "Just now"
-                elif hours == 1:
-                    return "1 hour ago"
-                else:
-                    return f"{hours} hours ago"
-            elif age.days == 1:
-                return "1 day ago"
+        if age.days == 0:
+            hours = age.seconds // 3600
+            if hours == 0:
+                return "Just now"
+            elif hours == 1:
+                return "1 hour ago"
             else:
-                return f"{age.days} days ago"
-        except (ValueError, TypeError):
-            return "Unknown"
+                return f"{hours} hours ago"
+        elif age.days == 1:
+            return "1 day ago"
+        else:
+            return f"{age.days} days ago"
     
     def get_cached_data(self) -> Optional[Dict[str, Any]]:
         """Get cached data if available.
@@ -321,24 +521,37 @@ class RegolithAPI:
             return self._cache
         return self.load_cache()
     
-    def refresh_cache(self) -> Tuple[bool, str]:
+    def refresh_cache(self, force: bool = False) -> Tuple[bool, str]:
         """Fetch fresh data and update cache.
         
+        Only survey datasets whose lastUpdated changed are downloaded,
+        unless force is set.
+        
         Returns:
             Tuple of (success, message)
         """
         try:
-            data = self.fetch_all_data()
+            # Full cache (not just the projection) so unchanged datasets are kept
+            previous = None if force else self.load_cache(sections=None)
+            data = self.fetch_all_data(previous)
+            changed = data.pop("changed", [])
             self.save_cache(data)
+            if data.get("errors"):
+                failed = ", ".join(sorted(data["errors"]))
+                return True, f"Data refreshed (epoch {CURRENT_EPOCH}), partial: {failed} unavailable"
+            if previous and not changed:
+                return True, f"Data up to date (epoch {CURRENT_EPOCH})"
             return True, f"Data refreshed (epoch {CURRENT_EPOCH})"
         except RegolithAPIError as e:
             return False, str(e)
     
     def clear_cache(self):
         """Delete the cache file."""
-        if self.cache_path.exists():
-            self.cache_path.unlink()
+        for path in (self.cache_path, self.legacy_cache_path):
+            if path.exists():
+                path.unlink()
         self._cache = None
+        self._header = self._header_mtime = None
 
 
 # === Module-level convenience functions ===
@@ -365,14 +578,15 @@ def get_api(api_key: str = None) -> RegolithAPI:
     return _instance
 
 
-def validate_api_key(api_key: str) -> Tuple[bool, str]:
+def validate_api_key(api_key: str) -> Tuple[Optional[bool], str]:
     """Validate an API key.
     
     Args:
         api_key: Key to validate
         
     Returns:
-        Tuple of (is_valid, message)
+        Tuple of (is_valid, message) - is_valid is None if the API could
+        not be reached
     """
     api = get_api(api_key)
     return api.validate_key()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Result types for SC Signature Scanner.
+
+Compact, slotted records returned by the scanner instead of nested dicts.
+Every record also answers dict-style lookups (``result.get('matches')``,
+``match['name']``) so existing UI code keeps working, and ``as_dict()``
+produces a plain dict copy for JSON output or logging.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+
+class _DictView:
+    """Read-only dict view over a slotted dataclass.
+
+    Fields that are None are treated as missing keys, matching how the old
+    dict results simply omitted optional entries.
+    """
+
+    __slots__ = ()
+
+    # Dict key -> attribute name, for keys that are not valid identifiers
+    # or use the API's camelCase spelling
+    _KEY_MAP: ClassVar[Dict[str, str]] = {}
+
+    def _attr_name(self, key: str) -> str:
+        attr = self._KEY_MAP.get(key, key)
+        if attr.startswith('_') or attr not in self.__dataclass_fields__:
+            raise KeyError(key)
+        return attr
+
+    def __getitem__(self, key: str) -> Any:
+        value = getattr(self, self._attr_name(key))
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Dict-style get; returns default for unset (None) fields."""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        """Dict keys of all set fields."""
+        reverse = {v: k for k, v in self._KEY_MAP.items()}
+        return [
+            reverse.get(f.name, f.name)
+            for f in fields(self)
+            if getattr(self, f.name) is not None
+        ]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a plain dict copy (nested records converted too)."""
+        return {key: _plain(self[key]) for key in self.keys()}
+
+
+def _plain(value: Any) -> Any:
+    """Convert records (and tuples of records) to plain dicts/lists."""
+    if isinstance(value, _DictView):
+        return value.as_dict()
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+@dataclass(slots=True)
+class OreShare(_DictView):
+    """One mineral in a rock's composition."""
+
+    _KEY_MAP: ClassVar[Dict[str, str]] = {'medPct': 'med_pct'}
+
+    name: str
+    prob: float
+    med_pct: float
+    value: int = 0
+    price: float = 0
+
+
+@dataclass(slots=True)
+class Match(_DictView):
+    """A possible target for a signature value.
+
+    ``composition`` and ``possible_minerals`` are immutable tuples shared
+    between matches (and with the scanner's lookups) rather than copies.
+    """
+
+    type: str
+    name: str
+    signature: int
+    confidence: float
+    count: Optional[int] = None
+    base_signature: Optional[int] = None
+    panels: Optional[int] = None
+    rock_type: Optional[str] = None
+    category: Optional[str] = None
+    est_value: Optional[int] = None
+    composition: Optional[Tuple[OreShare, ...]] = None
+    variant: Optional[str] = None
+    mining_method: Optional[str] = None
+    single_mineral: Optional[bool] = None
+    possible_minerals: Optional[Tuple[str, ...]] = None
+    mass: Optional[float] = None  # Measured mass the value is based on (None = median)
+
+
+@dataclass(slots=True)
+class Target(_DictView):
+    """One signature label found by a full-frame scan."""
+
+    signature: int
+    box: Tuple[int, int, int, int]  # Label position (x1, y1, x2, y2) in screenshot pixels
+    confidence: float
+    matches: Tuple[Match, ...] = ()
+
+
+@dataclass(slots=True)
+class ScanResult(_DictView):
+    """Outcome of scanning one screenshot.
+
+    Either ``signature`` (with matches) or ``error`` is set. Full-frame
+    scans also list every label in ``targets``; ``signature`` is then the
+    largest of them.
+    """
+
+    signature: Optional[int] = None
+    all_signatures: Optional[Tuple[int, ...]] = None
+    matches: Optional[Tuple[Match, ...]] = None
+    method: Optional[str] = None
+    ocr_confidence: Optional[float] = None
+    debug: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    prices_as_of: Optional[float] = None  # Epoch seconds of the UEX prices used
+
+    # Extra HUD readouts, if their regions are configured and were read
+    mass: Optional[float] = None
+    instability: Optional[float] = None
+    resistance: Optional[float] = None
+
+    targets: Optional[Tuple[Target, ...]] = None  # Full-frame scans only
@@ -13,13 +13,20 @@ OCR Engine: EasyOCR (deep learning based)
 
 import json
 import re
-from datetime import datetime
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from PIL import Image
 import numpy as np
 
+import frame_scan
 import paths
+import png_stream
+from debug_writer import DebugArtifactWriter
+from region_tuner import RegionTuner
+from results import ScanResult, Match, OreShare, Target
 
 try:
     import pricing
@@ -30,6 +37,7 @@ except ImportError:
 # Import region selector for scan region
 try:
     import region_selector
+    import hud_locator
     HAS_REGION_SELECTOR = True
 except ImportError:
     HAS_REGION_SELECTOR = False
@@ -104,6 +112,184 @@ SIGNATURE_TO_ROCK_TYPE = {
 }
 
 
+# Height of EasyOCR's recognition model input (imgH). Crops shorter than this
+# are upscaled to it once during preprocessing. Taller crops keep their
+# resolution - the region is drawn with margin, so shrinking the whole crop
+# to this height would shrink the digits far below it.
+RECOGNIZER_HEIGHT = 64
+
+# Extra HUD readouts are stitched next to the signature crop and read in the
+# same OCR call, separated by this many blank columns
+FIELD_GAP = RECOGNIZER_HEIGHT
+
+SIGNATURE_ALLOWLIST = '0123456789.'
+FIELD_ALLOWLIST = '0123456789.%'  # Resistance is shown as a percentage
+
+# Spare buffers kept per shape - enough for the scans in flight in the pipeline
+MAX_POOLED_BUFFERS = 4
+
+# Valuation prewarming: rock types of recent results predict the next ones
+RECENT_ROCK_TYPES = 20
+PREWARM_ROCK_TYPES = 3
+
+
+class BufferPool:
+    """Reusable numpy buffers keyed by shape and dtype.
+    
+    The scan region is the same size on every screenshot, so preprocessing
+    can reuse the same arrays instead of allocating new ones per frame.
+    """
+    
+    def __init__(self, max_per_shape: int = MAX_POOLED_BUFFERS):
+        self.max_per_shape = max_per_shape
+        self._free: Dict[Tuple[Tuple[int, ...], str], List[np.ndarray]] = {}
+        self._lock = threading.Lock()
+    
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        """Get a buffer of the given shape. Contents are undefined."""
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                return free.pop()
+        return np.empty(shape, dtype=dtype)
+    
+    def release(self, buffer: Optional[np.ndarray]):
+        """Return a buffer to the pool. The caller must not use it afterwards."""
+        if buffer is None:
+            return
+        key = (buffer.shape, buffer.dtype.str)
+        with self._lock:
+            free = self._free.setdefault(key, [])
+            if len(free) < self.max_per_shape:
+                free.append(buffer)
+
+
+class ValuationCache:
+    """Rock valuations (at median mass) for the current pricing snapshot.
+    
+    Entries are only valid for the snapshot they were computed from; a new
+    snapshot (price refresh, yield change) empties the cache. The rock
+    types of recent results are remembered so the likely next ones can be
+    valued ahead of time, while OCR is still running.
+    """
+    
+    def __init__(self, history: int = RECENT_ROCK_TYPES):
+        self._version: Optional[int] = None
+        self._entries: Dict[Tuple[str, str], Tuple[float, Tuple[OreShare, ...]]] = {}
+        self._recent: deque = deque(maxlen=history)
+        self._lock = threading.Lock()
+    
+    def get(self, prices: Any, system: str, rock_type: str,
+            compute: Callable[[], Tuple[float, Tuple[OreShare, ...]]]) -> Tuple[float, Tuple[OreShare, ...]]:
+        """Get a valuation, computing and storing it if it is not cached."""
+        key = (system, rock_type)
+        with self._lock:
+            if self._version is not None and prices.version < self._version:
+                cached = None  # Scan still holding an older snapshot
+            else:
+                if self._version != prices.version:
+                    self._version = prices.version
+                    self._entries.clear()
+                cached = self._entries.get(key)
+        if cached is not None:
+            return cached
+        
+        valuation = compute()
+        with self._lock:
+            if self._version == prices.version:
+                self._entries[key] = valuation
+        return valuation
+    
+    def note(self, rock_type: str):
+        """Remember the rock type of a result."""
+        with self._lock:
+            self._recent.append(rock_type)
+    
+    def likely(self, count: int = PREWARM_ROCK_TYPES) -> List[str]:
+        """Rock types seen most often in recent results."""
+        with self._lock:
+            return [rock_type for rock_type, _ in Counter(self._recent).most_common(count)]
+
+
+@dataclass
+class ScanContext:
+    """Per-scan state, so one SignatureScanner can serve several threads.
+    
+    Debug settings are snapshotted when the scan starts; toggling debug mode
+    mid-scan does not affect scans already in flight.
+    """
+    image_path: Optional[Path] = None
+    debug: bool = False
+    full_frame: bool = False  # Find every label instead of reading the scan region
+    pre_cropped: bool = False  # In-memory image is already the signature region
+    no_stream: bool = False  # Load the complete file even if streaming is enabled
+    debug_dir: Optional[Path] = None  # This scan's debug folder
+    writer: Optional[DebugArtifactWriter] = None
+    debug_suffix: str = ""  # Added to debug file names (e.g. "_retry" for a second attempt)
+    info: Dict[str, Any] = field(default_factory=dict)
+    
+    # Stage outputs (filled in as the scan progresses)
+    image: Optional[Image.Image] = None
+    stream: Optional[png_stream.PngStream] = None  # Screenshot still being written (unverified)
+    region: Optional[Tuple[int, int, int, int]] = None  # Region actually cropped
+    full_region: Optional[Tuple[int, int, int, int]] = None  # Configured region, if tightened
+    method: str = "fixed"
+    field_regions: Dict[str, Tuple[int, int, int, int]] = field(default_factory=dict)  # Extra readouts
+    field_spans: List[Tuple[str, int, int]] = field(default_factory=list)  # (name, x1, x2) in the stitched crop
+    readouts: Dict[str, float] = field(default_factory=dict)  # Parsed mass, instability, ...
+    enhanced: Optional[np.ndarray] = None
+    frame_gray: Optional[np.ndarray] = None  # Full-frame: grayscale screenshot
+    candidates: List[Tuple[int, int, int, int]] = field(default_factory=list)  # Full-frame: label boxes
+    labels: List[Tuple[Tuple[int, int, int, int], str, float]] = field(default_factory=list)  # Full-frame
+    signatures: List[int] = field(default_factory=list)
+    text_box: Optional[Tuple[int, int, int, int]] = None  # Where the digits were found
+    tight_missed: bool = False  # Tightened crop missed, the full region found it
+    ocr_text: str = ""
+    confidence: float = 0.0
+    result: Optional[ScanResult] = None  # Set when the scan is finished (or failed)
+    
+    @property
+    def is_tightened(self) -> bool:
+        """True while scanning a learned sub-region of the configured region."""
+        return self.full_region is not None and self.region != self.full_region
+    
+    def __post_init__(self):
+        self.info.setdefault('image_path', str(self.image_path) if self.image_path else None)
+        self.info.setdefault('debug_files', [])
+        self.info.setdefault('method', None)
+    
+    def _record(self, name: Optional[str]):
+        if name:
+            self.info['debug_files'].append(name)
+    
+    def _debug_name(self, filename: str) -> str:
+        if not self.debug_suffix:
+            return filename
+        name = Path(filename)
+        return f"{name.stem}{self.debug_suffix}{name.suffix}"
+    
+    def link_original(self, source: Path):
+        """Queue a link/copy of the source screenshot."""
+        if self.writer:
+            self._record(self.writer.link_original(self.debug_dir, source))
+    
+    def save_image(self, filename: str, image):
+        """Queue a debug image (PIL or numpy; must not be modified afterwards)."""
+        if self.writer:
+            self._record(self.writer.save_image(self.debug_dir, self._debug_name(filename), image))
+    
+    def save_annotated(self, filename: str, image: Image.Image, box: Tuple[int, int, int, int]):
+        """Queue a copy of the image with the scan box drawn on it."""
+        if self.writer:
+            self._record(self.writer.save_annotated(self.debug_dir, self._debug_name(filename), image, box))
+    
+    def save_text(self, filename: str, text: str):
+        """Queue a debug text file."""
+        if self.writer:
+            self._record(self.writer.save_text(self.debug_dir, self._debug_name(filename), text))
+
+
 class SignatureScanner:
     """Scans screenshots for signature values using EasyOCR."""
     
@@ -114,13 +300,31 @@ class SignatureScanner:
         
         self.debug_mode = False
         self.debug_dir = paths.get_debug_path()
-        self.last_debug_info = {}
-        self._debug_prefix = ""  # Timestamp prefix for debug files
+        self.last_debug_info = {}  # Debug info of the most recently finished scan
+        self._debug_writer: Optional[DebugArtifactWriter] = None
+        self._debug_writer_lock = threading.Lock()
         
         # EasyOCR reader - lazily initialized on first use
         self._ocr_reader: Optional[Any] = None  # easyocr.Reader when available
         self._ocr_initialized = False
         self._ocr_init_error: Optional[str] = None
+        self._ocr_init_lock = threading.Lock()  # Initialize the reader only once
+        
+        # Preprocessing buffers, reused across scans of the same region size
+        self._buffers = BufferPool()
+        
+        # Learns a tighter crop inside the configured region from detections
+        self.region_tuner = RegionTuner()
+        
+        # Full-frame mode: every signature label on screen (radar view)
+        self.full_frame = False
+        self._detection_grid = frame_scan.DetectionGrid()
+        
+        # Decode PNG screenshots while the game is still writing them
+        self.stream_png = False
+        
+        # Valuations per pricing snapshot, prewarmed from session history
+        self._valuations = ValuationCache()
         
         # Callback for model download progress (set by UI)
         self.on_model_download_start: Optional[callable] = None
@@ -140,10 +344,18 @@ class SignatureScanner:
         if self._ocr_initialized:
             return self._ocr_reader
         
+        with self._ocr_init_lock:
+            # Another thread may have finished while we waited
+            if not self._ocr_initialized:
+                self._init_ocr_reader()
+        return self._ocr_reader
+    
+    def _init_ocr_reader(self):
+        """Create the EasyOCR reader. Caller must hold _ocr_init_lock."""
         if not HAS_EASYOCR:
             self._ocr_init_error = EASYOCR_ERROR or "EasyOCR not installed"
             self._ocr_initialized = True
-            return None
+            return
         
         try:
             # Notify UI that download may start
@@ -176,7 +388,6 @@ class SignatureScanner:
                 print(f"[DEBUG] EasyOCR initialization failed: {e}")
         
         self._ocr_initialized = True
-        return self._ocr_reader
     
     def is_ocr_available(self) -> Tuple[bool, Optional[str]]:
         """Check if OCR is available.
@@ -192,72 +403,287 @@ class SignatureScanner:
         
         return True, None
     
-    def _debug_path(self, filename: str) -> Path:
-        """Generate debug file path with timestamp prefix.
-        
-        Args:
-            filename: Base filename like "00_original.png"
-            
-        Returns:
-            Full path like debug_output/20260112_143052_00_original.png
-        """
-        return self.debug_dir / f"{self._debug_prefix}{filename}"
-    
-    def scan_image(self, image_path: Path) -> Optional[Dict[str, Any]]:
+    def scan_image(self, image_path: Path) -> ScanResult:
         """Scan an image for signature values.
         
         Requires fixed scan region (configured in Settings).
+        Safe to call from several threads at once - all per-scan state
+        lives in a ScanContext.
         """
         # Check OCR availability
         available, error = self.is_ocr_available()
         if not available:
-            return {'error': f'OCR not available: {error}'}
+            return ScanResult(error=f'OCR not available: {error}')
+        
+        return self._scan(self.new_context(image_path))
+    
+    def scan_buffer(self, image: Image.Image, pre_cropped: bool = False) -> ScanResult:
+        """Scan an in-memory screenshot (no file round-trip).
+        
+        Args:
+            image: Screenshot, or with pre_cropped the signature region only
+            pre_cropped: Skip the scan region and read the whole image
+        """
+        available, error = self.is_ocr_available()
+        if not available:
+            return ScanResult(error=f'OCR not available: {error}')
+        
+        return self._scan(self.new_context(image=image, pre_cropped=pre_cropped))
+    
+    def _scan(self, ctx: ScanContext) -> ScanResult:
+        """Run every stage on this thread."""
+        for _, stage in self.scan_stages():
+            if not self.run_stage(stage, ctx):
+                break
+        return self.finish(ctx)
+    
+    def new_context(self, image_path: Optional[Path] = None, image: Optional[Image.Image] = None,
+                    pre_cropped: bool = False) -> ScanContext:
+        """Create per-scan state, snapshotting the debug settings.
         
-        self.last_debug_info = {
-            'image_path': str(image_path),
-            'debug_files': [],
-            'method': None
-        }
+        Args:
+            image_path: Screenshot file to load
+            image: Already loaded screenshot (instead of image_path)
+            pre_cropped: The image is the signature region itself
+        """
+        ctx = ScanContext(
+            image_path=image_path,
+            debug=self.debug_mode,
+            full_frame=self.full_frame and not pre_cropped,
+            pre_cropped=pre_cropped,
+            image=image
+        )
+        if ctx.debug:
+            ctx.writer = self._get_debug_writer()
+            # Unique folder for this scan's debug artifacts
+            ctx.debug_dir = ctx.writer.new_scan_dir(self.debug_dir)
+        return ctx
+    
+    def scan_stages(self) -> List[Tuple[str, Callable[[ScanContext], None]]]:
+        """The scan broken into independent stages, in order.
         
-        # Generate timestamp prefix for this scan session
-        self._debug_prefix = datetime.now().strftime("%Y%m%d_%H%M%S_")
+        Each stage reads its inputs from the context and stores its outputs
+        there, so stages can run on different threads (see pipeline.py).
+        A stage that finishes the scan early sets ctx.result.
+        """
+        return [
+            ('decode', self._stage_decode),
+            ('preprocess', self._stage_preprocess),
+            ('recognize', self._stage_recognize),
+            ('valuate', self._stage_valuate),
+        ]
+    
+    def run_stage(self, stage: Callable[[ScanContext], None], ctx: ScanContext) -> bool:
+        """Run one stage, converting exceptions into an error result.
         
+        Returns:
+            True if the scan should continue to the next stage
+        """
+        if ctx.result is not None:
+            return False
         try:
+            stage(ctx)
+        except Exception as e:
+            if ctx.debug:
+                import traceback
+                ctx.save_text("99_error.txt", traceback.format_exc())
+            ctx.result = ScanResult(error=str(e))
+        return ctx.result is None
+    
+    def finish(self, ctx: ScanContext) -> ScanResult:
+        """Publish a finished scan's debug info and return its result."""
+        self.last_debug_info = ctx.info
+        if ctx.stream is not None:
+            ctx.stream.close()
+            ctx.stream = None
+        ctx.image = None  # Release the screenshot
+        ctx.frame_gray = None
+        self._buffers.release(ctx.enhanced)
+        ctx.enhanced = None
+        if ctx.result is None:
+            ctx.result = ScanResult(error='Scan did not complete')
+        return ctx.result
+    
+    def _stage_decode(self, ctx: ScanContext):
+        """Load the screenshot and resolve the scan region."""
+        image_path = ctx.image_path
+        img = ctx.image
+        if img is None and self._can_stream(ctx):
+            img = self._load_streamed(ctx)
+        if img is None:
             img = self._load_image(image_path)
             if img is None:
-                return {'error': f'Failed to load image: {image_path.name}'}
-            
-            width, height = img.size
-            self.last_debug_info['image_size'] = (width, height)
-            
-            if self.debug_mode:
-                self.debug_dir.mkdir(exist_ok=True)
-                img.save(self._debug_path("00_original.png"))
-                self.last_debug_info['debug_files'].append(f"{self._debug_prefix}00_original.png")
-            
-            # Check for fixed region
-            if HAS_REGION_SELECTOR and region_selector.is_configured():
-                result = self._scan_with_fixed_region(img, width, height)
-                if result:
-                    self.last_debug_info['method'] = 'fixed_region'
-                    return result
-                if self.debug_mode:
-                    print("[DEBUG] Fixed region scan failed - no signature found")
-                return {'error': 'No signature detected in scan region'}
-            
+                ctx.result = ScanResult(error=f'Failed to load image: {image_path.name}')
+                return
+        # Decode now, on this stage's thread, rather than lazily on first use
+        img.load()
+        ctx.image = img
+        
+        width, height = img.size
+        ctx.info['image_size'] = (width, height)
+        
+        if ctx.debug:
+            if image_path:
+                # Link the original file rather than re-encoding it (a
+                # streamed file is linked once it is complete)
+                if ctx.stream is None:
+                    ctx.link_original(image_path)
+            else:
+                ctx.save_image("00_original.png", img)
+        
+        if ctx.pre_cropped:
+            # The caller already cut out the signature region
+            ctx.method = "buffer"
+            ctx.info['method'] = ctx.method
+            ctx.region = (0, 0, width, height)
+            return
+        
+        if ctx.full_frame:
+            # No scan region - the whole screenshot is searched
+            ctx.method = "full_frame"
+            ctx.info['method'] = ctx.method
+            return
+        
+        # Check for fixed region
+        if not (HAS_REGION_SELECTOR and region_selector.is_configured()):
             # No scan region configured
-            return {'error': 'Scan region not configured. Define it in Settings.'}
-            
-        except Exception as e:
-            if self.debug_mode:
-                import traceback
-                with open(self._debug_path("99_error.txt"), 'w') as f:
-                    f.write(traceback.format_exc())
-            return {'error': str(e)}
+            ctx.result = ScanResult(error='Scan region not configured. Define it in Settings.')
+            return
+        
+        ctx.region = self._resolve_fixed_region(ctx, width, height)
+        ctx.info['method'] = ctx.method  # "fixed" or "anchor", known only now
+        if ctx.region is None:
+            ctx.result = self._no_signature(ctx)
+            return
+        
+        ctx.field_regions = self._resolve_field_regions(ctx, width, height)
+        
+        # Anchored regions are already tight (and move between scans)
+        if ctx.method == "fixed":
+            ctx.full_region = ctx.region
+            tight = self.region_tuner.tightened(ctx.region)
+            if tight:
+                ctx.region = tight
+                ctx.info['tightened_region'] = tight
+    
+    def _can_stream(self, ctx: ScanContext) -> bool:
+        return (self.stream_png and not ctx.no_stream and ctx.image_path is not None
+                and ctx.image_path.suffix.lower() == '.png')
+    
+    def _load_streamed(self, ctx: ScanContext) -> Optional[Image.Image]:
+        """Decode the rows the scan needs while the PNG is still being written.
+        
+        Returns:
+            The screenshot with only the rows down to the scan region's
+            bottom filled in (ctx.stream verifies them later), or None to
+            load the complete file normally - it has been written by then
+        """
+        try:
+            stream = png_stream.PngStream(ctx.image_path)
+        except png_stream.PngStreamError as e:
+            if ctx.debug:
+                print(f"[DEBUG] Streaming decode unavailable: {e}")
+            return None
+        
+        try:
+            width, height = stream.read_header()
+            rows = self._rows_needed(ctx, width, height)
+            top = stream.read_rows(rows) if rows else None
+            if top is None:
+                stream.wait_complete()
+        except png_stream.PngStreamError as e:
+            stream.close()
+            if ctx.debug:
+                print(f"[DEBUG] Streaming decode failed: {e}")
+            return None
+        
+        if top is None:
+            stream.close()
+            return None
+        
+        img = Image.new(top.mode, (width, height))
+        img.paste(top, (0, 0))
+        ctx.stream = stream
+        ctx.info['streamed_rows'] = rows
+        return img
+    
+    def _rows_needed(self, ctx: ScanContext, width: int, height: int) -> Optional[int]:
+        """Rows from the top that cover the scan region and readouts.
+        
+        Returns:
+            Row count, or None if the scan needs the whole screenshot
+        """
+        if ctx.pre_cropped or ctx.full_frame or not HAS_REGION_SELECTOR:
+            return None
+        if region_selector.load_anchor():
+            return None  # The anchor is searched for in the whole screenshot
+        region = region_selector.region_for_image(width, height)
+        if not region:
+            return None
+        bottom = max([region[3]] + [r[3] for r in region_selector.fields_for_image(width, height).values()])
+        return bottom if bottom < height else None
     
-    def _scan_with_fixed_region(self, img: Image.Image, width: int, height: int) -> Optional[Dict[str, Any]]:
-        """Scan using pre-configured fixed region."""
-        region = region_selector.load_region()
+    def _verify_stream(self, ctx: ScanContext) -> bool:
+        """Check the early decoded rows against the completely written file."""
+        stream, ctx.stream = ctx.stream, None
+        try:
+            verified = stream.verify()
+        finally:
+            stream.close()
+        ctx.info['stream_verified'] = verified
+        if verified:
+            if ctx.debug:
+                ctx.link_original(ctx.image_path)
+        elif ctx.debug:
+            print("[DEBUG] Screenshot changed after the early decode - rescanning")
+        return verified
+    
+    def _rescan_complete(self, ctx: ScanContext):
+        """Scan again from the completely written file, replacing ctx's state."""
+        try:
+            # The file may be in the middle of being rewritten
+            with png_stream.PngStream(ctx.image_path) as stream:
+                stream.wait_complete()
+        except png_stream.PngStreamError as e:
+            if ctx.debug:
+                print(f"[DEBUG] Waiting for the rewritten screenshot failed: {e}")
+        
+        fresh = ScanContext(
+            image_path=ctx.image_path,
+            debug=ctx.debug,
+            pre_cropped=ctx.pre_cropped,
+            no_stream=True,
+            debug_dir=ctx.debug_dir,
+            writer=ctx.writer,
+            info=ctx.info
+        )
+        for stage in (self._stage_decode, self._stage_preprocess, self._stage_recognize):
+            stage(fresh)
+            if fresh.result is not None:
+                break
+        self._buffers.release(ctx.enhanced)
+        vars(ctx).update(vars(fresh))
+    
+    def _resolve_fixed_region(self, ctx: ScanContext, width: int,
+                              height: int) -> Optional[Tuple[int, int, int, int]]:
+        """Get the scan region for this screenshot, clamped to the image.
+        
+        Uses the HUD anchor if one is set and found, otherwise the region
+        profile for the screenshot size.
+        """
+        region = None
+        locator = hud_locator.get_locator()
+        if locator:
+            found = locator.locate(ctx.image)
+            if found:
+                region, score = found
+                ctx.method = "anchor"
+                ctx.info['anchor_score'] = round(score, 3)
+            elif ctx.debug:
+                print("[DEBUG] HUD anchor not found - using region profile")
+        
+        if region is None:
+            region = region_selector.region_for_image(width, height)
         if not region:
             return None
         
@@ -270,178 +696,446 @@ class SignatureScanner:
         y2 = max(0, min(y2, height))
         
         if x2 <= x1 or y2 <= y1:
-            if self.debug_mode:
+            if ctx.debug:
                 print(f"[DEBUG] Invalid fixed region: ({x1}, {y1}) to ({x2}, {y2})")
             return None
         
-        if self.debug_mode:
-            print(f"[DEBUG] Using fixed region: ({x1}, {y1}) to ({x2}, {y2})")
+        if ctx.debug:
+            print(f"[DEBUG] Using {ctx.method} region: ({x1}, {y1}) to ({x2}, {y2})")
         
-        return self._scan_region(img, x1, y1, x2, y2, "fixed")
+        return x1, y1, x2, y2
     
-    def _scan_region(self, img: Image.Image, x1: int, y1: int, x2: int, y2: int, 
-                     method: str) -> Optional[Dict[str, Any]]:
-        """Scan a specific region for signature values."""
-        if self.debug_mode:
-            from PIL import ImageDraw
-            debug_img = img.copy()
-            draw = ImageDraw.Draw(debug_img)
-            draw.rectangle([x1, y1, x2, y2], outline='#00FF00', width=3)
-            debug_img.save(self._debug_path(f"02_{method}_region.png"))
-            self.last_debug_info['debug_files'].append(f"{self._debug_prefix}02_{method}_region.png")
+    def _resolve_field_regions(self, ctx: ScanContext, width: int,
+                               height: int) -> Dict[str, Tuple[int, int, int, int]]:
+        """Get the extra readout regions (mass, ...) for this screenshot, clamped.
         
-        # Crop region
+        With the HUD anchor, the readouts keep their offset from the
+        signature region the anchor moved.
+        """
+        fields = region_selector.fields_for_image(width, height)
+        if not fields:
+            return {}
+        
+        dx = dy = 0
+        if ctx.method == "anchor":
+            profile_region = region_selector.region_for_image(width, height)
+            if profile_region:
+                dx = ctx.region[0] - profile_region[0]
+                dy = ctx.region[1] - profile_region[1]
+        
+        regions = {}
+        for name, (x1, y1, x2, y2) in fields.items():
+            x1 = max(0, min(x1 + dx, width - 1))
+            y1 = max(0, min(y1 + dy, height - 1))
+            x2 = max(0, min(x2 + dx, width))
+            y2 = max(0, min(y2 + dy, height))
+            if x2 > x1 and y2 > y1:
+                regions[name] = (x1, y1, x2, y2)
+        return regions
+    
+    def _stage_preprocess(self, ctx: ScanContext):
+        """Crop the scan region and enhance it for OCR."""
+        if ctx.full_frame:
+            self._detect_labels(ctx)
+            return
+        
+        img = ctx.image
+        x1, y1, x2, y2 = ctx.region
+        
+        # Crop region (copies only the region out of the decoded screenshot)
         sig_crop = img.crop((x1, y1, x2, y2))
         
-        if self.debug_mode:
-            sig_crop.save(self._debug_path("03_sig_crop.png"))
-            self.last_debug_info['debug_files'].append(f"{self._debug_prefix}03_sig_crop.png")
-        
-        # Enhance and OCR
-        enhanced = self._enhance_for_ocr(sig_crop)
-        
-        if self.debug_mode:
-            # Save enhanced version for debugging
-            enhanced_pil = Image.fromarray(enhanced)
-            enhanced_pil.save(self._debug_path("04_enhanced.png"))
-            self.last_debug_info['debug_files'].append(f"{self._debug_prefix}04_enhanced.png")
-        
-        # Run OCR
-        signatures, ocr_text, confidence = self._ocr_signature(enhanced)
-        
-        if self.debug_mode:
-            print(f"[DEBUG] OCR: text='{ocr_text}' signatures={signatures} confidence={confidence:.2f}")
-            with open(self._debug_path("99_summary.txt"), 'w') as f:
-                f.write(f"Method: {method}\n")
-                f.write(f"Region: ({x1}, {y1}) - ({x2}, {y2})\n")
-                f.write(f"OCR engine: EasyOCR\n")
-                f.write(f"OCR text: {ocr_text}\n")
-                f.write(f"OCR confidence: {confidence:.2f}\n")
-                f.write(f"Signatures found: {signatures}\n")
-        
-        if signatures:
-            primary_sig = max(signatures)
-            matches = self.match_signature(primary_sig)
-            return {
-                'signature': primary_sig,
-                'all_signatures': list(set(signatures)),
-                'matches': matches,
-                'method': method,
-                'ocr_confidence': confidence,
-                'debug': self.last_debug_info if self.debug_mode else None
-            }
+        if ctx.debug:
+            # Annotation is drawn on the writer thread (img is already decoded)
+            ctx.save_annotated(f"02_{ctx.method}_region.png", img, (x1, y1, x2, y2))
+            ctx.save_image("03_sig_crop.png", sig_crop)
         
-        return None
+        # The full screenshot is no longer needed (unless a tightened crop
+        # may have to be retried on the full region)
+        if not ctx.is_tightened:
+            ctx.image = None
+        
+        # Enhance for OCR
+        ctx.enhanced = self._enhance_for_ocr(sig_crop, ctx)
+        if ctx.field_regions:
+            ctx.enhanced = self._stitch_fields(ctx, img, ctx.enhanced)
+        
+        if ctx.debug:
+            # Save enhanced version for debugging (copied - the buffer is reused)
+            ctx.save_image("04_enhanced.png", ctx.enhanced.copy())
     
-    def _enhance_for_ocr(self, img: Image.Image) -> np.ndarray:
+    def _stitch_fields(self, ctx: ScanContext, img: Image.Image,
+                       signature: np.ndarray) -> np.ndarray:
+        """Append the enhanced readout crops to the signature crop, side by side.
+        
+        Crops of different heights are top-aligned on a canvas as tall as the
+        tallest, so one OCR call reads every field. The signature stays at
+        (0, 0), so its detections keep their coordinates. Records each
+        field's column span in ctx.field_spans.
+        """
+        segments = [('signature', signature)]
+        for name, region in ctx.field_regions.items():
+            # Instability has a decimal point - keep punctuation there
+            segments.append((name, self._enhance_for_ocr(
+                img.crop(region), remove_punctuation=(name != 'instability')
+            )))
+        
+        total_width = sum(seg.shape[1] for _, seg in segments) + FIELD_GAP * (len(segments) - 1)
+        total_height = max(seg.shape[0] for _, seg in segments)
+        out = self._buffers.acquire((total_height, total_width, 3))
+        
+        # Fill the gaps (and below shorter crops) with the crops' typical border color
+        borders = np.concatenate([seg[[0, -1]].reshape(-1, 3) for _, seg in segments])
+        out[:] = np.median(borders, axis=0).astype(np.uint8)
+        
+        ctx.field_spans = []
+        x = 0
+        for name, seg in segments:
+            height, width = seg.shape[:2]
+            out[:height, x:x + width] = seg
+            ctx.field_spans.append((name, x, x + width))
+            x += width + FIELD_GAP
+            self._buffers.release(seg)
+        return out
+    
+    def _stage_recognize(self, ctx: ScanContext):
+        """Run OCR on the enhanced crop."""
+        if ctx.full_frame:
+            self._recognize_labels(ctx)
+            return
+        
+        self._recognize(ctx)
+        
+        if ctx.is_tightened:
+            if not ctx.signatures:
+                # Tightened crop found nothing - retry the configured region
+                if ctx.debug:
+                    print("[DEBUG] Tightened region found nothing - retrying full region")
+                ctx.region = ctx.full_region
+                ctx.debug_suffix = "_retry"  # Keep the first attempt's artifacts
+                self._stage_preprocess(ctx)
+                self._recognize(ctx)
+                ctx.debug_suffix = ""
+                ctx.tight_missed = bool(ctx.signatures)
+            ctx.image = None
+        
+        # Streamed screenshots are recorded once verified (see _stage_valuate)
+        if ctx.stream is None:
+            self._record_region(ctx)
+        
+        if ctx.debug:
+            x1, y1, x2, y2 = ctx.region
+            print(f"[DEBUG] OCR: text='{ctx.ocr_text}' signatures={ctx.signatures} "
+                  f"confidence={ctx.confidence:.2f} readouts={ctx.readouts}")
+            ctx.save_text("99_summary.txt", (
+                f"Method: {ctx.method}\n"
+                f"Region: ({x1}, {y1}) - ({x2}, {y2})\n"
+                f"OCR engine: EasyOCR\n"
+                f"OCR text: {ctx.ocr_text}\n"
+                f"OCR confidence: {ctx.confidence:.2f}\n"
+                f"Signatures found: {ctx.signatures}\n"
+                f"Readouts: {ctx.readouts}\n"
+            ))
+    
+    def _record_region(self, ctx: ScanContext):
+        """Feed this scan's outcome to the region tuner."""
+        if ctx.full_region:
+            self.region_tuner.record(
+                ctx.full_region, ctx.text_box if ctx.signatures else None, ctx.tight_missed
+            )
+            if ctx.debug:
+                ctx.info['region_tuner'] = self.region_tuner.status(ctx.full_region)
+    
+    def _recognize(self, ctx: ScanContext):
+        """OCR the enhanced crop and locate the digits in image pixels."""
+        boxes: List[Any] = []
+        if ctx.field_spans:
+            # Signature and readouts in one OCR call
+            by_field, error = self._ocr_fields(ctx.enhanced, ctx.field_spans, ctx.debug)
+            if error:
+                ctx.signatures, ctx.ocr_text, ctx.confidence = [], f"OCR ERROR: {error}", 0.0
+            else:
+                ctx.signatures, ctx.ocr_text, ctx.confidence = self._parse_signature(
+                    by_field.pop('signature', []), boxes, ctx.debug
+                )
+                ctx.readouts = self._parse_readouts(by_field, ctx.debug)
+        else:
+            ctx.signatures, ctx.ocr_text, ctx.confidence = self._ocr_signature(
+                ctx.enhanced, boxes, ctx.debug
+            )
+        self._buffers.release(ctx.enhanced)
+        ctx.enhanced = None
+        
+        ctx.text_box = None
+        if boxes:
+            # EasyOCR boxes are 4 corner points in the resized crop
+            scale = ctx.info.get('ocr_scale', 1.0)
+            xs = [pt[0] for box in boxes for pt in box]
+            ys = [pt[1] for box in boxes for pt in box]
+            x1, y1 = ctx.region[0], ctx.region[1]
+            ctx.text_box = (
+                x1 + int(min(xs) / scale),
+                y1 + int(min(ys) / scale),
+                x1 + int(max(xs) / scale + 0.5),
+                y1 + int(max(ys) / scale + 0.5)
+            )
+    
+    def _stage_valuate(self, ctx: ScanContext):
+        """Match the recognized signature and estimate its value."""
+        if ctx.stream is not None:
+            if self._verify_stream(ctx):
+                self._record_region(ctx)
+            else:
+                # Only the rescan's outcome is recorded
+                self._rescan_complete(ctx)
+                if ctx.result is not None:
+                    return
+        
+        if ctx.full_frame:
+            self._valuate_targets(ctx)
+            return
+        
+        signatures = ctx.signatures
+        if not signatures:
+            ctx.result = self._no_signature(ctx)
+            return
+        
+        primary_sig = max(signatures)
+        # Value every match from one consistent pricing snapshot
+        prices = pricing.get_snapshot() if HAS_PRICING else None
+        readouts = ctx.readouts
+        matches = self.match_signature(primary_sig, prices, mass_override=readouts.get('mass'))
+        if matches and matches[0].rock_type:
+            self._valuations.note(matches[0].rock_type)
+        ctx.result = ScanResult(
+            signature=primary_sig,
+            all_signatures=tuple(set(signatures)),
+            matches=tuple(matches),
+            method=ctx.method,
+            ocr_confidence=ctx.confidence,
+            debug=ctx.info if ctx.debug else None,
+            prices_as_of=prices.prices_as_of if prices else None,
+            mass=readouts.get('mass'),
+            instability=readouts.get('instability'),
+            resistance=readouts.get('resistance')
+        )
+    
+    # === Full-frame mode ===
+    
+    def _detect_labels(self, ctx: ScanContext):
+        """Full-frame: find candidate signature labels on a downscaled frame."""
+        reader = self._get_ocr_reader()
+        if reader is None:
+            ctx.result = ScanResult(error=f'OCR not available: {self._ocr_init_error}')
+            return
+        
+        rgb = np.asarray(ctx.image.convert('RGB'))
+        small, scale = frame_scan.downscale(rgb)
+        boxes = self._detection_grid.detect(small, lambda img: frame_scan.detect_text(reader, img))
+        candidates = frame_scan.filter_candidates(small, boxes)
+        
+        # Back to screenshot pixels for recognition at full resolution
+        ctx.candidates = [
+            (int(x1 / scale), int(y1 / scale), int(x2 / scale + 0.5), int(y2 / scale + 0.5))
+            for x1, y1, x2, y2 in candidates
+        ]
+        ctx.frame_gray = np.asarray(ctx.image.convert('L'))
+        ctx.image = None
+        
+        ctx.info['detected_boxes'] = len(boxes)
+        ctx.info['candidates'] = len(ctx.candidates)
+        ctx.info['detection_grid'] = dict(self._detection_grid.stats)
+        if ctx.debug:
+            print(f"[DEBUG] Full frame: {len(boxes)} text boxes, {len(ctx.candidates)} label candidates")
+    
+    def _recognize_labels(self, ctx: ScanContext):
+        """Full-frame: recognize every candidate label in one batch."""
+        reader = self._get_ocr_reader()
+        try:
+            ctx.labels = frame_scan.recognize_labels(
+                reader, ctx.frame_gray, ctx.candidates, SIGNATURE_ALLOWLIST
+            )
+        except Exception as e:
+            ctx.result = ScanResult(error=f'OCR ERROR: {e}')
+            return
+        finally:
+            ctx.frame_gray = None
+        
+        if ctx.debug:
+            ctx.save_text("99_summary.txt", "Method: full_frame\n" + "".join(
+                f"{box}: '{text}' ({conf:.2f})\n" for box, text, conf in ctx.labels
+            ))
+    
+    def _valuate_targets(self, ctx: ScanContext):
+        """Full-frame: turn recognized labels into targets with matches."""
+        prices = pricing.get_snapshot() if HAS_PRICING else None
+        matches_by_sig: Dict[int, Tuple[Match, ...]] = {}
+        targets = []
+        for box, text, confidence in ctx.labels:
+            signatures = self._extract_signatures(text, ctx.debug)
+            if not signatures:
+                continue
+            signature = max(signatures)
+            if signature not in matches_by_sig:
+                matches_by_sig[signature] = tuple(self.match_signature(signature, prices))
+            targets.append(Target(
+                signature=signature,
+                box=box,
+                confidence=confidence,
+                matches=matches_by_sig[signature]
+            ))
+        
+        if not targets:
+            ctx.result = ScanResult(error='No signature labels detected in screenshot')
+            return
+        
+        # Reading order: top to bottom, then left to right
+        targets.sort(key=lambda t: (t.box[1], t.box[0]))
+        primary = max(targets, key=lambda t: t.signature)
+        ctx.result = ScanResult(
+            signature=primary.signature,
+            all_signatures=tuple(matches_by_sig),
+            matches=primary.matches,
+            method=ctx.method,
+            ocr_confidence=sum(t.confidence for t in targets) / len(targets),
+            debug=ctx.info if ctx.debug else None,
+            prices_as_of=prices.prices_as_of if prices else None,
+            targets=tuple(targets)
+        )
+    
+    def _no_signature(self, ctx: ScanContext) -> ScanResult:
+        """Result for a scan whose region produced no signature."""
+        if ctx.debug:
+            print("[DEBUG] Fixed region scan failed - no signature found")
+        return ScanResult(error='No signature detected in scan region')
+    
+    def _enhance_for_ocr(self, img: Image.Image, ctx: Optional[ScanContext] = None,
+                         remove_punctuation: bool = True) -> np.ndarray:
         """Enhance image for OCR.
         
         Processing steps:
-        1. Convert to RGB numpy array
-        2. Upscale small regions for better detection
-        3. Remove small connected components (commas, periods, noise)
+        1. View the decoded crop as a numpy array (RGB)
+        2. Upscale crops shorter than the recognizer's input height, into a
+           pooled buffer (taller crops are copied unscaled)
+        3. Remove small connected components (commas, periods, noise) in place
            - Commas/periods are ~5-20 pixels, digits are 100+ pixels
            - This prevents OCR from misreading punctuation as digits
         
+        The returned array comes from the scanner's buffer pool; release it
+        with self._buffers.release() once OCR is done.
+        
         Args:
             img: Cropped region containing signature
+            ctx: Scan context (for debug output)
+            remove_punctuation: Run step 3 (off for readouts with decimals)
         
         Returns:
             Numpy array (RGB) ready for EasyOCR
         """
         import cv2
         
-        # Ensure RGB
-        if img.mode != 'RGB':
+        # L and RGBA are converted by cv2 below; anything else (P, LA, I;16...)
+        # goes through Pillow first
+        if img.mode not in ('RGB', 'RGBA', 'L'):
             img = img.convert('RGB')
+        src = np.asarray(img)
+        if src.ndim == 2:
+            src = cv2.cvtColor(src, cv2.COLOR_GRAY2RGB)
+        elif src.shape[2] == 4:
+            src = cv2.cvtColor(src, cv2.COLOR_RGBA2RGB)
+        
+        # Upscale short crops to the recognizer's input height; never shrink,
+        # or the digits of a generously drawn region become unreadable
+        height, width = src.shape[:2]
+        scale = max(1.0, RECOGNIZER_HEIGHT / height)
+        new_height = max(height, RECOGNIZER_HEIGHT)
+        new_width = max(1, round(width * scale))
+        out = self._buffers.acquire((new_height, new_width, 3))
+        if scale == 1.0:
+            np.copyto(out, src)
+        else:
+            cv2.resize(src, (new_width, new_height), dst=out, interpolation=cv2.INTER_CUBIC)
         
-        # Upscale small regions for better detection
-        min_dimension = 64
-        scale = 1
-        if img.width < min_dimension or img.height < min_dimension:
-            scale = max(min_dimension // min(img.width, img.height), 2)
-            img = img.resize(
-                (img.width * scale, img.height * scale),
-                Image.Resampling.LANCZOS
-            )
-        
-        img_array = np.array(img)
+        if ctx is not None:
+            ctx.info['ocr_scale'] = scale
         
         # Remove small connected components (commas, periods, noise)
         # This prevents OCR from misreading punctuation as digits
-        img_array = self._remove_small_components(img_array)
+        if remove_punctuation:
+            self._remove_small_components(out, ctx=ctx)
         
-        return img_array
+        return out
     
-    def _remove_small_components(self, img_array: np.ndarray, min_area: int = 50) -> np.ndarray:
-        """Remove small connected components from image.
+    def _remove_small_components(self, img_array: np.ndarray, min_area: int = 50,
+                                 ctx: Optional[ScanContext] = None) -> np.ndarray:
+        """Remove small connected components from image, in place.
         
         Commas and periods are tiny (~5-20 pixels) compared to digits (100+ pixels).
         By removing small components, we prevent OCR from misreading punctuation.
         
         Args:
-            img_array: RGB numpy array
+            img_array: RGB numpy array (modified in place)
             min_area: Minimum component area to keep (pixels). Default 50.
+            ctx: Scan context (for debug output)
         
         Returns:
-            Cleaned RGB numpy array with small components removed
+            The same array, with small components removed
         """
         import cv2
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
+        height, width = img_array.shape[:2]
+        gray = self._buffers.acquire((height, width))
+        binary = self._buffers.acquire((height, width))
+        labels = self._buffers.acquire((height, width), np.int32)
         
-        # Binary threshold - find dark elements (text) on light background
-        # Use adaptive threshold for varying backgrounds
-        # THRESH_BINARY_INV: dark pixels become white (foreground)
-        _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
-        
-        # Find connected components
-        num_labels, labels, stats, centroids = cv2.connectedComponentsWithStats(binary, connectivity=8)
-        
-        # Create mask of components to keep (large enough to be digits)
-        mask = np.zeros(binary.shape, dtype=np.uint8)
-        
-        removed_count = 0
-        kept_count = 0
-        
-        for i in range(1, num_labels):  # Skip background (label 0)
-            area = stats[i, cv2.CC_STAT_AREA]
-            if area >= min_area:
-                # Keep this component
-                mask[labels == i] = 255
-                kept_count += 1
+        try:
+            # Convert to grayscale
+            cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY, dst=gray)
+            
+            # Binary threshold - find dark elements (text) on light background
+            # THRESH_BINARY_INV: dark pixels become white (foreground)
+            cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU, dst=binary)
+            
+            # Find connected components
+            num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(
+                binary, labels=labels, connectivity=8, ltype=cv2.CV_32S
+            )
+            
+            # Per-label lookup: True for components too small to be digits
+            small = stats[:, cv2.CC_STAT_AREA] < min_area
+            small[0] = False  # Background (label 0)
+            removed_count = int(np.count_nonzero(small))
+            kept_count = num_labels - 1 - removed_count
+            
+            debug = ctx is not None and ctx.debug
+            if debug:
+                print(f"[DEBUG] Component filter: kept {kept_count}, removed {removed_count} (min_area={min_area})")
+            
+            if removed_count == 0:
+                return img_array
+            
+            removed_pixels = small[labels]
+            
+            # Estimate background as median color of non-text pixels
+            bg_mask = binary == 0  # Original background pixels
+            if np.any(bg_mask):
+                bg_color = np.median(img_array[bg_mask], axis=0).astype(np.uint8)
             else:
-                removed_count += 1
-        
-        if self.debug_mode:
-            print(f"[DEBUG] Component filter: kept {kept_count}, removed {removed_count} (min_area={min_area})")
-        
-        # Apply mask to original image
-        # Where mask is 0 (removed components), replace with background color
-        # Estimate background as median color of non-text pixels
-        bg_mask = binary == 0  # Original background pixels
-        if np.any(bg_mask):
-            bg_color = np.median(img_array[bg_mask], axis=0).astype(np.uint8)
-        else:
-            bg_color = np.array([128, 128, 128], dtype=np.uint8)  # Fallback gray
-        
-        # Create output image
-        result = img_array.copy()
-        
-        # Where we removed components (mask is 0 but binary had content), fill with background
-        removed_pixels = (binary == 255) & (mask == 0)
-        result[removed_pixels] = bg_color
-        
-        if self.debug_mode and removed_count > 0:
-            # Save debug image showing what was removed
-            debug_removed = img_array.copy()
-            debug_removed[removed_pixels] = [255, 0, 0]  # Red for removed pixels
-            debug_pil = Image.fromarray(debug_removed)
-            debug_pil.save(self._debug_path("04a_removed_components.png"))
-            self.last_debug_info['debug_files'].append(f"{self._debug_prefix}04a_removed_components.png")
-        
-        return result
+                bg_color = np.array([128, 128, 128], dtype=np.uint8)  # Fallback gray
+            
+            if debug:
+                # Save debug image showing what was removed
+                debug_removed = img_array.copy()
+                debug_removed[removed_pixels] = [255, 0, 0]  # Red for removed pixels
+                ctx.save_image("04a_removed_components.png", debug_removed)
+            
+            # Fill removed components with the background color
+            img_array[removed_pixels] = bg_color
+            return img_array
+        finally:
+            self._buffers.release(gray)
+            self._buffers.release(binary)
+            self._buffers.release(labels)
     
     def _load_database(self, db_path: Path) -> Dict[str, Any]:
         """Load signature database."""
@@ -496,20 +1190,24 @@ class SignatureScanner:
         
         self.ground_deposit_small_base = small_config.get('_base_signature', 120)
         self.ground_deposit_large_base = large_config.get('_base_signature', 620)
-        self.ground_deposit_minerals = ground.get('minerals', [])
+        # Shared by every ground deposit match - never copied per scan
+        self.ground_deposit_minerals = tuple(ground.get('minerals', []))
     
-    def _ocr_signature(self, img_array: np.ndarray) -> Tuple[List[int], str, float]:
-        """OCR the image and extract signature numbers.
+    def _read_text(self, img_array: np.ndarray, allowlist: str = SIGNATURE_ALLOWLIST,
+                   debug: bool = False) -> Tuple[List[Any], Optional[str]]:
+        """Run EasyOCR on an image.
         
         Args:
-            img_array: RGB numpy array to OCR
+            img_array: Image to OCR
+            allowlist: Characters EasyOCR may return
+            debug: Print the raw results (the scan's debug snapshot)
         
         Returns:
-            Tuple of (list of signature values, raw OCR text, confidence)
+            Tuple of (detections as (bbox, text, confidence), error message or None)
         """
         reader = self._get_ocr_reader()
         if reader is None:
-            return [], f"OCR ERROR: {self._ocr_init_error}", 0.0
+            return [], self._ocr_init_error
         
         try:
             # EasyOCR with digit allowlist for maximum accuracy
@@ -517,41 +1215,112 @@ class SignatureScanner:
             # Pattern 2 in _extract_signatures handles plain digit sequences
             results = reader.readtext(
                 img_array,
-                allowlist='0123456789.',
+                allowlist=allowlist,
                 paragraph=False,  # Don't merge into paragraphs
                 detail=1,  # Return bounding boxes + confidence
             )
-            
-            if self.debug_mode:
-                print(f"[DEBUG] EasyOCR raw results: {results}")
-            
-            # Extract text and confidence
-            texts = []
-            confidences = []
-            
-            for detection in results:
-                # detection = (bbox, text, confidence)
-                if len(detection) >= 3:
-                    bbox, text, conf = detection[0], detection[1], detection[2]
-                    texts.append(text)
-                    confidences.append(conf)
-            
-            combined_text = ' '.join(texts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-            
-            # Extract signature values
-            signatures = self._extract_signatures(combined_text)
-            
-            return signatures, combined_text, avg_confidence
-            
         except Exception as e:
-            return [], f"OCR ERROR: {e}", 0.0
+            return [], str(e)
+        
+        if debug:
+            print(f"[DEBUG] EasyOCR raw results: {results}")
+        
+        # detection = (bbox, text, confidence)
+        return [d for d in results if len(d) >= 3], None
+    
+    def _ocr_signature(self, img_array: np.ndarray, boxes: Optional[List[Any]] = None,
+                       debug: bool = False) -> Tuple[List[int], str, float]:
+        """OCR the image and extract signature numbers.
+        
+        Args:
+            img_array: RGB numpy array to OCR
+            boxes: If given, receives the bounding box (4 corner points) of
+                each text detection
+            debug: The scan's debug snapshot
+        
+        Returns:
+            Tuple of (list of signature values, raw OCR text, confidence)
+        """
+        detections, error = self._read_text(img_array, debug=debug)
+        if error:
+            return [], f"OCR ERROR: {error}", 0.0
+        return self._parse_signature(detections, boxes, debug)
+    
+    def _ocr_fields(self, img_array: np.ndarray, spans: List[Tuple[str, int, int]],
+                    debug: bool = False) -> Tuple[Dict[str, List[Any]], Optional[str]]:
+        """OCR a stitched crop and sort the detections by field.
+        
+        Args:
+            img_array: Stitched crop (see _stitch_fields)
+            spans: (field name, x1, x2) column span of each field
+            debug: The scan's debug snapshot
+        
+        Returns:
+            Tuple of (field name -> detections, error message or None)
+        """
+        detections, error = self._read_text(img_array, FIELD_ALLOWLIST, debug)
+        by_field: Dict[str, List[Any]] = {}
+        for detection in detections:
+            xs = [pt[0] for pt in detection[0]]
+            center = (min(xs) + max(xs)) / 2
+            for name, x1, x2 in spans:
+                if x1 <= center < x2:
+                    by_field.setdefault(name, []).append(detection)
+                    break
+        return by_field, error
+    
+    def _parse_signature(self, detections: List[Any], boxes: Optional[List[Any]] = None,
+                         debug: bool = False) -> Tuple[List[int], str, float]:
+        """Extract signature numbers from OCR detections.
+        
+        Returns:
+            Tuple of (list of signature values, raw OCR text, confidence)
+        """
+        texts = []
+        confidences = []
+        for bbox, text, conf in (d[:3] for d in detections):
+            texts.append(text.replace('%', ''))
+            confidences.append(conf)
+            if boxes is not None:
+                boxes.append(bbox)
+        
+        combined_text = ' '.join(texts)
+        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+        
+        # Extract signature values
+        signatures = self._extract_signatures(combined_text, debug)
+        
+        return signatures, combined_text, avg_confidence
+    
+    def _parse_readouts(self, by_field: Dict[str, List[Any]], debug: bool = False) -> Dict[str, float]:
+        """Parse the mass/instability/resistance detections into numbers.
+        
+        Unreadable or implausible values are left out.
+        """
+        readouts = {}
+        for name, detections in by_field.items():
+            text = ''.join(d[1] for d in detections).replace(' ', '')
+            if name == 'mass':
+                # Whole kilograms - separators (comma read as period) are noise
+                digits = re.sub(r'\D', '', text)
+                value = float(digits) if digits else None
+            else:
+                match = re.search(r'\d+(?:\.\d+)?', text)
+                value = float(match.group()) if match else None
+            
+            if value is None or (name == 'resistance' and value > 100):
+                if debug:
+                    print(f"[DEBUG] Could not read {name} from '{text}'")
+                continue
+            readouts[name] = value
+        return readouts
     
-    def _extract_signatures(self, text: str) -> List[int]:
+    def _extract_signatures(self, text: str, debug: bool = False) -> List[int]:
         """Extract valid signature values from OCR text.
         
         Args:
             text: Raw OCR text
+            debug: Print corrections (the scan's debug snapshot)
             
         Returns:
             List of valid signature integers
@@ -593,12 +1362,12 @@ class SignatureScanner:
                 signatures.append(value)
             else:
                 # Try to correct (phantom digit from comma/period separator)
-                corrected = self._try_correct_signature(value)
+                corrected = self._try_correct_signature(value, debug)
                 if corrected and corrected not in signatures:
-                    if self.debug_mode:
+                    if debug:
                         print(f"[DEBUG] Signature corrected: {value} -> {corrected}")
                     signatures.append(corrected)
-                elif self.debug_mode:
+                elif debug:
                     print(f"[DEBUG] Signature {value} invalid and uncorrectable")
         
         return signatures
@@ -631,7 +1400,7 @@ class SignatureScanner:
                     return True
         return False
     
-    def _try_correct_signature(self, value: int) -> Optional[int]:
+    def _try_correct_signature(self, value: int, debug: bool = False) -> Optional[int]:
         """Try to correct an invalid signature by removing phantom digits.
         
         OCR sometimes reads comma/period separators as digits:
@@ -643,6 +1412,7 @@ class SignatureScanner:
         
         Args:
             value: Invalid signature value to correct
+            debug: Print the candidates (the scan's debug snapshot)
             
         Returns:
             Corrected value if found, None otherwise
@@ -674,50 +1444,64 @@ class SignatureScanner:
                 return min(counts) if counts else 999
             
             best = min(candidates, key=min_count)
-            if self.debug_mode:
+            if debug:
                 print(f"[DEBUG] Corrected {value} -> candidates: {candidates} -> best: {best} (count={min_count(best)})")
             return best
         
         return None
     
-    def match_signature(self, signature: int) -> List[Dict[str, Any]]:
-        """Match a signature value to possible targets, including estimated values."""
+    def match_signature(self, signature: int, prices: Optional[Any] = None,
+                        mass_override: Optional[float] = None) -> List[Match]:
+        """Match a signature value to possible targets, including estimated values.
+        
+        Args:
+            signature: Signature value
+            prices: PricingSnapshot to value matches with (default: current)
+            mass_override: Measured mass of the scanned rock, used instead of
+                the median mass for single-rock matches
+        """
         matches = []
+        if HAS_PRICING and prices is None:
+            # One snapshot for every match, even if prices refresh meanwhile
+            prices = pricing.get_snapshot()
         
         # Check for known signature (asteroid types, deposits)
         if signature in self.signature_lookup:
-            match_data = {
-                'type': 'known',
-                'name': self.signature_lookup[signature],
-                'signature': signature,
-                'confidence': 1.0
-            }
+            match_data = Match(
+                type='known',
+                name=self.signature_lookup[signature],
+                signature=signature,
+                confidence=1.0
+            )
             
             # Add estimated value and composition if pricing available
             if HAS_PRICING and signature in SIGNATURE_TO_ROCK_TYPE:
                 rock_type, category = SIGNATURE_TO_ROCK_TYPE[signature]
-                match_data['rock_type'] = rock_type
-                match_data['category'] = category
+                match_data.rock_type = rock_type
+                match_data.category = category
                 
                 # Get value and composition
-                est_value, composition = self._get_rock_value_and_composition(rock_type)
+                est_value, composition = self._get_rock_value_and_composition(
+                    rock_type, prices, mass_override
+                )
+                match_data.mass = mass_override
                 if est_value > 0:
-                    match_data['est_value'] = int(est_value)
+                    match_data.est_value = int(est_value)
                 if composition:
-                    match_data['composition'] = composition
+                    match_data.composition = composition
             
             matches.append(match_data)
         
         # Check for salvage (2000 per panel) - exact multiples only
         if signature >= 2000 and signature % 2000 == 0:
             panels = signature // 2000
-            matches.append({
-                'type': 'salvage',
-                'name': f'Salvage ({panels} panels)',
-                'panels': panels,
-                'signature': signature,
-                'confidence': 1.0  # Exact match - definitive
-            })
+            matches.append(Match(
+                type='salvage',
+                name=f'Salvage ({panels} panels)',
+                panels=panels,
+                signature=signature,
+                confidence=1.0  # Exact match - definitive
+            ))
         
         # Check for ground deposits (small=120, large=620)
         # These are 100% single mineral per cluster
@@ -726,38 +1510,38 @@ class SignatureScanner:
             if 1 <= count <= 50:  # Reasonable cluster size
                 # Higher confidence for smaller counts
                 confidence = 0.9 if count <= 5 else max(0.6, 0.85 - count * 0.01)
-                matches.append({
-                    'type': 'ground_deposit',
-                    'name': f'Small Ground Deposit ({count}x)',
-                    'count': count,
-                    'base_signature': self.ground_deposit_small_base,
-                    'signature': signature,
-                    'confidence': confidence,
-                    'category': 'ground_deposits',
-                    'variant': 'small',
-                    'mining_method': 'FPS/Hand mining',
-                    'single_mineral': True,
-                    'possible_minerals': self.ground_deposit_minerals.copy()
-                })
+                matches.append(Match(
+                    type='ground_deposit',
+                    name=f'Small Ground Deposit ({count}x)',
+                    count=count,
+                    base_signature=self.ground_deposit_small_base,
+                    signature=signature,
+                    confidence=confidence,
+                    category='ground_deposits',
+                    variant='small',
+                    mining_method='FPS/Hand mining',
+                    single_mineral=True,
+                    possible_minerals=self.ground_deposit_minerals
+                ))
         
         if self.ground_deposit_large_base > 0 and signature % self.ground_deposit_large_base == 0:
             count = signature // self.ground_deposit_large_base
             if 1 <= count <= 30:  # Reasonable cluster size for large deposits
                 # Higher confidence for smaller counts
                 confidence = 0.9 if count <= 3 else max(0.6, 0.85 - count * 0.02)
-                matches.append({
-                    'type': 'ground_deposit',
-                    'name': f'Large Ground Deposit ({count}x)',
-                    'count': count,
-                    'base_signature': self.ground_deposit_large_base,
-                    'signature': signature,
-                    'confidence': confidence,
-                    'category': 'ground_deposits',
-                    'variant': 'large',
-                    'mining_method': 'ROC/Vehicle mining',
-                    'single_mineral': True,
-                    'possible_minerals': self.ground_deposit_minerals.copy()
-                })
+                matches.append(Match(
+                    type='ground_deposit',
+                    name=f'Large Ground Deposit ({count}x)',
+                    count=count,
+                    base_signature=self.ground_deposit_large_base,
+                    signature=signature,
+                    confidence=confidence,
+                    category='ground_deposits',
+                    variant='large',
+                    mining_method='ROC/Vehicle mining',
+                    single_mineral=True,
+                    possible_minerals=self.ground_deposit_minerals
+                ))
         
         # Check space deposits (asteroids) and surface deposits
         for base_sig, info in self.minable_signatures.items():
@@ -774,37 +1558,42 @@ class SignatureScanner:
                     if count > 1:
                         display_name = f"{display_name} (x{count})"
                     
-                    match_data = {
-                        'type': info['category'],
-                        'name': display_name,
-                        'count': count,
-                        'base_signature': base_sig,
-                        'signature': signature,
-                        'confidence': confidence
-                    }
+                    match_data = Match(
+                        type=info['category'],
+                        name=display_name,
+                        count=count,
+                        base_signature=base_sig,
+                        signature=signature,
+                        confidence=confidence
+                    )
                     
                     # Add estimated value and composition if pricing available
                     if HAS_PRICING and base_sig in SIGNATURE_TO_ROCK_TYPE:
                         rock_type, category = SIGNATURE_TO_ROCK_TYPE[base_sig]
-                        match_data['rock_type'] = rock_type
-                        match_data['category'] = category
+                        match_data.rock_type = rock_type
+                        match_data.category = category
                         
-                        est_value, composition = self._get_rock_value_and_composition(rock_type)
+                        # A measured mass is for one rock, not a cluster
+                        rock_mass = mass_override if count == 1 else None
+                        est_value, composition = self._get_rock_value_and_composition(
+                            rock_type, prices, rock_mass
+                        )
+                        match_data.mass = rock_mass
                         if est_value > 0:
-                            match_data['est_value'] = int(est_value * count)
+                            match_data.est_value = int(est_value * count)
                         if composition:
-                            match_data['composition'] = composition
+                            match_data.composition = composition
                     
                     matches.append(match_data)
         
         # Sort by confidence
-        matches.sort(key=lambda x: x.get('confidence', 0), reverse=True)
+        matches.sort(key=lambda x: x.confidence, reverse=True)
         
         # Remove duplicates
         seen = set()
         unique = []
         for m in matches:
-            key = (m.get('type'), m.get('name'))
+            key = (m.type, m.name)
             if key not in seen:
                 seen.add(key)
                 unique.append(m)
@@ -817,38 +1606,54 @@ class SignatureScanner:
             return 0
         
         try:
-            manager = pricing.get_pricing_manager()
-            value, _ = manager.calculate_rock_value(self.system, rock_type)
+            value, _ = pricing.get_snapshot().calculate_rock_value(self.system, rock_type)
             return value
         except Exception:
             return 0
     
-    def _get_rock_value_and_composition(self, rock_type: str) -> Tuple[float, List[Dict]]:
+    def _get_rock_value_and_composition(self, rock_type: str,
+                                        prices: Optional[Any] = None,
+                                        mass_override: Optional[float] = None) -> Tuple[float, Tuple[OreShare, ...]]:
         """Get estimated value and mineral composition for a rock type.
         
+        Args:
+            rock_type: Rock type code (e.g. "CTYPE")
+            prices: PricingSnapshot to read (default: current)
+            mass_override: Measured mass to use instead of the median
+        
         Returns:
-            Tuple of (total_value, composition_list)
-            composition_list contains dicts with: name, prob, medPct, value, price
+            Tuple of (total_value, composition)
+            composition is a tuple of OreShare (name, prob, medPct, value, price)
             
         Note: Value is calculated assuming the mineral spawns (based on medPct only,
         not probability). This gives the user the value IF that mineral appears.
         """
         if not HAS_PRICING:
-            return 0, []
-        
+            return 0, ()
+        
+        prices = prices or pricing.get_snapshot()
+        if not mass_override:
+            # The median-mass valuation only changes with the snapshot
+            return self._valuations.get(
+                prices, self.system, rock_type,
+                lambda: self._compute_rock_value_and_composition(rock_type, prices, None)
+            )
+        return self._compute_rock_value_and_composition(rock_type, prices, mass_override)
+    
+    def _compute_rock_value_and_composition(self, rock_type: str, prices: Any,
+                                            mass_override: Optional[float]) -> Tuple[float, Tuple[OreShare, ...]]:
+        """Uncached _get_rock_value_and_composition."""
         try:
-            manager = pricing.get_pricing_manager()
-            
             # Get rock data
-            system_data = manager.rock_types.get(self.system, {})
+            system_data = prices.rock_types.get(self.system, {})
             rock_data = system_data.get(rock_type)
             
             if not rock_data:
-                return 0, []
+                return 0, ()
             
             # Get mass and yield
-            mass = rock_data.get('mass', {}).get('med', 0)
-            yield_factor = manager.refinery_yield
+            mass = mass_override if mass_override else rock_data.get('mass', {}).get('med', 0)
+            yield_factor = prices.refinery_yield
             
             # Build composition list
             ores = rock_data.get('ores', {})
@@ -864,7 +1669,7 @@ class SignatureScanner:
                 
                 if prob > 0 and med_pct > 0:
                     # Get price and density for this ore
-                    price_per_scu = manager.get_ore_price(ore_name)
+                    price_per_scu = prices.get_ore_price(ore_name)
                     density = pricing.MINERAL_DENSITY.get(ore_name.upper(), 100.0)
                     
                     # Calculate value IF mineral spawns (median only, no probability)
@@ -878,32 +1683,64 @@ class SignatureScanner:
                     else:
                         ore_value = 0
                     
-                    composition.append({
-                        'name': ore_name.capitalize(),
-                        'prob': prob,
-                        'medPct': med_pct,
-                        'value': int(ore_value) if ore_value else 0,
-                        'price': price_per_scu
-                    })
+                    composition.append(OreShare(
+                        name=ore_name.capitalize(),
+                        prob=prob,
+                        med_pct=med_pct,
+                        value=int(ore_value) if ore_value else 0,
+                        price=price_per_scu
+                    ))
                     
                     # For total, use probability-weighted value
                     total_value += ore_value * prob
             
             # Sort by price per SCU (highest value minerals first)
-            composition.sort(key=lambda x: x.get('price', 0), reverse=True)
+            composition.sort(key=lambda x: x.price, reverse=True)
             
-            return total_value, composition
+            return total_value, tuple(composition)
             
         except Exception as e:
             if self.debug_mode:
                 print(f"[DEBUG] Error getting composition: {e}")
-            return 0, []
+            return 0, ()
+    
+    def prewarm_valuation(self) -> int:
+        """Value the rock types most likely to come next (from session history).
+        
+        Meant to run while a screenshot is still being scanned, so the
+        valuation stage finds them cached.
+        
+        Returns:
+            Most composition rows among those rock types (to size the
+            overlay table ahead of time)
+        """
+        if not HAS_PRICING:
+            return 0
+        prices = pricing.get_snapshot()
+        rows = 0
+        for rock_type in self._valuations.likely():
+            _, composition = self._get_rock_value_and_composition(rock_type, prices)
+            rows = max(rows, len(composition))
+        return rows
     
     def enable_debug(self, enable: bool = True, output_dir: Path = None):
         """Enable debug mode."""
         self.debug_mode = enable
         if output_dir:
             self.debug_dir = output_dir
+        if not enable:
+            with self._debug_writer_lock:
+                writer, self._debug_writer = self._debug_writer, None
+            if writer:
+                # Let queued artifacts finish, then stop the writer thread
+                writer.close()
+    
+    def _get_debug_writer(self) -> DebugArtifactWriter:
+        """Get the background debug writer, creating it on first use."""
+        with self._debug_writer_lock:
+            if self._debug_writer is None:
+                self._debug_writer = DebugArtifactWriter()
+            return self._debug_writer
     
     def _load_image(self, image_path: Path) -> Optional[Image.Image]:
         """Load an image."""
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+In-memory settings store for SC Signature Scanner.
+
+Settings files (config.json, scan_region.json) are read once and kept in
+memory. Reads never parse the file again; at most every STAT_INTERVAL
+seconds the file's mtime is checked, and the file is reloaded only if it
+was changed outside the app.
+
+Writes update memory immediately and are persisted write-behind: flushes
+are debounced (a burst of changes produces one write) and done on a
+timer thread, atomically via a temporary file. Pending writes are
+flushed on exit.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+
+FLUSH_DELAY = 0.5  # Seconds of quiet before pending changes are written
+STAT_INTERVAL = 2.0  # Minimum seconds between mtime checks
+
+
+class WriteBehind:
+    """Debounced background writes, keyed by name."""
+
+    def __init__(self, delay: float = FLUSH_DELAY):
+        self.delay = delay
+        self._pending: Dict[str, Callable[[], None]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    def schedule(self, key: str, write: Callable[[], None]):
+        """Run write() after the delay, replacing any pending write for key."""
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if timer:
+                timer.cancel()
+            self._pending[key] = write
+            timer = threading.Timer(self.delay, self._run, args=(key,))
+            timer.daemon = True
+            self._timers[key] = timer
+            timer.start()
+
+    def cancel(self, key: str):
+        """Drop a pending write."""
+        with self._lock:
+            timer = self._timers.pop(key, None)
+            if timer:
+                timer.cancel()
+            self._pending.pop(key, None)
+
+    def flush(self):
+        """Run all pending writes now (e.g. on exit)."""
+        with self._lock:
+            keys = list(self._pending)
+            for key in keys:
+                timer = self._timers.pop(key, None)
+                if timer:
+                    timer.cancel()
+        for key in keys:
+            self._run(key)
+
+    def _run(self, key: str):
+        with self._lock:
+            write = self._pending.pop(key, None)
+            self._timers.pop(key, None)
+        if write is None:
+            return
+        try:
+            write()
+        except Exception as e:
+            print(f"Warning: Could not save {key}: {e}")
+
+
+_writer = WriteBehind()
+atexit.register(_writer.flush)
+
+
+def schedule_write(key: str, write: Callable[[], None]):
+    """Persist something write-behind (debounced, on a background thread)."""
+    _writer.schedule(key, write)
+
+
+def flush_pending():
+    """Write everything still pending."""
+    _writer.flush()
+
+
+def write_json_atomic(path: Path, data: Any):
+    """Write JSON to a temporary file and swap it in."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+class SettingsFile:
+    """A JSON object file held in memory, reloaded when changed on disk."""
+
+    def __init__(self, path: Path, stat_interval: float = STAT_INTERVAL):
+        self.path = Path(path)
+        self.stat_interval = stat_interval
+        self._data: Optional[Dict[str, Any]] = None  # None = no file
+        self._mtime_ns: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        self._dirty = False
+        self._generation = 0  # Bumped whenever the in-memory data changes
+        self._lock = threading.RLock()
+
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever the settings change (for derived caches)."""
+        with self._lock:
+            self._refresh()
+            return self._generation
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Get a copy of the settings, or None if there is no file."""
+        with self._lock:
+            self._refresh()
+            return dict(self._data) if self._data is not None else None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            self._refresh()
+            if self._data is None:
+                return default
+            return self._data.get(key, default)
+
+    def exists(self) -> bool:
+        with self._lock:
+            self._refresh()
+            return self._data is not None
+
+    def save(self, data: Dict[str, Any]):
+        """Replace the settings (persisted write-behind)."""
+        with self._lock:
+            self._data = dict(data)
+            self._dirty = True
+            self._generation += 1
+        schedule_write(str(self.path), self.flush)
+
+    def set(self, key: str, value: Any):
+        """Set one value (persisted write-behind)."""
+        with self._lock:
+            self._refresh()
+            data = dict(self._data or {})
+            data[key] = value
+            self.save(data)
+
+    def delete(self):
+        """Remove the settings and the file."""
+        with self._lock:
+            _writer.cancel(str(self.path))
+            self._data = None
+            self._dirty = False
+            self._generation += 1
+            if self.path.exists():
+                self.path.unlink()
+            self._mtime_ns = None
+            self._checked_at = time.monotonic()
+
+    def flush(self):
+        """Write pending changes to disk now."""
+        with self._lock:
+            if not self._dirty:
+                return
+            if self._data is not None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                write_json_atomic(self.path, self._data)
+                self._mtime_ns = self.path.stat().st_mtime_ns
+            self._dirty = False
+
+    def _refresh(self):
+        """Reload from disk if the file changed (throttled mtime check)."""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.stat_interval:
+            return
+        self._checked_at = now
+
+        if self._dirty:
+            return  # Unsaved changes in memory win
+
+        try:
+            mtime_ns = self.path.stat().st_mtime_ns
+        except OSError:
+            if self._data is not None:
+                self._data = None
+                self._generation += 1
+            self._mtime_ns = None
+            return
+
+        if mtime_ns == self._mtime_ns:
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError) as e:
+            print(f"Error loading {self.path.name}: {e}")
+            data = None
+        self._data = data if isinstance(data, dict) else None
+        self._mtime_ns = mtime_ns
+        self._generation += 1
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Startup task graph for SC Signature Scanner.
+
+Startup steps are declared with their dependencies and run as soon as
+those are done: background steps on worker threads, UI steps on the Tk
+thread. Independent steps (database load, cache load, key validation,
+update check) overlap instead of running one after another.
+
+Each step's duration is recorded. "Ready" is when every step marked
+critical has finished - the point where the app can scan with cached
+data - so time-to-ready is measurable separately from total startup.
+"""
+
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+MAX_WORKERS = 4
+POLL_MS = 20  # How often the Tk thread checks for finished background steps
+
+
+@dataclass
+class StartupTask:
+    """One startup step."""
+    name: str
+    func: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    main_thread: bool = False  # Run on the Tk thread (UI work)
+    critical: bool = True  # Must finish before the app counts as ready
+    result: Any = None
+    error: Optional[BaseException] = None
+    started: float = 0.0
+    finished: float = 0.0
+    done: bool = False
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.finished - self.started) * 1000 if self.done else 0.0
+
+
+@dataclass
+class StartupReport:
+    """Timings of a finished (or ready) startup."""
+    time_to_ready_ms: float = 0.0
+    total_ms: float = 0.0
+    tasks: List[StartupTask] = field(default_factory=list)
+
+    def format(self) -> str:
+        """One-line summary: per-step durations (background steps marked *)."""
+        steps = ", ".join(
+            f"{t.name}{'' if t.main_thread else '*'} {t.duration_ms:.0f}ms"
+            for t in sorted(self.tasks, key=lambda t: t.started)
+        )
+        return f"ready {self.time_to_ready_ms:.0f}ms, total {self.total_ms:.0f}ms ({steps})"
+
+
+class StartupGraph:
+    """Runs startup tasks in dependency order, concurrently where possible."""
+
+    def __init__(self, root, max_workers: int = MAX_WORKERS):
+        """
+        Args:
+            root: Tk root (main-thread tasks and callbacks run via root.after)
+            max_workers: Threads for background tasks
+        """
+        self.root = root
+        self.tasks: Dict[str, StartupTask] = {}
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._finished: "queue.Queue[StartupTask]" = queue.Queue()
+        self._max_workers = max_workers
+        self._start = 0.0
+        self._ready_at = 0.0
+        self._on_ready: Optional[Callable[[StartupReport], None]] = None
+        self._on_complete: Optional[Callable[[StartupReport], None]] = None
+
+    def add(self, name: str, func: Callable[..., Any], deps: Tuple[str, ...] = (),
+            main_thread: bool = False, critical: bool = True):
+        """Declare a task.
+
+        The function takes no arguments; it can read its dependencies'
+        results with result(). A failed dependency does not stop its
+        dependents - they see a None result.
+        """
+        self.tasks[name] = StartupTask(name, func, tuple(deps), main_thread, critical)
+
+    def result(self, name: str) -> Any:
+        """Result of a finished task (None if it failed or has not run)."""
+        return self.tasks[name].result
+
+    def start(self, on_ready: Optional[Callable[[StartupReport], None]] = None,
+              on_complete: Optional[Callable[[StartupReport], None]] = None):
+        """Start running tasks. Must be called on the Tk thread.
+
+        Args:
+            on_ready: Called (Tk thread) when all critical tasks are done
+            on_complete: Called (Tk thread) when every task is done
+        """
+        for task in self.tasks.values():
+            missing = [d for d in task.deps if d not in self.tasks]
+            if missing:
+                raise ValueError(f"Startup task '{task.name}' depends on unknown {missing}")
+
+        self._on_ready = on_ready
+        self._on_complete = on_complete
+        self._start = time.perf_counter()
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="Startup")
+        self._schedule()
+        self.root.after(POLL_MS, self._poll)
+
+    def report(self) -> StartupReport:
+        """Timings so far."""
+        now = time.perf_counter()
+        ready = self._ready_at or now
+        return StartupReport(
+            time_to_ready_ms=(ready - self._start) * 1000,
+            total_ms=(now - self._start) * 1000,
+            tasks=[t for t in self.tasks.values() if t.done],
+        )
+
+    def _runnable(self) -> List[StartupTask]:
+        return [
+            t for t in self.tasks.values()
+            if not t.started and all(self.tasks[d].done for d in t.deps)
+        ]
+
+    def _schedule(self):
+        """Start every task whose dependencies are done."""
+        for task in self._runnable():
+            task.started = time.perf_counter()
+            if task.main_thread:
+                # Run later in the event loop so the UI stays responsive in between
+                self.root.after(0, self._run, task)
+            else:
+                self._pool.submit(self._run, task)
+
+    def _run(self, task: StartupTask):
+        """Run one task and hand it back to the Tk thread."""
+        try:
+            task.result = task.func()
+        except Exception as e:
+            task.error = e
+            print(f"Startup task '{task.name}' failed: {e}")
+        task.finished = time.perf_counter()
+        self._finished.put(task)
+
+    def _poll(self):
+        """Collect finished tasks on the Tk thread and start their dependents."""
+        progressed = False
+        while True:
+            try:
+                task = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            task.done = True
+            progressed = True
+
+        if progressed:
+            self._schedule()
+            if not self._ready_at and all(t.done for t in self.tasks.values() if t.critical):
+                self._ready_at = time.perf_counter()
+                if self._on_ready:
+                    self._on_ready(self.report())
+
+        if all(t.done for t in self.tasks.values()):
+            self._pool.shutdown(wait=False)
+            if self._on_complete:
+                self._on_complete(self.report())
+            return
+
+        self.root.after(POLL_MS, self._poll)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Background task executor for SC Signature Scanner.
+
+UI actions that hit the network (refreshing Regolith/UEX data, validating
+an API key) run on worker threads so the window and monitoring stay
+responsive. Progress, completion and error callbacks are marshalled back
+to the Tk thread with root.after.
+
+Tasks are keyed by name and single-flight: submitting a task while one
+with the same name is still running is refused, so double-clicks do not
+stack duplicate refreshes. Cancellation is cooperative - a task checks
+handle.cancelled between its steps.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+
+MAX_WORKERS = 2
+
+
+class TaskCancelled(Exception):
+    """Raised by TaskHandle.check_cancelled() to stop a cancelled task."""
+    pass
+
+
+class TaskHandle:
+    """Passed to a running task for progress reporting and cancellation."""
+
+    def __init__(self, name: str, executor: "TaskExecutor",
+                 on_progress: Optional[Callable[[str], None]] = None):
+        self.name = name
+        self._executor = executor
+        self._on_progress = on_progress
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self):
+        """Ask the task to stop at its next check."""
+        self._cancel_event.set()
+
+    def check_cancelled(self):
+        """Raise TaskCancelled if the task was cancelled."""
+        if self.cancelled:
+            raise TaskCancelled(self.name)
+
+    def progress(self, message: str):
+        """Report progress (delivered on the Tk thread)."""
+        if self._on_progress and not self.cancelled:
+            self._executor._call_soon(self._on_progress, message)
+
+
+class TaskExecutor:
+    """Runs named tasks off the Tk thread, one instance per name at a time."""
+
+    def __init__(self, root, max_workers: int = MAX_WORKERS):
+        """
+        Args:
+            root: Tk root (callbacks are scheduled with root.after)
+            max_workers: Worker threads
+        """
+        self.root = root
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="Task")
+        self._running: Dict[str, TaskHandle] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, name: str, func: Callable[[TaskHandle], Any],
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               on_progress: Optional[Callable[[str], None]] = None,
+               on_cancelled: Optional[Callable[[], None]] = None) -> Optional[TaskHandle]:
+        """Start a task unless one with the same name is running.
+
+        Args:
+            name: Task name (single-flight key)
+            func: Called on a worker thread with the TaskHandle; its return
+                value is passed to on_done
+            on_done: Called (Tk thread) with the result
+            on_error: Called (Tk thread) with the exception if func raised
+            on_progress: Called (Tk thread) with messages from handle.progress()
+            on_cancelled: Called (Tk thread) instead of on_done once a
+                cancelled task has stopped
+
+        Returns:
+            The task's handle, or None if it is already running
+        """
+        with self._lock:
+            if self._closed or name in self._running:
+                return None
+            handle = TaskHandle(name, self, on_progress)
+            self._running[name] = handle
+
+        self._pool.submit(self._run, handle, func, on_done, on_error, on_cancelled)
+        return handle
+
+    def is_running(self, name: str) -> bool:
+        with self._lock:
+            return name in self._running
+
+    def cancel(self, name: str) -> bool:
+        """Cancel a running task. Returns True if one was running."""
+        with self._lock:
+            handle = self._running.get(name)
+        if handle is None:
+            return False
+        handle.cancel()
+        return True
+
+    def shutdown(self):
+        """Cancel all tasks and stop accepting new ones (does not wait)."""
+        with self._lock:
+            self._closed = True
+            handles = list(self._running.values())
+        for handle in handles:
+            handle.cancel()
+        self._pool.shutdown(wait=False)
+
+    def _run(self, handle: TaskHandle, func, on_done, on_error, on_cancelled):
+        """Worker thread: run the task and schedule its callback."""
+        callback, args = None, ()
+        try:
+            result = func(handle)
+        except TaskCancelled:
+            callback = on_cancelled
+        except Exception as e:
+            if handle.cancelled:
+                callback = on_cancelled
+            elif on_error:
+                callback, args = on_error, (e,)
+            else:
+                print(f"Task '{handle.name}' failed: {e}")
+        else:
+            if handle.cancelled:
+                callback = on_cancelled
+            else:
+                callback, args = on_done, (result,)
+        finally:
+            with self._lock:
+                self._running.pop(handle.name, None)
+
+        if callback:
+            self._call_soon(callback, *args)
+
+    def _call_soon(self, callback: Callable, *args):
+        """Schedule a callback on the Tk thread."""
+        if self._closed:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except RuntimeError:
+            # Tk already torn down (app closing)
+            pass
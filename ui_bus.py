@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Thread-safe UI update bus for SC Signature Scanner.
+
+Tk widgets may only be touched from the Tk thread, but screenshots arrive
+on the watchdog thread and scan results on pipeline threads. Instead of
+calling widgets directly, any thread posts events to the bus; the Tk
+thread drains the queue on a fixed cadence and applies them in order.
+
+Log lines are batched: everything logged since the last drain is written
+to the log widget in one insert, and the widget keeps only the newest
+lines (ring buffer). The full log goes to a rotating file through a
+logging QueueHandler, so file writes never block the posting thread.
+"""
+
+import logging
+import logging.handlers
+import queue
+import tkinter as tk
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+
+DRAIN_INTERVAL_MS = 25  # Short enough that the overlay still pops up promptly
+MAX_EVENTS_PER_DRAIN = 500  # Leave the rest for the next tick to keep the UI responsive
+MAX_LOG_LINES = 1000
+
+LOG_FILE = "scanner.log"
+LOG_MAX_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+
+logger = logging.getLogger("sc_scanner")
+
+
+class LogView:
+    """Ring-buffered view over a read-only Text widget."""
+
+    def __init__(self, text: tk.Text, max_lines: int = MAX_LOG_LINES):
+        self.text = text
+        self.max_lines = max_lines
+        self.line_count = 0
+
+    def append(self, lines: List[str]):
+        """Append lines in one widget update, dropping the oldest over the cap."""
+        if not lines:
+            return
+        if len(lines) > self.max_lines:
+            lines = lines[-self.max_lines:]
+
+        # Only follow the end if the user has not scrolled up to read
+        at_bottom = self.text.yview()[1] >= 0.999
+
+        self.text.configure(state=tk.NORMAL)
+        self.text.insert(tk.END, "\n".join(lines) + "\n")
+        self.line_count += len(lines)
+        excess = self.line_count - self.max_lines
+        if excess > 0:
+            self.text.delete("1.0", f"{excess + 1}.0")
+            self.line_count -= excess
+        self.text.configure(state=tk.DISABLED)
+
+        if at_bottom:
+            self.text.see(tk.END)
+
+
+class UIBus:
+    """Queue of UI events posted from any thread, applied on the Tk thread."""
+
+    _LOG = object()  # Event marker for log lines
+
+    def __init__(self, root, interval_ms: int = DRAIN_INTERVAL_MS):
+        """
+        Args:
+            root: Tk root (drained with root.after)
+            interval_ms: Drain cadence
+        """
+        self.root = root
+        self.interval_ms = interval_ms
+        self._events: "queue.Queue[tuple]" = queue.Queue()
+        self._log_sink: Optional[Callable[[List[str]], None]] = None
+        self._after_id = None
+
+    def set_log_sink(self, sink: Callable[[List[str]], None]):
+        """Set the function that renders a batch of log lines (Tk thread)."""
+        self._log_sink = sink
+
+    def post(self, callback: Callable, *args: Any):
+        """Run callback(*args) on the Tk thread at the next drain. Any thread."""
+        self._events.put((callback, args))
+
+    def log(self, message: str):
+        """Queue a timestamped log line. Any thread."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._events.put((self._LOG, f"[{timestamp}] {message}"))
+
+    def start(self):
+        """Start draining (call on the Tk thread)."""
+        if self._after_id is None:
+            self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        """Stop draining, applying whatever is still queued."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        self.drain()
+
+    def drain(self, limit: Optional[int] = None):
+        """Apply queued events in order (Tk thread)."""
+        lines: List[str] = []
+        handled = 0
+        while limit is None or handled < limit:
+            try:
+                callback, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+
+            if callback is self._LOG:
+                lines.append(payload)
+                continue
+
+            # Keep log lines and other updates in posting order
+            self._flush(lines)
+            lines = []
+            try:
+                callback(*payload)
+            except Exception as e:
+                print(f"UI update failed: {e}")
+
+        self._flush(lines)
+
+    def _flush(self, lines: List[str]):
+        if lines and self._log_sink:
+            self._log_sink(lines)
+
+    def _tick(self):
+        self.drain(MAX_EVENTS_PER_DRAIN)
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+
+def setup_file_logging(log_dir: Path) -> Optional[logging.handlers.QueueListener]:
+    """Send the app logger to a rotating file via a queue.
+
+    Callers log through a QueueHandler (just a queue put); a listener
+    thread does the file writes.
+
+    Args:
+        log_dir: Directory for the log files
+
+    Returns:
+        The started listener (stop it on exit), or None if the log file
+        could not be opened
+    """
+    try:
+        log_dir.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_dir / LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUPS, encoding='utf-8'
+        )
+    except OSError as e:
+        print(f"Warning: Could not open log file: {e}")
+        return None
+
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    return listener
@@ -4,10 +4,12 @@ Version checker for SC Signature Scanner.
 Checks GitHub releases for updates.
 """
 
-import urllib.request
-import json
 from typing import Tuple, Optional
 
+import requests
+
+import http_client
+
 # Try to use packaging for version comparison, fallback to simple string comparison
 try:
     from packaging import version as pkg_version
@@ -26,6 +28,24 @@ GITHUB_REPO = "SC_Signature_Scanner"
 # GitHub API URL for latest release
 RELEASES_URL = f"https://api.github.com/repos/{GITHUB_OWNER}/{GITHUB_REPO}/releases/latest"
 
+# GitHub API requires a User-Agent
+REQUEST_HEADERS = {
+    'User-Agent': f'SC-Signature-Scanner/{CURRENT_VERSION}',
+    'Accept': 'application/vnd.github.v3+json'
+}
+
+
+def _fetch_latest_release(timeout: int) -> dict:
+    """Fetch the latest release JSON from GitHub.
+    
+    Not retried - the update check is optional and should not delay startup.
+    """
+    response = http_client.get_client().get(
+        RELEASES_URL, headers=REQUEST_HEADERS, timeout=timeout, retries=0
+    )
+    response.raise_for_status()
+    return response.json()
+
 
 def _parse_version_tuple(version_str: str) -> Tuple[int, ...]:
     """
@@ -56,17 +76,7 @@ def check_for_updates(timeout: int = 5) -> Tuple[bool, Optional[str], Optional[s
         If check fails, returns (False, None, None)
     """
     try:
-        # Create request with headers (GitHub API requires User-Agent)
-        request = urllib.request.Request(
-            RELEASES_URL,
-            headers={
-                'User-Agent': f'SC-Signature-Scanner/{CURRENT_VERSION}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-        )
-        
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            data = json.loads(response.read().decode('utf-8'))
+        data = _fetch_latest_release(timeout)
         
         # Extract version from tag (usually "v1.0.0" or "1.0.0")
         tag_name = data.get('tag_name', '')
@@ -91,11 +101,11 @@ def check_for_updates(timeout: int = 5) -> Tuple[bool, Optional[str], Optional[s
         
         return (False, None, None)
         
-    except urllib.error.HTTPError as e:
-        if e.code == 404:
+    except requests.exceptions.HTTPError as e:
+        if e.response.status_code == 404:
             # No releases yet
             return (False, None, None)
-        print(f"HTTP error checking for updates: {e.code}")
+        print(f"HTTP error checking for updates: {e.response.status_code}")
         return (False, None, None)
         
     except Exception as e:
@@ -111,17 +121,7 @@ def get_release_notes(timeout: int = 5) -> Optional[str]:
         Release notes body text, or None if unavailable
     """
     try:
-        request = urllib.request.Request(
-            RELEASES_URL,
-            headers={
-                'User-Agent': f'SC-Signature-Scanner/{CURRENT_VERSION}',
-                'Accept': 'application/vnd.github.v3+json'
-            }
-        )
-        
-        with urllib.request.urlopen(request, timeout=timeout) as response:
-            data = json.loads(response.read().decode('utf-8'))
-        
+        data = _fetch_latest_release(timeout)
         return data.get('body', '')
         
     except Exception:
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Recorded-video analysis for SC Signature Scanner.
+
+Streams a recorded mining session through OpenCV and lists every
+signature that appeared in the scan region, with timestamps:
+
+1. Frames are sampled at a fixed rate. Frames in between are only
+   grabbed, not decoded.
+2. The scan region is cropped from each sample and hashed (difference
+   hash). A crop that looks like the previous sample, or exactly like an
+   earlier one, reuses that result instead of running OCR again.
+3. The remaining crops are recognized on a worker pool.
+4. Per-sample readings are merged into a timeline of sightings: a
+   signature seen in consecutive samples (short OCR dropouts included)
+   is one sighting with a start and end time.
+
+Usage:
+    python video_analysis.py session.mp4 [--fps 2] [--workers 2] [--json out.json]
+"""
+
+import json
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+import cv2
+import numpy as np
+from PIL import Image
+
+import region_selector
+from results import ScanResult
+
+
+DEFAULT_SAMPLE_FPS = 2.0
+DEFAULT_WORKERS = 2
+HASH_SIZE = 16  # Difference hash of HASH_SIZE x HASH_SIZE bits
+HASH_TOLERANCE = 6  # Differing bits that still count as the same crop
+MERGE_GAP = 2.0  # Seconds of missing readings bridged within one sighting
+MAX_IN_FLIGHT_PER_WORKER = 4  # Bounds memory held by queued crops
+
+
+@dataclass(slots=True)
+class Sighting:
+    """One signature on screen over a stretch of the video."""
+
+    signature: int
+    start: float  # Seconds into the video
+    end: float
+    samples: int  # Sampled frames that read this signature
+    name: Optional[str] = None  # Best match
+    est_value: Optional[int] = None
+
+
+@dataclass(slots=True)
+class VideoReport:
+    """Outcome of analyzing one video."""
+
+    video: str
+    duration: float  # Seconds of video analyzed
+    elapsed: float  # Wall-clock seconds
+    sampled: int  # Frames sampled
+    recognized: int  # Crops sent to OCR (the rest were deduplicated)
+    sightings: List[Sighting]
+    failed: int = 0  # OCR jobs that raised (counted as no reading)
+
+    @property
+    def speed(self) -> float:
+        """Video seconds per wall-clock second."""
+        return self.duration / self.elapsed if self.elapsed else 0.0
+
+    def unique_signatures(self) -> List[int]:
+        return sorted({s.signature for s in self.sightings})
+
+    def as_dict(self) -> Dict:
+        data = asdict(self)
+        data['speed'] = round(self.speed, 1)
+        return data
+
+
+def crop_hash(crop: np.ndarray) -> int:
+    """Difference hash of a BGR/gray crop (adjacent-pixel brightness steps)."""
+    gray = crop if crop.ndim == 2 else cv2.cvtColor(crop, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (HASH_SIZE + 1, HASH_SIZE), interpolation=cv2.INTER_AREA)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int.from_bytes(np.packbits(bits).tobytes(), 'big')
+
+
+def _hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def _job_result(job: Future) -> ScanResult:
+    """A finished OCR job's result, with an exception turned into an error result."""
+    try:
+        return job.result()
+    except Exception as e:
+        return ScanResult(error=f'OCR ERROR: {e}')
+
+
+def analyze_video(video_path: Path, scanner, sample_fps: float = DEFAULT_SAMPLE_FPS,
+                  workers: int = DEFAULT_WORKERS,
+                  on_progress: Optional[Callable[[float], None]] = None,
+                  should_stop: Optional[Callable[[], bool]] = None) -> VideoReport:
+    """Find every signature shown in a recorded video.
+
+    Args:
+        video_path: Video file (anything OpenCV can read)
+        scanner: SignatureScanner
+        sample_fps: Frames analyzed per second of video
+        workers: OCR worker threads
+        on_progress: Called with the fraction of the video read (0-1)
+        should_stop: Polled between frames; True stops early (the report
+            covers what was read so far)
+
+    Raises:
+        ValueError: If sample_fps is not positive, the video cannot be
+            opened or no scan region fits its frame size
+    """
+    if not sample_fps > 0:
+        raise ValueError(f"Sample rate must be positive, got {sample_fps}")
+    capture = cv2.VideoCapture(str(video_path))
+    if not capture.isOpened():
+        raise ValueError(f"Cannot open video: {video_path}")
+
+    started = time.perf_counter()
+    try:
+        video_fps = capture.get(cv2.CAP_PROP_FPS) or 30.0
+        total_frames = int(capture.get(cv2.CAP_PROP_FRAME_COUNT)) or 0
+        width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        region = region_selector.region_for_image(width, height)
+        if not region:
+            raise ValueError(f"No scan region configured for {width}x{height} video")
+        x1, y1, x2, y2 = region
+        step = max(1, round(video_fps / sample_fps))
+
+        # Each sample points at the OCR job whose result it shares
+        samples: List[Tuple[float, int]] = []
+        jobs: List[Future] = []
+        job_by_hash: Dict[int, int] = {}
+        last_hash: Optional[int] = None
+        max_in_flight = max(1, workers) * MAX_IN_FLIGHT_PER_WORKER
+
+        with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="VideoOCR") as pool:
+            frame_index = 0
+            while True:
+                if should_stop and should_stop():
+                    break
+                # Only sampled frames are decoded
+                if frame_index % step:
+                    if not capture.grab():
+                        break
+                    frame_index += 1
+                    continue
+                ok, frame = capture.read()
+                if not ok:
+                    break
+                timestamp = frame_index / video_fps
+                frame_index += 1
+
+                crop = frame[y1:y2, x1:x2]
+                digest = crop_hash(crop)
+                if last_hash is not None and _hamming(digest, last_hash) <= HASH_TOLERANCE:
+                    job = samples[-1][1]  # Unchanged since the previous sample
+                elif digest in job_by_hash:
+                    job = job_by_hash[digest]  # Seen this exact crop before
+                else:
+                    # Back-pressure: wait for older crops before queueing more
+                    if len(jobs) >= max_in_flight:
+                        jobs[-max_in_flight].exception()  # Waits; failures are kept for later
+                    image = Image.fromarray(cv2.cvtColor(crop, cv2.COLOR_BGR2RGB))
+                    jobs.append(pool.submit(scanner.scan_buffer, image, True))
+                    job = len(jobs) - 1
+                    job_by_hash[digest] = job
+                samples.append((timestamp, job))
+                last_hash = digest
+
+                if on_progress and total_frames and len(samples) % 20 == 0:
+                    on_progress(min(1.0, frame_index / total_frames))
+
+        results = [_job_result(future) for future in jobs]
+    finally:
+        capture.release()
+
+    duration = samples[-1][0] + 1.0 / sample_fps if samples else 0.0
+    return VideoReport(
+        video=str(video_path),
+        duration=round(duration, 2),
+        elapsed=round(time.perf_counter() - started, 2),
+        sampled=len(samples),
+        recognized=len(results),
+        sightings=build_timeline([(t, results[job]) for t, job in samples], 1.0 / sample_fps),
+        failed=sum(1 for future in jobs if future.exception() is not None)
+    )
+
+
+def build_timeline(readings: List[Tuple[float, ScanResult]], interval: float,
+                   merge_gap: float = MERGE_GAP) -> List[Sighting]:
+    """Merge per-sample readings into sightings.
+
+    Args:
+        readings: (timestamp, result) per sample, in time order
+        interval: Seconds between samples (a sighting lasts until the
+            next sample after its last reading)
+        merge_gap: Readings of the same signature at most this far apart
+            belong to one sighting
+    """
+    sightings: List[Sighting] = []
+    open_by_sig: Dict[int, Sighting] = {}
+    for timestamp, result in readings:
+        signature = result.signature
+        if signature is None:
+            continue
+        sighting = open_by_sig.get(signature)
+        if sighting and timestamp - sighting.end <= merge_gap:
+            sighting.end = timestamp + interval
+            sighting.samples += 1
+            continue
+        best = result.matches[0] if result.matches else None
+        sighting = Sighting(
+            signature=signature,
+            start=round(timestamp, 2),
+            end=timestamp + interval,
+            samples=1,
+            name=best.name if best else None,
+            est_value=best.est_value if best else None
+        )
+        open_by_sig[signature] = sighting
+        sightings.append(sighting)
+
+    for sighting in sightings:
+        sighting.end = round(sighting.end, 2)
+    return sightings
+
+
+def format_timestamp(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes}:{seconds:02d}"
+
+
+def format_report(report: VideoReport) -> List[str]:
+    """Human-readable timeline, one line per sighting."""
+    lines = [
+        f"{Path(report.video).name}: {format_timestamp(report.duration)} analyzed in "
+        f"{report.elapsed:.1f}s ({report.speed:.1f}x real time), "
+        f"{report.sampled} samples, {report.recognized} OCR'd"
+        + (f", {report.failed} failed" if report.failed else ""),
+        f"{len(report.sightings)} sightings, {len(report.unique_signatures())} unique signatures",
+    ]
+    for s in report.sightings:
+        value = f"  ~{s.est_value:,} aUEC" if s.est_value else ""
+        lines.append(
+            f"  {format_timestamp(s.start)}-{format_timestamp(s.end)}  {s.signature:>7,}  "
+            f"{s.name or 'no match'}{value}"
+        )
+    return lines
+
+
+def _positive_float(text: str) -> float:
+    import argparse
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {text}")
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be positive: {text}")
+    return value
+
+
+def main():
+    import argparse
+
+    import paths
+    from scanner import SignatureScanner
+
+    parser = argparse.ArgumentParser(description="List every signature in a recorded video")
+    parser.add_argument('video', type=Path, help="Video file")
+    parser.add_argument('--fps', type=_positive_float, default=DEFAULT_SAMPLE_FPS,
+                        help="Samples per second of video")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="OCR worker threads")
+    parser.add_argument('--json', type=Path, help="Also write the report as JSON")
+    args = parser.parse_args()
+
+    scanner = SignatureScanner(paths.get_data_path() / 'combat_analyst_db.json')
+    available, error = scanner.is_ocr_available()
+    if not available:
+        raise SystemExit(f"OCR not available: {error}")
+
+    report = analyze_video(args.video, scanner, args.fps, args.workers)
+    print("\n".join(format_report(report)))
+    if args.json:
+        args.json.write_text(json.dumps(report.as_dict(), indent=2), encoding='utf-8')
+
+
+if __name__ == "__main__":
+    main()